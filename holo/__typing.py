@@ -12,7 +12,8 @@ from typing import (
     DefaultDict, Iterator, Type, Container,
     TYPE_CHECKING, AbstractSet, MutableMapping,
     Tuple, List, Dict, Set, MutableSequence,
-    OrderedDict, ClassVar, Optional, ForwardRef, )
+    OrderedDict, ClassVar, Optional, ForwardRef,
+    AsyncGenerator, )
 from typing import _GenericAlias # type: ignore
 
 if sys.version_info < (3, 12):
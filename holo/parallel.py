@@ -1,16 +1,26 @@
 from collections.abc import Callable, Iterable
 
+from collections import deque
 from queue import Queue
+import asyncio
+import heapq
+import importlib
+import itertools
 import threading
+import time
+import os
 
+import numpy
 import multiprocess
-import multiprocess.managers
 import multiprocess.process
 import multiprocess.queues
 import multiprocess.synchronize
+import multiprocess.reduction
+from multiprocess.shared_memory import SharedMemory
 
 from .__typing import (
-    Callable, Any, Iterable, Generic, )
+    Callable, Any, Iterable, Generic, Generator, Iterator, Literal, cast,
+    AsyncGenerator, Self, )
 from .prettyFormats import PrettyfyClass, basic__strRepr__, print_exception
 from .protocols import _T, _P, SupportsIterableSized
 from . import Pointer, assertIsinstance
@@ -21,21 +31,54 @@ from . import Pointer, assertIsinstance
 _MP_Process: "type[multiprocess.process.BaseProcess]" = \
     assertIsinstance(type, multiprocess.Process) # type: ignore # yes it exist ?!
 
+CHUNK_TARGET_DURATION: float = 0.05
+"""the duration targeted by the "auto" chunks of ProcessManager.runBatch(...) (in sec)"""
+SHARED_ARRAY_THRESHOLD: int = 1 << 20
+"""the size (in bytes) from which the numpy arrays of the ProcessManager tasks are sent in shared memory"""
+
 class MP_Exception():
     __slots__ = ("err", )
     def __init__(self, err: Exception) -> None:
         self.err = err
 
+class TaskCancelledError(Exception):
+    """the task was cancelled (see TaskHandle.cancel(...))"""
+
+class TaskDeadlineError(TimeoutError):
+    """the deadline of the task passed before it finished"""
+
 ### Tasks ### 
 
 class Task(Generic[_T], PrettyfyClass):
-    __slots__ = ("func", "funcArgs", "funcKwargs", )
+    __slots__ = ("func", "funcArgs", "funcKwargs", "priority", "deadline", )
     
     def __init__(self, func:"Callable[_P, _T]", 
                  *funcArgs:_P.args, **funcKwargs:_P.kwargs) -> None:
         self.func = func
         self.funcArgs = funcArgs
         self.funcKwargs = funcKwargs
+        self.priority: int = 0
+        """the scheduled tasks with a higher priority are started first \
+        (ignored by the tasks added from a worker of a Manager, see Manager.addTaskNoReturn(...))"""
+        self.deadline: "float|None" = None
+        """the time.monotonic() after which the task is dropped if it didn't started \
+        (a ProcessManager also terminate it when it is running), None -> no deadline"""
+    
+    def withScheduling(self, priority:int=0, timeout:"float|None"=None)->"Self":
+        """set the priority and the deadline (`timeout` sec from now, None -> no deadline) \
+        of the task, return the task"""
+        self.priority = priority
+        self.deadline = (None if timeout is None else time.monotonic() + timeout)
+        return self
+    
+    def isExpired(self)->bool:
+        return (self.deadline is not None) and (time.monotonic() >= self.deadline)
+    
+    def _schedulingOf(self, task:"Task[Any]")->"Self":
+        """give the priority and the deadline of the `task` to this task (ie. its wrapper), return this task"""
+        self.priority = task.priority
+        self.deadline = task.deadline
+        return self
     
     def _toTuple(self)->"tuple[Callable[..., _T], Iterable[Any], dict[str, Any]]":
         """internal function that remove the _P typing constraints"""
@@ -49,8 +92,181 @@ class Task_MP(Task[_T]):
     
     def __init__(self, taskID:int, func:"Callable[_P, _T]", 
                  *funcArgs:_P.args, **funcKwargs:_P.kwargs) -> None:
-        super().__init__(func=func, *funcArgs, **funcKwargs)
+        super().__init__(func, *funcArgs, **funcKwargs)
+        self.taskID: int = taskID
+
+
+class TaskHandle(Generic[_T]):
+    """the handle of a task added to a manager (see .addTaskWithHandle(...))"""
+    __slots__ = ("taskID", "__cancelFunc", )
+    
+    def __init__(self, taskID:int, cancelFunc:"Callable[[bool], bool]")->None:
         self.taskID: int = taskID
+        self.__cancelFunc: "Callable[[bool], bool]" = cancelFunc
+    
+    def cancel(self, terminate:bool=False)->bool:
+        """cancel the task if it didn't started, return whether it is cancelled\n
+        `terminate`: with a ProcessManager, also cancel it when it was sent to the workers \
+        (its worker is terminated and replaced if it is running)\n
+        the result of a cancelled task is a TaskCancelledError \
+        (with a Manager: given to the wrapper that collect the result, if any)"""
+        return self.__cancelFunc(terminate)
+
+
+def _runChunk(calls:"list[tuple[Callable[..., _T], Iterable[Any], dict[str, Any]]]",
+              )->"tuple[list[_T|MP_Exception], float]":
+    """execute the `calls` of a chunk (in a worker) and return (their results, duration)\n
+    the exception of a call is put in a MP_Exception (the other calls are still executed)"""
+    startTime: float = time.perf_counter()
+    results: "list[_T|MP_Exception]" = []
+    for (func, funcArgs, funcKwargs) in calls:
+        try: results.append(func(*funcArgs, **funcKwargs))
+        except Exception as err:
+            results.append(MP_Exception(err))
+    return (results, time.perf_counter() - startTime)
+
+
+class _ChunkSizer():
+    """choose the size of the next chunk of tasks from the measured duration per task"""
+    __slots__ = ("nbWorkers", "nbRemaining", "chunkSize", "taskDuration", "chunksSizes", )
+    
+    def __init__(self, nbWorkers:int, nbTasks:int, chunkSize:"int|Literal['auto']")->None:
+        self.nbWorkers: int = nbWorkers
+        self.nbRemaining: int = nbTasks
+        """the number of tasks that aren't in a chunk yet"""
+        self.chunkSize: "int|Literal['auto']" = chunkSize
+        self.taskDuration: "float|None" = None
+        """the (moving) average duration of a task, None -> nothing measured yet"""
+        self.chunksSizes: "deque[int]" = deque()
+        """the number of tasks of each chunk given by .chunks(...) (popleft them in order)"""
+    
+    def nextSize(self)->int:
+        if self.chunkSize != "auto":
+            return self.chunkSize
+        if self.taskDuration is None:
+            return 1 # => probe the duration of the tasks
+        size: int = int(CHUNK_TARGET_DURATION / max(self.taskDuration, 1e-9))
+        # => keep enough chunks to balance the end of the batch between the workers
+        return max(1, min(size, self.nbRemaining // (2 * self.nbWorkers)))
+    
+    def update(self, nbTasks:int, duration:float)->None:
+        taskDuration: float = duration / max(nbTasks, 1)
+        if self.taskDuration is None:
+            self.taskDuration = taskDuration
+        else: self.taskDuration = 0.7 * self.taskDuration + 0.3 * taskDuration
+    
+    def chunks(self, tasks:"Iterable[Task[_T]]")->"Generator[Task[tuple[list[_T|MP_Exception], float]], None, None]":
+        """the chunks of the `tasks`, their size is choosen when they are needed\n
+        a chunk takes the highest priority of its tasks, \
+        the tasks with a deadline are sent alone (their deadline only drop them)"""
+        tasksIterator: "Iterator[Task[_T]]" = iter(tasks)
+        nextTask: "Task[_T]|None" = next(tasksIterator, None)
+        while nextTask is not None:
+            chunkTasks: "list[Task[_T]]" = [nextTask]
+            nextTask = next(tasksIterator, None)
+            if chunkTasks[0].deadline is None:
+                size: int = self.nextSize()
+                while (nextTask is not None) and (nextTask.deadline is None) and (len(chunkTasks) < size):
+                    chunkTasks.append(nextTask)
+                    nextTask = next(tasksIterator, None)
+            self.nbRemaining -= len(chunkTasks)
+            self.chunksSizes.append(len(chunkTasks))
+            chunk: "Task[tuple[list[_T|MP_Exception], float]]" = \
+                Task(_runChunk, [task._toTuple() for task in chunkTasks])
+            chunk.priority = max(task.priority for task in chunkTasks)
+            chunk.deadline = chunkTasks[0].deadline
+            yield chunk
+
+
+def _streamResults(
+        tasks:"Iterable[Task[_T]]", submit:"Callable[[int, Task[_T]], None]",
+        getFinished:"Callable[[], tuple[int, _T|MP_Exception]]",
+        maxPending:int, ordered:bool, raiseErrors:bool=True)->"Generator[_T, None, None]":
+    """yield the results of the `tasks` (consumed lazily) as they finish\n
+    `submit(index, task)` start a task, `getFinished()` wait for a finished task: (index, result)\n
+    at most `maxPending` tasks are submitted and not yet yielded\n
+    `ordered`: True -> in the order of the tasks, False -> in the order they finish\n
+    the exception of a failed task is raised when its result is reached \
+    (`raiseErrors` -> False: its MP_Exception is yielded instead)"""
+    if maxPending < 1:
+        raise ValueError(f"maxPending must be at least 1, got: {maxPending}")
+    tasksIterator:"Iterator[Task[_T]]" = iter(tasks)
+    exhausted:bool = False
+    nbSubmitted:int = 0
+    nbYielded:int = 0
+    finished:"dict[int, _T|MP_Exception]" = {}
+    """the finished results that wait for their turn (ordered only)"""
+    while True:
+        # fill the window
+        while (exhausted is False) and ((nbSubmitted - nbYielded) < maxPending):
+            try: task = next(tasksIterator)
+            except StopIteration:
+                exhausted = True
+                break
+            submit(nbSubmitted, task)
+            nbSubmitted += 1
+        if nbYielded == nbSubmitted:
+            return None # => all the tasks are done
+        # wait the next result
+        result:"_T|MP_Exception"
+        if ordered is True:
+            while nbYielded not in finished:
+                (index, result) = getFinished()
+                finished[index] = result
+            result = finished.pop(nbYielded)
+        else: (_, result) = getFinished()
+        nbYielded += 1
+        if isinstance(result, MP_Exception) and (raiseErrors is True):
+            raise result.err
+        yield cast("_T", result)
+
+
+
+def _resolveFuture(future:"asyncio.Future[_T]", result:"_T|MP_Exception")->None:
+    """give the result to the `future` (called in its loop)"""
+    if future.done():
+        return None # => it was cancelled
+    if isinstance(result, MP_Exception):
+        future.set_exception(result.err)
+    else: future.set_result(result)
+
+def _resolveFutureThreadsafe(loop:"asyncio.AbstractEventLoop", future:"asyncio.Future[_T]",
+                             result:"_T|MP_Exception")->None:
+    """give the result to the `future` from an other thread"""
+    try: loop.call_soon_threadsafe(_resolveFuture, future, result)
+    except RuntimeError:
+        pass # => the loop is closed, nobody can await the result
+
+async def _asCompleted(tasks:"Iterable[Task[_T]]", submit:"Callable[[Task[_T]], asyncio.Future[_T]]",
+                       maxPending:int)->"AsyncGenerator[_T, None]":
+    """yield the results of the `tasks` (consumed lazily) as they finish\n
+    `submit(task)` start a task and return its future\n
+    at most `maxPending` tasks are submitted and not yet yielded\n
+    the exception of a failed task is raised when its result is reached"""
+    if maxPending < 1:
+        raise ValueError(f"maxPending must be at least 1, got: {maxPending}")
+    tasksIterator:"Iterator[Task[_T]]" = iter(tasks)
+    exhausted:bool = False
+    pending:"set[asyncio.Future[_T]]" = set()
+    try:
+        while True:
+            # fill the window
+            while (exhausted is False) and (len(pending) < maxPending):
+                try: task = next(tasksIterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(submit(task))
+            if len(pending) == 0:
+                return # => all the tasks are done
+            # wait the next results
+            (finished, pending) = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+    finally:
+        # => the results of the tasks still running will be dropped
+        for future in pending:
+            future.cancel()
 
 
 
@@ -58,28 +274,122 @@ class Task_MP(Task[_T]):
 
 
 class _Worker(threading.Thread):
-    def __init__(self, manager:"Manager")->None:
+    def __init__(self, manager:"Manager", index:int)->None:
         super().__init__(daemon=True)
         self.manager = manager
+        self.index: int = index
+        self.localTasks: "deque[_QueuedTask]" = deque()
+        """the tasks added by this worker: poped at the end (LIFO), stolen at the start (FIFO)"""
+        self.nbSubmitted: int = 0
+        """the number of tasks added by this worker (only modified by this worker)"""
+        self.nbDone: int = 0
+        """the number of tasks finished by this worker (only modified by this worker)"""
         
     def run(self)->None:
         while True:
             # handle pausing the workers
             self.manager.waitUntilRunning()
             # get some work (wait until some is available)
-            task = self.manager._tasksList.get()
+            queuedTask: "_QueuedTask|None" = self.manager._nextTask(self)
+            if queuedTask is None:
+                self.manager._waitForWork()
+                continue
             #=> got some work => do it
-            try: task.func(*task.funcArgs, **task.funcKwargs)
-            except Exception as err:
-                print_exception(err)
-            finally: self.manager._tasksList.task_done()
+            self.runTask(queuedTask)
+    
+    def runTask(self, queuedTask:"_QueuedTask")->None:
+        """execute the task (unless it was cancelled or it expired: it is dropped)"""
+        try:
+            task: "TaskNoReturn" = queuedTask.task
+            if queuedTask.claim() is False:
+                pass # => cancelled, alredy dropped
+            elif task.isExpired() is True:
+                queuedTask.drop(TaskDeadlineError(
+                    f"the deadline of the task {queuedTask.order} passed before it started"))
+            else: task.func(*task.funcArgs, **task.funcKwargs)
+        except Exception as err:
+            print_exception(err)
+        finally: self.nbDone += 1
+
+
+class _QueuedTask():
+    """a task scheduled in a Manager, it is either started or dropped (only once)"""
+    __slots__ = ("task", "order", "onDropped", "__claimLock", )
+    
+    def __init__(self, task:"TaskNoReturn", order:int, onDropped:"Callable[[Exception], None]|None")->None:
+        self.task: "TaskNoReturn" = task
+        self.order: int = order
+        self.onDropped: "Callable[[Exception], None]|None" = onDropped
+        """called with the error when the task is cancelled or expired (ie. to give it to a wrapper)"""
+        self.__claimLock: threading.Lock = threading.Lock()
+    
+    def __lt__(self, other:"_QueuedTask")->bool:
+        # => higher priority first, then in the order they were added
+        return (-self.task.priority, self.order) < (-other.task.priority, other.order)
+    
+    def claim(self)->bool:
+        """return True for the first call only"""
+        return self.__claimLock.acquire(blocking=False)
+    
+    def drop(self, error:Exception)->None:
+        """the task will not be executed (call it after claiming it)"""
+        if self.onDropped is not None:
+            self.onDropped(error)
+
+
+class SpawnedTask(Generic[_T]):
+    """the handle of a task added with Manager.spawn(...), give access to its result"""
+    __slots__ = ("task", "__doneEvent", "__result", )
+    
+    def __init__(self, task:"Task[_T]")->None:
+        self.task: "Task[_T]" = task
+        self.__doneEvent: threading.Event = threading.Event()
+        self.__result: "_T|MP_Exception"
+    
+    def _run(self)->None:
+        (func, funcArgs, funcKwargs) = self.task._toTuple()
+        try: self.__result = func(*funcArgs, **funcKwargs)
+        except Exception as err:
+            self.__result = MP_Exception(err)
+        finally: self.__doneEvent.set()
+    
+    def done(self)->bool:
+        """whether the task is finished"""
+        return self.__doneEvent.is_set()
+    
+    def _waitForIt(self, timeout:"float|None")->bool:
+        return self.__doneEvent.wait(timeout)
+    
+    def _getResult(self)->"_T":
+        if isinstance(self.__result, MP_Exception):
+            raise self.__result.err
+        return self.__result
 
 
 class Manager():
+    """a pool of threads with work-stealing: each worker has its own deque of tasks, \
+    it pops the tasks it added (LIFO) and steal the oldest tasks of the others (FIFO) when it has none\n
+    the tasks added from outside of the workers go in a shared priority queue \
+    (by Task.priority, then FIFO), the deques of the workers ignore the priorities\n
+    a task can add sub tasks with .spawn(...) and wait their result without blocking its worker"""
+    
     def __init__(self, nbWorkers:int, startPaused:bool=False)->None:
-        self._tasksList:"Queue[TaskNoReturn]" = Queue()
-        self.__workers:"list[_Worker]" = [_Worker(self) for _ in range(nbWorkers)]
+        self._injectedTasks:"list[_QueuedTask]" = []
+        """the heap of the tasks added from outside of the workers (modified with the idle lock)"""
+        self.__orders: "Iterator[int]" = itertools.count()
+        self.__workers:"list[_Worker]" = [_Worker(self, index) for index in range(nbWorkers)]
         self.__runningEvent: threading.Event = threading.Event()
+        self.__idleLock: threading.Lock = threading.Lock()
+        self.__workAvailable: threading.Condition = threading.Condition(self.__idleLock)
+        self.__idleChanged: threading.Condition = threading.Condition(self.__idleLock)
+        self.__nbIdle: int = 0
+        """the number of workers waiting for some work (modified with the idle lock)"""
+        self.__nbInjected: int = 0
+        """the number of tasks added from outside of the workers (modified with the idle lock)"""
+        self.__resultChanged: threading.Condition = threading.Condition(self.__idleLock)
+        """notified when a spawned task finish, some work is added or the manager is un paused"""
+        self.__nbWaitingResult: int = 0
+        """the number of workers waiting in .result(...) (modified with the idle lock)"""
         self.setPaused(startPaused)
         # start the workers
         for worker in self.__workers:
@@ -87,11 +397,114 @@ class Manager():
 
     def addWork(self, func:"Callable[_P, None]", *funcArgs:_P.args, **funcKwargs:_P.kwargs)->None:
         """add the work to the stack, will start when a worker will be available\n
-        if you need to return a value, consider callbacks, or use a Pointer"""
-        self._tasksList.put(TaskNoReturn(func, *funcArgs, **funcKwargs))
+        if you need to return a value, consider callbacks, or use a Pointer (or .spawn(...))"""
+        self.addTaskNoReturn(TaskNoReturn(func, *funcArgs, **funcKwargs))
     def addTaskNoReturn(self, task:TaskNoReturn)->None:
-        """add the task to the stack, will start when a worker will be available"""
-        self._tasksList.put(task)
+        """add the task to the stack, will start when a worker will be available\n
+        (from a worker of the manager: on its own deque, otherwise: in the shared priority queue)\n
+        /!\\ the priority of the tasks added from a worker is ignored: \
+        its deque is LIFO (to finish the sub tasks first)\n
+        the task is dropped if its deadline passed before it started"""
+        self.__queueTask(task, onDropped=None)
+    def addTaskWithHandle(self, task:TaskNoReturn)->"TaskHandle[None]":
+        """like .addTaskNoReturn(...) but return the handle of the task (use it to cancel it)"""
+        return self.__queueTask(task, onDropped=None)
+    
+    def __queueTask(self, task:TaskNoReturn, onDropped:"Callable[[Exception], None]|None")->"TaskHandle[None]":
+        """add the task, `onDropped` is called with the error when it is cancelled or expired"""
+        queuedTask = _QueuedTask(task, next(self.__orders), onDropped)
+        worker: "_Worker|None" = self.__currentWorker()
+        if worker is not None:
+            worker.nbSubmitted += 1
+            worker.localTasks.append(queuedTask)
+        else:
+            with self.__idleLock:
+                self.__nbInjected += 1
+                heapq.heappush(self._injectedTasks, queuedTask)
+        # wake a worker (the idle workers re-check the deques after being counted)
+        if self.__nbIdle != 0:
+            with self.__idleLock:
+                self.__workAvailable.notify()
+        self.__notifyResultWaiters()
+        return TaskHandle(queuedTask.order, (lambda terminate: self.__cancel(queuedTask)))
+    
+    def __cancel(self, queuedTask:"_QueuedTask")->bool:
+        if queuedTask.claim() is False:
+            return False # => alredy started or dropped
+        # => it stays in its deque until a worker skip it
+        queuedTask.drop(TaskCancelledError(f"the task {queuedTask.order} was cancelled"))
+        return True
+    
+    def spawn(self, func:"Callable[_P, _T]", *funcArgs:_P.args, **funcKwargs:_P.kwargs)->"SpawnedTask[_T]":
+        """add the work to the stack and return a handle to get its result with .result(handle)\n
+        can be called from inside a task (the sub task goes on the deque of its worker)"""
+        handle: "SpawnedTask[_T]" = SpawnedTask(Task(func, *funcArgs, **funcKwargs))
+        self.addWork(self.__runSpawned, handle)
+        return handle
+    
+    def __runSpawned(self, handle:"SpawnedTask[Any]")->None:
+        handle._run()
+        self.__notifyResultWaiters()
+    
+    def result(self, handle:"SpawnedTask[_T]")->"_T":
+        """wait for the task of the `handle` to finish and return its result (or raise its exception)\n
+        from a worker of the manager: execute the other tasks while waiting (unless it is paused)"""
+        worker: "_Worker|None" = self.__currentWorker()
+        if worker is None:
+            handle._waitForIt(None)
+            return handle._getResult()
+        while handle.done() is False:
+            if self.isPaused is False:
+                queuedTask: "_QueuedTask|None" = self._nextTask(worker)
+                if queuedTask is not None:
+                    worker.runTask(queuedTask)
+                    continue
+            # => it is executed by an other worker (or paused): wait for some change
+            with self.__idleLock:
+                self.__nbWaitingResult += 1
+                # => re-check after being counted (the changes before weren't notified)
+                if (handle.done() is False) and ((self.isPaused is True) or (self.remainingTasks() == 0)):
+                    self.__resultChanged.wait()
+                self.__nbWaitingResult -= 1
+        return handle._getResult()
+    
+    def __notifyResultWaiters(self)->None:
+        if self.__nbWaitingResult != 0:
+            with self.__idleLock:
+                self.__resultChanged.notify_all()
+    
+    def __currentWorker(self)->"_Worker|None":
+        """the worker executing this code if it is a worker of this manager"""
+        thread: threading.Thread = threading.current_thread()
+        if isinstance(thread, _Worker) and (thread.manager is self):
+            return thread
+        return None
+    
+    def _nextTask(self, worker:"_Worker")->"_QueuedTask|None":
+        """return the next task for the `worker` (None when there are no tasks)\n
+        (its own newest task, then the first shared one, then steal the oldest of an other worker)"""
+        try: return worker.localTasks.pop()
+        except IndexError: pass
+        if len(self._injectedTasks) != 0:
+            with self.__idleLock:
+                if len(self._injectedTasks) != 0:
+                    return heapq.heappop(self._injectedTasks)
+        nbWorkers: int = len(self.__workers)
+        for offset in range(1, nbWorkers):
+            try: return self.__workers[(worker.index + offset) % nbWorkers].localTasks.popleft()
+            except IndexError: pass
+        return None
+    
+    def _waitForWork(self)->None:
+        """block the calling worker until some tasks might be available"""
+        with self.__idleLock:
+            self.__nbIdle += 1
+            self.__idleChanged.notify_all()
+            # => re-check after being counted as idle (the tasks added before weren't notified)
+            if (len(self._injectedTasks) == 0) \
+                    and all(len(worker.localTasks) == 0 for worker in self.__workers):
+                self.__workAvailable.wait()
+            self.__nbIdle -= 1
     
     @property
     def isPaused(self)->bool:
@@ -100,6 +513,7 @@ class Manager():
     def unPause(self)->None:
         """un pause the workers, do nothing if they alredy were not paused"""
         self.__runningEvent.set()
+        self.__notifyResultWaiters()
     def pause(self)->None:
         """pause the workers, do nothing if they alredy were paused\n
         (it won't stop any current tasks, but it will not launche new ones)"""
@@ -115,27 +529,79 @@ class Manager():
     
     def remainingTasks(self)->int:
         """return the aproximative number of tasks that are still scheduled"""
-        return self._tasksList.qsize()
+        return len(self._injectedTasks) + sum(len(worker.localTasks) for worker in self.__workers)
+    def __allTasksDone(self)->bool:
+        # => count the finished tasks before the added ones, so equality means \
+        #   there was a moment where every added task was finished
+        nbDone: int = sum(worker.nbDone for worker in self.__workers)
+        return nbDone == (self.__nbInjected + sum(worker.nbSubmitted for worker in self.__workers))
     def join(self)->None:
-        """return when all tasks are finished"""
-        self._tasksList.join()
+        """return when all tasks are finished (dont call it from a task)"""
+        with self.__idleLock:
+            while self.__allTasksDone() is False:
+                self.__idleChanged.wait()
 
     def runBatchWithReturn(self, tasks:"SupportsIterableSized[Task[_T]]")->"list[_T]":
         """execute the `tasks` with the manager (blocking)\n
         return a list of results as [tasks[0] -> res[0], ..., tasks[n] -> res[n]]"""
         # create pointers to grab each results
-        resultPointers:"list[Pointer[_T]]" = []
+        resultPointers:"list[Pointer[_T|MP_Exception]]" = []
         # start working
         self.unPause()
         for task in tasks:
-            resPtr: "Pointer[_T]" = Pointer()
+            resPtr: "Pointer[_T|MP_Exception]" = Pointer()
             resultPointers.append(resPtr)
             (func, funcArgs, funcKwargs) = task._toTuple()
-            self.addWork(taskResultGraber, func, resPtr, *funcArgs, **funcKwargs)
+            self.__queueTask(TaskNoReturn(taskResultGraber, func, resPtr, *funcArgs, **funcKwargs)._schedulingOf(task),
+                             onDropped=_errorToPointer(resPtr))
         # wait until all tasks are done
         self.join()
         # assemble the results and return
-        return [ptr.value for ptr in resultPointers]
+        return _pointersResults(resultPointers)
+    
+    def imapUnordered(self, tasks:"Iterable[Task[_T]]", maxPending:"int|None"=None)->"Generator[_T, None, None]":
+        """execute the `tasks` with the manager and yield their results as they finish\n
+        the `tasks` are consumed lazily: at most `maxPending` (default: 2 per worker) \
+        are submitted and not yet yielded\n
+        the exception of a failed task is raised when its result is reached"""
+        return self.__stream(tasks, maxPending, ordered=False)
+    
+    def imap(self, tasks:"Iterable[Task[_T]]", maxPending:"int|None"=None)->"Generator[_T, None, None]":
+        """same as .imapUnordered(...) but yield the results in the order of the `tasks`\n
+        (the finished results wait for their turn, they count in `maxPending`)"""
+        return self.__stream(tasks, maxPending, ordered=True)
+    
+    def __stream(self, tasks:"Iterable[Task[_T]]", maxPending:"int|None", ordered:bool)->"Generator[_T, None, None]":
+        finishedQueue:"Queue[tuple[int, _T|MP_Exception]]" = Queue()
+        def submit(index:int, task:"Task[_T]")->None:
+            (func, funcArgs, funcKwargs) = task._toTuple()
+            self.__queueTask(TaskNoReturn(taskResultStreamer, func, index, finishedQueue, *funcArgs, **funcKwargs)._schedulingOf(task),
+                             onDropped=(lambda err: finishedQueue.put((index, MP_Exception(err)))))
+        self.unPause()
+        return _streamResults(
+            tasks, submit, finishedQueue.get, ordered=ordered,
+            maxPending=(2 * len(self.__workers) if maxPending is None else maxPending))
+    
+    def submit(self, func:"Callable[_P, _T]", *funcArgs:_P.args, **funcKwargs:_P.kwargs)->"asyncio.Future[_T]":
+        """add the work to the stack and return a future of its result, bound to the running loop\n
+        (to be called from a coroutine: `result = await manager.submit(func, ...)`)\n
+        cancelling the future don't stop the task, its result is dropped"""
+        return self.__submitTask(Task(func, *funcArgs, **funcKwargs))
+    
+    def __submitTask(self, task:"Task[_T]")->"asyncio.Future[_T]":
+        loop: "asyncio.AbstractEventLoop" = asyncio.get_running_loop()
+        future: "asyncio.Future[_T]" = loop.create_future()
+        (func, funcArgs, funcKwargs) = task._toTuple()
+        self.__queueTask(TaskNoReturn(taskResultToFuture, func, loop, future, *funcArgs, **funcKwargs)._schedulingOf(task),
+                         onDropped=(lambda err: _resolveFutureThreadsafe(loop, future, MP_Exception(err))))
+        return future
+    
+    def asCompleted(self, tasks:"Iterable[Task[_T]]", maxPending:"int|None"=None)->"AsyncGenerator[_T, None]":
+        """the async version of .imapUnordered(...): `async for result in manager.asCompleted(tasks): ...`"""
+        self.unPause()
+        return _asCompleted(
+            tasks, self.__submitTask,
+            maxPending=(2 * len(self.__workers) if maxPending is None else maxPending))
 
 
 #def taskResultGraber(func:"Callable[_P, _T|Any]", resPtr:"Pointer[_T|Any]", *funcArgs:_P.args, **funcKwargs:_P.kwargs)->None:
@@ -143,24 +609,48 @@ def taskResultGraber(func:"Callable[_P, _T]", resPtr:"Pointer[_T]", *funcArgs:_P
     """a util function that put the result of `func` in `resPtr`"""
     resPtr.value = func(*funcArgs, **funcKwargs)
 
+def _errorToPointer(resPtr:"Pointer[_T|MP_Exception]")->"Callable[[Exception], None]":
+    """the callback that put the error of a dropped task in `resPtr`"""
+    def onDropped(err:Exception)->None:
+        resPtr.value = MP_Exception(err)
+    return onDropped
+
+def _pointersResults(resultPointers:"list[Pointer[_T|MP_Exception]]")->"list[_T]":
+    """the values of the `resultPointers`, raise the error of the first dropped task"""
+    results:"list[_T]" = []
+    for resPtr in resultPointers:
+        result:"_T|MP_Exception" = resPtr.value
+        if isinstance(result, MP_Exception):
+            raise result.err
+        results.append(result)
+    return results
+
+def taskResultStreamer(func:"Callable[_P, _T]", index:int, finishedQueue:"Queue[tuple[int, _T|MP_Exception]]",
+                       *funcArgs:_P.args, **funcKwargs:_P.kwargs)->None:
+    """a util function that put (`index`, result of `func`) in `finishedQueue` \
+    (the exception is put in a MP_Exception when it failed)"""
+    try: result:"_T|MP_Exception" = func(*funcArgs, **funcKwargs)
+    except Exception as err:
+        result = MP_Exception(err)
+    finishedQueue.put((index, result))
+
+def taskResultToFuture(func:"Callable[_P, _T]", loop:"asyncio.AbstractEventLoop", future:"asyncio.Future[_T]",
+                       *funcArgs:_P.args, **funcKwargs:_P.kwargs)->None:
+    """a util function that give the result of `func` to the `future` of the `loop` \
+    (the exception is given when it failed)"""
+    try: result:"_T|MP_Exception" = func(*funcArgs, **funcKwargs)
+    except Exception as err:
+        result = MP_Exception(err)
+    _resolveFutureThreadsafe(loop, future, result)
+
 def parallelExec(tasks:"SupportsIterableSized[Task[_T]]", nbWorkers:"int|None")->"list[_T]":
     """execute the `tasks` in parallel with `nbWorkers` workers\n
     `nbWorkers`: int -> the numbr of worker to create, None -> create one worker per tasks\n
     return a list of results as [tasks[0] -> res[0], ..., tasks[n] -> res[n]]"""
-    nbTasks:int = len(tasks)
-    # create pointers to grab each results
-    resultPointers:"list[Pointer[_T]]" = [Pointer() for _ in range(nbTasks)]
     # crate the manager
-    if nbWorkers is None: nbWorkers = nbTasks
+    if nbWorkers is None: nbWorkers = len(tasks)
     manager = Manager(nbWorkers=nbWorkers, startPaused=False)
-    # start working
-    for taskIndex, task in enumerate(tasks):
-        (func, funcArgs, funcKwargs) = task._toTuple()
-        manager.addWork(taskResultGraber, func, resultPointers[taskIndex], *funcArgs, **funcKwargs)
-    # wait until all tasks are done
-    manager.join()
-    # assemble the results and return
-    return [resultPointers[taskIndex].value for taskIndex in range(nbTasks)]
+    return manager.runBatchWithReturn(tasks)
     
 
 
@@ -171,24 +661,218 @@ def parallelExec(tasks:"SupportsIterableSized[Task[_T]]", nbWorkers:"int|None")-
 
 
 
+def _processMemory()->"int|None":
+    """the resident memory (RSS) of the current process in bytes, None when it can't be measured"""
+    try:
+        with open("/proc/self/statm", mode="rb") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass # => not on linux
+    try: import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+class _SharedMemory(SharedMemory):
+    """a shared memory block that can be deleted while some arrays still use it"""
+    def __del__(self)->None:
+        try: self.close()
+        except BufferError:
+            pass # => its memory is unmapped when the arrays are deleted
+        except OSError:
+            pass
+
+
+class _SharedArray():
+    """a numpy array placed in a shared memory block (it is sent instead of the array)"""
+    __slots__ = ("blockName", "shape", "dtype", "order", )
+    
+    def __init__(self, blockName:str, shape:"tuple[int, ...]", dtype:"numpy.dtype", order:"Literal['C', 'F']")->None:
+        self.blockName: str = blockName
+        self.shape: "tuple[int, ...]" = shape
+        self.dtype: "numpy.dtype" = dtype
+        self.order: "Literal['C', 'F']" = order
+    
+    @staticmethod
+    def isShareable(value:Any, threshold:int)->bool:
+        return (type(value) is numpy.ndarray) and (value.nbytes >= max(threshold, 1)) \
+            and (value.dtype.hasobject is False)
+    
+    @staticmethod
+    def share(array:"numpy.ndarray")->"tuple[_SharedArray, SharedMemory]":
+        """copy the `array` in a new block and return (its description, the block)"""
+        order: "Literal['C', 'F']" = \
+            ("F" if (array.flags.f_contiguous and not array.flags.c_contiguous) else "C")
+        sharedArray = _SharedArray("", array.shape, array.dtype, order)
+        block = _SharedMemory(create=True, size=array.nbytes)
+        sharedArray.blockName = block.name
+        view = sharedArray.view(block)
+        view[...] = array
+        del view # => the block can be closed
+        return (sharedArray, block)
+    
+    def view(self, block:"SharedMemory")->"numpy.ndarray":
+        # NOTE: frombuffer keeps the buffer of the block exported while the array (or its views) \
+        #   exist, so closing the block raise a BufferError instead of unmapping its memory
+        return numpy.frombuffer(block.buf, dtype=self.dtype, count=int(numpy.prod(self.shape))
+                                ).reshape(self.shape, order=self.order)
+    
+    def attach(self, readOnly:bool)->"tuple[numpy.ndarray, SharedMemory]":
+        """return (a view of the array (no copy), the block it uses)\n
+        `readOnly` is whether the view can't be modified (the block is shared by other tasks)"""
+        block = _SharedMemory(name=self.blockName)
+        array: "numpy.ndarray" = self.view(block)
+        if readOnly is True:
+            array.flags.writeable = False
+        return (array, block)
+
+
+def _replaceValues(value:Any, isTarget:"Callable[[Any], bool]", replace:"Callable[[Any], Any]")->Any:
+    """replace the targets in `value` (also in its tuples, lists and dicts)"""
+    if isTarget(value):
+        return replace(value)
+    valueType = type(value)
+    if (valueType is tuple) or (valueType is list):
+        return valueType(_replaceValues(subValue, isTarget, replace) for subValue in value)
+    if valueType is dict:
+        return {key: _replaceValues(subValue, isTarget, replace) for (key, subValue) in value.items()}
+    return value
+
+def _attachArrays(value:Any, blocks:"list[SharedMemory]", readOnly:bool)->Any:
+    """replace the _SharedArray in `value` by their arrays, the attached blocks are added to `blocks`\n
+    `readOnly` is whether the arrays can't be modified"""
+    def attach(sharedArray:"_SharedArray")->"numpy.ndarray":
+        (array, block) = sharedArray.attach(readOnly)
+        blocks.append(block)
+        return array
+    return _replaceValues(value, lambda subValue: isinstance(subValue, _SharedArray), attach)
+
+def _closeBlocks(blocks:"list[SharedMemory]")->"list[SharedMemory]":
+    """close the blocks and return the ones that are still used by some arrays"""
+    stillUsed: "list[SharedMemory]" = []
+    for block in blocks:
+        try: block.close()
+        except BufferError:
+            stillUsed.append(block)
+    return stillUsed
+
+
+class _SharedBlock():
+    """a block holding an array given to some pending tasks"""
+    __slots__ = ("array", "sharedArray", "block", "nbTasks", )
+    
+    def __init__(self, array:"numpy.ndarray")->None:
+        self.array: "numpy.ndarray" = array
+        """keep the array alive (its id is the key of the block)"""
+        (self.sharedArray, self.block) = _SharedArray.share(array)
+        self.nbTasks: int = 0
+
+
+def preloadModules(*moduleNames:str)->None:
+    """import the modules, to use as the initializer of the workers\n
+    ex: ProcessManager(4, initializer=preloadModules, initArgs=("numpy", "numba"))"""
+    for moduleName in moduleNames:
+        importlib.import_module(moduleName)
+
+
 class ProcessWorker(_MP_Process, Generic[_T]):
-    def __init__(self, manager:"ProcessManager[_T]")->None:
+    def __init__(self, manager:"ProcessManager[_T]", index:int)->None:
         super().__init__(daemon=True)
         self.manager = manager
+        self.index: int = index
         
     def run(self)->None:
+        manager = self.manager
+        if manager._initializer is not None:
+            try: manager._initializer(*manager._initArgs)
+            except Exception as err:
+                print_exception(err)
+        nbTasksDone: int = 0
+        openBlocks: "list[SharedMemory]" = []
+        """the blocks of the arguments that are still used (by the objects kept by some tasks)"""
         while True:
             # handle pausing the workers
-            self.manager.waitUntilRunning()
+            manager.waitUntilRunning()
             # try to get some work
-            task: "Task_MP[_T]" = self.manager._tasksQueue.get()
+            task: "Task_MP[_T]|None" = manager._tasksQueue.get()
+            if task is None:
+                manager._tasksQueue.task_done()
+                return None # => the manager is closed
+            # => it might have been paused while waiting for the task
+            manager.waitUntilRunning()
             #=> got some work => do it
+            blocks: "list[SharedMemory]" = []
             try: 
-                result = task.func(*task.funcArgs, **task.funcKwargs)
-                self.manager._results[task.taskID] = result
-            except Exception as err:
-                self.manager._results[task.taskID] = MP_Exception(err)
-            finally: self.manager._tasksQueue.task_done()
+                if task.isExpired() is True:
+                    self.__putResult(task.taskID, MP_Exception(TaskDeadlineError(
+                        f"the deadline of the task {task.taskID} passed before it started")))
+                else: self.__runTask(task, blocks)
+            finally: manager._tasksQueue.task_done()
+            openBlocks = _closeBlocks(openBlocks + blocks)
+            nbTasksDone += 1
+            if self.__mustRetire(nbTasksDone) is True:
+                # => the manager will replace this worker by a new one
+                manager._resultsQueue.put(
+                    bytes(multiprocess.reduction.ForkingPickler.dumps((None, self.index))))
+                return None
+    
+    def __runTask(self, task:"Task_MP[_T]", blocks:"list[SharedMemory]")->None:
+        """execute the task and send its result\n
+        the blocks of its shared arrays are attached in `blocks` (close them after)\n
+        while it is executed, the task is in manager._runningTasks (it can be terminated)"""
+        runningLock: "multiprocess.synchronize.Lock" = self.manager._runningLocks[self.index]
+        with runningLock:
+            self.manager._runningTasks[self.index] = task.taskID
+        try: 
+            (funcArgs, funcKwargs) = _attachArrays((task.funcArgs, task.funcKwargs), blocks, readOnly=True)
+            result: "_T|MP_Exception" = task.func(*funcArgs, **funcKwargs)
+        except Exception as err:
+            result = MP_Exception(err)
+        with runningLock:
+            # => it can't be terminated anymore (it must not be while it send its result)
+            self.manager._runningTasks[self.index] = -1
+        try: self.__putResult(task.taskID, result)
+        except Exception as err:
+            self.__putResult(task.taskID, MP_Exception(err))
+    
+    def __mustRetire(self, nbTasksDone:int)->bool:
+        """whether the worker reached the limits of the manager"""
+        if (self.manager._maxTasksPerWorker is not None) \
+                and (nbTasksDone >= self.manager._maxTasksPerWorker):
+            return True
+        if self.manager._maxWorkerMemory is not None:
+            memory: "int|None" = _processMemory()
+            if (memory is not None) and (memory >= self.manager._maxWorkerMemory):
+                return True
+        return False
+    
+    def __putResult(self, taskID:int, result:"_T|MP_Exception")->None:
+        """send the result of a task, it is pickled here \
+        (a pickling error would be lost in the thread of the queue otherwise)\n
+        its large arrays are sent in shared memory (the main process will unlink the blocks)"""
+        threshold: "int|None" = self.manager._sharedArrayThreshold
+        blocks: "list[SharedMemory]" = []
+        if (threshold is not None) and (os.name != "nt"):
+            # NOTE: on windows a block is destroyed when its last handle is closed, \
+            #   so the worker can't close its handle before the main process opened it
+            def share(array:"numpy.ndarray")->"_SharedArray":
+                (sharedArray, block) = _SharedArray.share(array)
+                blocks.append(block)
+                return sharedArray
+            try: result = _replaceValues(
+                result, lambda value: _SharedArray.isShareable(value, threshold), share)
+            except:
+                for block in blocks:
+                    block.close(); block.unlink()
+                raise
+        try: self.manager._resultsQueue.put(
+            bytes(multiprocess.reduction.ForkingPickler.dumps((taskID, result))))
+        except:
+            for block in blocks:
+                block.close(); block.unlink()
+            raise
+        for block in blocks:
+            block.close()
 
 
 class ProcessManager(Generic[_T]):
@@ -198,15 +882,50 @@ class ProcessManager(Generic[_T]):
             multiprocess.context.BaseContext().get_context("spawn"))
     # sligth trick but it gets the spawn context of the lib
     
-    def __init__(self, nbWorkers:int, startPaused:bool=False, newContext:bool=False)->None:
+    def __init__(self, nbWorkers:int, startPaused:bool=False, newContext:bool=False, 
+                 initializer:"Callable[..., Any]|None"=None, initArgs:"tuple[Any, ...]"=(),
+                 maxTasksPerWorker:"int|None"=None, maxWorkerMemory:"int|None"=None,
+                 sharedArrayThreshold:"int|None"=SHARED_ARRAY_THRESHOLD)->None:
+        """`initializer(*initArgs)` is called by each worker when it starts \
+        (to preload some modules (see preloadModules), warm the numba caches, etc)\n
+        a worker is replaced by a new one after `maxTasksPerWorker` tasks \
+        or when its RSS reach `maxWorkerMemory` bytes (None -> no limit), \
+        in order to guard against the memory leaks of the tasks\n
+        the tasks wait in a priority queue (by Task.priority, then FIFO) and at most \
+        2 per worker are sent to the workers, the tasks whose deadline passed are dropped \
+        and the running ones are terminated (their worker is replaced), \
+        their result is a TaskDeadlineError\n
+        the numpy arrays of at least `sharedArrayThreshold` bytes (None -> never) in the arguments \
+        (and their tuples, lists and dicts) are copied once in shared memory and the workers get \
+        read-only views on them, the blocks are freed when the task is finished (the same array given to \
+        several pending tasks is shared once, don't modify it until they are finished)\n
+        /!\\ the tasks don't get private copies of these arrays anymore: \
+        a task that modify its argument must copy it (or use `sharedArrayThreshold`=None)\n
+        the arrays of the results are sent back the same way (except on windows)"""
         # type hint (they are large so regrouped here)
         self._ctx: "multiprocess.context.SpawnContext"
         self._tasksQueue: "multiprocess.queues.JoinableQueue"
-        self._results: "dict[int, _T|MP_Exception]"
+        self._resultsQueue: "multiprocess.queues.SimpleQueue"
+        """the (pickled) results of the tasks: (taskID, result), routed by the dispatcher thread\n
+        (the workers write them directly, there is no thread of the queue that could be terminated)"""
+        self._runningTasks: "Any"
+        """the taskID executed by each worker (-1 -> none), in shared memory"""
+        self._runningLocks: "list[multiprocess.synchronize.Lock]"
+        """the lock of each worker protecting its _runningTasks (a worker is only terminated with it)"""
         self.__runningEvent: "multiprocess.synchronize.Event"
         self.__workers: "list[ProcessWorker[_T]]"
         self.__next_taskID: int = 0
         """the taskID that will be given to the next task"""
+        self._initializer: "Callable[..., Any]|None" = initializer
+        self._initArgs: "tuple[Any, ...]" = initArgs
+        self._maxTasksPerWorker: "int|None" = maxTasksPerWorker
+        self._maxWorkerMemory: "int|None" = maxWorkerMemory
+        self._sharedArrayThreshold: "int|None" = sharedArrayThreshold
+        if (maxTasksPerWorker is not None) and (maxTasksPerWorker < 1):
+            raise ValueError(f"maxTasksPerWorker must be at least 1 or None, got: {maxTasksPerWorker}")
+        if (maxWorkerMemory is not None) and (_processMemory() is None):
+            print("/!\\ the memory of the workers can't be measured here (install psutil), "
+                  "maxWorkerMemory will be ignored")
         
         # handle context
         if newContext is True:
@@ -217,16 +936,104 @@ class ProcessManager(Generic[_T]):
         self._tasksQueue = self._ctx.JoinableQueue()
         self.__runningEvent = self._ctx.Event()
         self.setPaused(startPaused)
-        # setup the sync manager for the results
-        self.__syncManager = multiprocess.managers.SyncManager(ctx=self._ctx)
-        self.__syncManager.start()
-        self._results = self.__syncManager.dict() # type: ignore
+        self._resultsQueue = self._ctx.SimpleQueue()
+        self._runningTasks = self._ctx.Array("q", [-1] * nbWorkers, lock=False)
+        self._runningLocks = [self._ctx.Lock() for _ in range(nbWorkers)]
         # initialize workers
-        self.__workers = [ProcessWorker(self) for _ in range(nbWorkers)]
+        self.__workers = [ProcessWorker(self, index) for index in range(nbWorkers)]
+        # NOTE: the following attributes aren't sent to the workers (see __getstate__)
+        self.__closed: bool = False
+        self.__results: "dict[int, _T|MP_Exception]" = {}
+        """the arrived results of the tasks that aren't streamed"""
+        self.__waitingIDs: "set[int]" = set()
+        """the tasks that aren't streamed whose result didn't arrived"""
+        self.__streams: "dict[int, Callable[[int, _T|MP_Exception], None]]" = {}
+        """the function receiving (taskID, result) of each streamed task (see .imap(...) \
+        and .submit(...)) that isn't finished"""
+        self.__resultsLock = threading.RLock()
+        self.__resultsCondition = threading.Condition(self.__resultsLock)
+        self.__pendingTasks: "list[list[Any]]" = []
+        """the heap of the tasks that aren't sent to the workers: [-priority, taskID, Task_MP|None] \
+        (None -> it was removed)"""
+        self.__pendingByID: "dict[int, list[Any]]" = {}
+        """taskID -> its entry in __pendingTasks"""
+        self.__inFlight: "set[int]" = set()
+        """the tasks sent to the workers whose result didn't arrived"""
+        self.__maxInFlight: int = 2 * nbWorkers
+        self.__deadlines: "list[tuple[float, int]]" = []
+        """the heap of the deadlines of the tasks: (deadline, taskID), checked by the watcher thread"""
+        self.__cancelledIDs: "set[int]" = set()
+        """the tasks sent to the workers that are cancelled (they will be terminated)"""
+        self.__finishedEarly: "set[int]" = set()
+        """the tasks sent to the workers whose result (an error) was alredy given"""
+        self.__deadlinesChanged = threading.Condition(self.__resultsLock)
+        self.__watcher: "threading.Thread|None" = None
+        """the thread that handle the deadlines (started with the first one)"""
+        self.__sharedLock = threading.Lock()
+        self.__sharedBlocks: "dict[int, _SharedBlock]" = {}
+        """id of the array -> the block holding it (while some pending tasks use it)"""
+        self.__tasksBlocks: "dict[int, list[int]]" = {}
+        """taskID -> the keys of the blocks (in __sharedBlocks) that the task use"""
+        self.__resultsBlocks: "list[SharedMemory]" = []
+        """the blocks of the results that are still used by some arrays (alredy unlinked)"""
+        self.__dispatcher = threading.Thread(target=self.__dispatchResults, daemon=True)
+        self.__dispatcher.start()
         # start the workers
         for worker in self.__workers:
             worker.start()
     
+    def __getstate__(self)->"dict[str, Any]":
+        """the state sent to the workers (the results and their dispatcher stay here)"""
+        return {"tasksQueue": self._tasksQueue, "resultsQueue": self._resultsQueue,
+                "runningEvent": self.__runningEvent, "initializer": self._initializer,
+                "runningTasks": self._runningTasks, "runningLocks": self._runningLocks,
+                "initArgs": self._initArgs, "maxTasksPerWorker": self._maxTasksPerWorker,
+                "maxWorkerMemory": self._maxWorkerMemory, 
+                "sharedArrayThreshold": self._sharedArrayThreshold}
+    
+    def __setstate__(self, state:"dict[str, Any]")->None:
+        self._tasksQueue = state["tasksQueue"]
+        self._resultsQueue = state["resultsQueue"]
+        self.__runningEvent = state["runningEvent"]
+        self._runningTasks = state["runningTasks"]
+        self._runningLocks = state["runningLocks"]
+        self._initializer = state["initializer"]
+        self._initArgs = state["initArgs"]
+        self._maxTasksPerWorker = state["maxTasksPerWorker"]
+        self._maxWorkerMemory = state["maxWorkerMemory"]
+        self._sharedArrayThreshold = state["sharedArrayThreshold"]
+    
+    @property
+    def nbWorkers(self)->int:
+        return len(self.__workers)
+    
+    @property
+    def isClosed(self)->bool:
+        return self.__closed
+    
+    def close(self)->None:
+        """wait for the scheduled tasks then stop the workers, the manager can't be used after"""
+        if self.__closed is True:
+            return None
+        self.unPause()
+        self.join()
+        with self.__resultsCondition:
+            # => no more tasks: the workers won't retire anymore
+            self.__closed = True
+            workers: "list[ProcessWorker[_T]]" = self.__workers.copy()
+        for _ in workers:
+            self._tasksQueue.put(None)
+        for worker in workers:
+            worker.join()
+        with self.__sharedLock:
+            for taskID in list(self.__tasksBlocks.keys()):
+                self.__releaseTaskBlocks(taskID)
+            self.__resultsBlocks = _closeBlocks(self.__resultsBlocks)
+    
+    def __checkNotClosed(self)->None:
+        if self.__closed is True:
+            raise RuntimeError("the manager is closed")
+    
     def __giveTaskID(self)->int:
         taskID = self.__next_taskID
         self.__next_taskID += 1
@@ -254,10 +1061,12 @@ class ProcessManager(Generic[_T]):
     
     def remainingTasks(self)->int:
         """return the aproximative number of tasks that are still scheduled"""
-        return self._tasksQueue.qsize()
+        return len(self.__pendingByID) + self._tasksQueue.qsize()
     def join(self)->None:
         """return when all tasks are finished"""
-        self._tasksQueue.join()
+        with self.__resultsCondition:
+            while (len(self.__pendingByID) + len(self.__inFlight)) != 0:
+                self.__resultsCondition.wait()
     
     def addWork(self, func:"Callable[_P, _T]", *funcArgs:_P.args, **funcKwargs:_P.kwargs)->int:
         """add the work to the stack, will start when a worker will be available\n
@@ -265,32 +1074,218 @@ class ProcessManager(Generic[_T]):
         return the taskID of the generated task (use it to get the result)"""
         return self.addTask(Task(func, *funcArgs, **funcKwargs))
     def addTask(self, task:Task[_T])->int:
-        """add the task to the stack, will start when a worker will be available"""
+        """add the task to the stack, will start when a worker will be available \
+        (see Task.withScheduling(...) for its priority and deadline)\n
+        return the taskID of the task (use it to get the result)"""
+        return self.addTaskWithHandle(task).taskID
+    def addTaskWithHandle(self, task:Task[_T])->"TaskHandle[_T]":
+        """like .addTask(...) but return the handle of the task \
+        (use it to get the result or to cancel the task)"""
+        self.__checkNotClosed()
         taskID: int = self.__giveTaskID()
-        self._tasksQueue.put(Task_MP(
-            taskID, task.func, *task.funcArgs, **task.funcKwargs))
-        return taskID
+        with self.__resultsCondition:
+            self.__waitingIDs.add(taskID)
+        self.__putTask(taskID, task)
+        return TaskHandle(taskID, (lambda terminate: self.__cancel(taskID, terminate)))
+    
+    def __putTask(self, taskID:int, task:"Task[_T]")->None:
+        """schedule the task (its large arrays are put in shared memory)"""
+        (func, funcArgs, funcKwargs) = task._toTuple()
+        threshold: "int|None" = self._sharedArrayThreshold
+        if threshold is not None:
+            blocksKeys: "list[int]" = []
+            def share(array:"numpy.ndarray")->"_SharedArray":
+                sharedBlock: "_SharedBlock|None" = self.__sharedBlocks.get(id(array), None)
+                if sharedBlock is None:
+                    sharedBlock = _SharedBlock(array)
+                    self.__sharedBlocks[id(array)] = sharedBlock
+                sharedBlock.nbTasks += 1
+                blocksKeys.append(id(array))
+                return sharedBlock.sharedArray
+            with self.__sharedLock:
+                self.__tasksBlocks[taskID] = blocksKeys
+                try: (funcArgs, funcKwargs) = _replaceValues(
+                    (tuple(funcArgs), funcKwargs), 
+                    lambda value: _SharedArray.isShareable(value, threshold), share)
+                except:
+                    self.__releaseTaskBlocks(taskID)
+                    raise
+        taskMP: "Task_MP[_T]" = Task_MP(taskID, func, *funcArgs, **funcKwargs)._schedulingOf(task)
+        with self.__resultsCondition:
+            entry: "list[Any]" = [-task.priority, taskID, taskMP]
+            heapq.heappush(self.__pendingTasks, entry)
+            self.__pendingByID[taskID] = entry
+            if task.deadline is not None:
+                heapq.heappush(self.__deadlines, (task.deadline, taskID))
+                self.__notifyWatcher()
+            self.__sendPendingTasks()
+    
+    def __sendPendingTasks(self)->None:
+        """send the next pending tasks to the workers (call it with the results lock)\n
+        (the expired tasks are left to the watcher)"""
+        while (len(self.__inFlight) < self.__maxInFlight) and (len(self.__pendingTasks) != 0):
+            (_, taskID, taskMP) = heapq.heappop(self.__pendingTasks)
+            if taskMP is None:
+                continue # => it was removed
+            del self.__pendingByID[taskID]
+            self.__inFlight.add(taskID)
+            self._tasksQueue.put(taskMP)
+    
+    def __cancel(self, taskID:int, terminate:bool)->bool:
+        """cancel the task (see TaskHandle.cancel(...))"""
+        with self.__resultsCondition:
+            entry: "list[Any]|None" = self.__pendingByID.pop(taskID, None)
+            if entry is None:
+                if (terminate is False) or (taskID not in self.__inFlight):
+                    return False # => it is started or finished
+                # => the watcher will terminate it (once it is running)
+                self.__cancelledIDs.add(taskID)
+                heapq.heappush(self.__deadlines, (0.0, taskID))
+                self.__notifyWatcher()
+                return True
+            entry[2] = None
+        self.__dropPendingTask(taskID, TaskCancelledError(f"the task {taskID} was cancelled"))
+        return True
+    
+    def __dropPendingTask(self, taskID:int, error:Exception)->None:
+        """give the `error` as the result of a task that wasn't sent to the workers"""
+        if self._sharedArrayThreshold is not None:
+            with self.__sharedLock:
+                self.__releaseTaskBlocks(taskID)
+        self.__routeResult(taskID, MP_Exception(error))
+    
+    def __notifyWatcher(self)->None:
+        """the deadlines changed (call it with the results lock)"""
+        if self.__watcher is None:
+            self.__watcher = threading.Thread(target=self.__watchDeadlines, daemon=True)
+            self.__watcher.start()
+        else: self.__deadlinesChanged.notify()
+    
+    def __watchDeadlines(self)->None:
+        """drop the pending tasks whose deadline passed and terminate \
+        the running ones (run in its own thread)"""
+        while True:
+            expiredIDs: "list[int]" = []
+            """the tasks that didn't started (pending or sent to the workers)"""
+            toTerminate: "list[tuple[int, int]]" = []
+            """[(taskID, index of its worker), ...]"""
+            with self.__resultsCondition:
+                while True:
+                    now: float = time.monotonic()
+                    while (len(self.__deadlines) != 0) and (self.__deadlines[0][0] <= now):
+                        (_, taskID) = heapq.heappop(self.__deadlines)
+                        entry: "list[Any]|None" = self.__pendingByID.pop(taskID, None)
+                        if entry is not None:
+                            entry[2] = None
+                            expiredIDs.append(taskID)
+                        elif taskID in self.__inFlight:
+                            runningTasks: "list[int]" = list(self._runningTasks)
+                            if taskID in runningTasks:
+                                toTerminate.append((taskID, runningTasks.index(taskID)))
+                                continue
+                            # => not started yet: give its result now and terminate it \
+                            #   if it starts before the worker see it is expired (or cancelled)
+                            if taskID not in self.__finishedEarly:
+                                self.__finishedEarly.add(taskID)
+                                expiredIDs.append(taskID)
+                            heapq.heappush(self.__deadlines, (now + 0.01, taskID))
+                        # else => it is finished
+                    if (len(expiredIDs) != 0) or (len(toTerminate) != 0):
+                        break
+                    self.__deadlinesChanged.wait(
+                        None if len(self.__deadlines) == 0 else (self.__deadlines[0][0] - now))
+            for taskID in expiredIDs:
+                error: Exception = (
+                    TaskCancelledError(f"the task {taskID} was cancelled") if taskID in self.__cancelledIDs
+                    else TaskDeadlineError(f"the deadline of the task {taskID} passed before it started"))
+                if taskID in self.__finishedEarly:
+                    self.__routeResult(taskID, MP_Exception(error))
+                else: self.__dropPendingTask(taskID, error)
+            for (taskID, index) in toTerminate:
+                self.__terminateTask(taskID, index)
+    
+    def __terminateTask(self, taskID:int, index:int)->None:
+        """terminate the worker executing the task and replace it"""
+        with self._runningLocks[index]:
+            if self._runningTasks[index] != taskID:
+                return None # => it finished in the mean time
+            with self.__resultsCondition:
+                worker: "ProcessWorker[_T]" = self.__workers[index]
+                worker.terminate()
+                worker.join()
+                self._runningTasks[index] = -1
+                if self.__closed is False:
+                    self.__startWorker(index)
+                cancelled: bool = (taskID in self.__cancelledIDs)
+        self.__finishTask(taskID, MP_Exception(
+            TaskCancelledError(f"the task {taskID} was cancelled") if cancelled else 
+            TaskDeadlineError(f"the deadline of the task {taskID} passed, it was terminated")))
+    
+    def __releaseTaskBlocks(self, taskID:int)->None:
+        """free the blocks that aren't used by pending tasks anymore (call it with the shared lock)"""
+        for key in self.__tasksBlocks.pop(taskID, []):
+            sharedBlock: "_SharedBlock" = self.__sharedBlocks[key]
+            sharedBlock.nbTasks -= 1
+            if sharedBlock.nbTasks == 0:
+                del self.__sharedBlocks[key]
+                sharedBlock.block.close()
+                sharedBlock.block.unlink()
+    
+    def __attachResult(self, result:"_T|MP_Exception")->"_T|MP_Exception":
+        """get the arrays of the result from the shared memory"""
+        blocks: "list[SharedMemory]" = []
+        try: result = _attachArrays(result, blocks, readOnly=False) # => its blocks are private
+        except Exception as err:
+            result = MP_Exception(err)
+        for block in blocks:
+            block.unlink() # => its memory is freed once the arrays are deleted
+        with self.__sharedLock:
+            self.__resultsBlocks = _closeBlocks(self.__resultsBlocks + blocks)
+        return result
     
-    def getResult(self, taskID:int, popIt:bool=True)->"_T|MP_Exception":
-        if popIt is True:
-            return self._results.pop(taskID)
-        else: return self._results[taskID]
+    def getResult(self, taskID:"int|TaskHandle[_T]", popIt:bool=True)->"_T|MP_Exception":
+        """the result of the task (wait for it when it didn't arrived)\n
+        raise a KeyError when the task is unknown or its result was alredy poped"""
+        if isinstance(taskID, TaskHandle):
+            taskID = taskID.taskID
+        with self.__resultsCondition:
+            while taskID not in self.__results:
+                if taskID not in self.__waitingIDs:
+                    raise KeyError(taskID)
+                self.__resultsCondition.wait()
+            if popIt is True:
+                return self.__results.pop(taskID)
+            else: return self.__results[taskID]
     
-    def runBatch(self, tasks:"SupportsIterableSized[Task[_T]]")->"list[_T]":
+    def runBatch(self, tasks:"SupportsIterableSized[Task[_T]]", 
+                 chunkSize:"int|Literal['auto']"="auto")->"list[_T]":
         """execute the `tasks` with the manager (blocking)\n
         return a list of results as [tasks[0] -> res[0], ..., tasks[n] -> res[n]]\n
-        if some exceptions happends, will print thelm all then raise a RuntimeError"""
-        # create pointers to grab each results
-        taskIDs:"list[int]" = []
-        # start working
-        self.unPause()
-        for task in tasks:
-            (func, funcArgs, funcKwargs) = task._toTuple()
-            taskIDs.append(self.addWork(func, *funcArgs, **funcKwargs))
-        # wait until all tasks are done
-        self.join()
-        # assemble the results and return
-        results = [self.getResult(taskID, popIt=True) for taskID in taskIDs]
+        if some exceptions happends, will print thelm all then raise a RuntimeError\n
+        `chunkSize` is the number of tasks sent together to a worker (executed in a loop):\n
+         - int -> fixed size (1 -> each task is sent alone)\n
+         - "auto" -> choosen from the measured duration of the tasks, \
+            the chunks last about CHUNK_TARGET_DURATION\n
+        the priority and the deadline of the tasks are kept (see _ChunkSizer.chunks(...))"""
+        results: "list[_T|MP_Exception]"
+        if chunkSize == 1:
+            results = self.__runEachTask(tasks)
+        else:
+            if (chunkSize != "auto") and (chunkSize < 1):
+                raise ValueError(f"chunkSize must be at least 1 or 'auto', got: {chunkSize}")
+            sizer = _ChunkSizer(nbWorkers=len(self.__workers), nbTasks=len(tasks), chunkSize=chunkSize)
+            results = []
+            chunksResults = cast("Generator[tuple[list[_T|MP_Exception], float]|MP_Exception, None, None]",
+                                 self.__stream(sizer.chunks(tasks), None, ordered=True, raiseErrors=False))
+            for chunkResult in chunksResults:
+                nbInChunk: int = sizer.chunksSizes.popleft()
+                if isinstance(chunkResult, MP_Exception):
+                    # => the chunk was dropped (ie. its deadline passed)
+                    results.extend([chunkResult] * nbInChunk)
+                    continue
+                (chunkResults, duration) = chunkResult
+                sizer.update(len(chunkResults), duration)
+                results.extend(chunkResults)
         filteredResults: list[_T] = []
         hasExceptions: bool = False
         for res in results:
@@ -301,3 +1296,191 @@ class ProcessManager(Generic[_T]):
         if hasExceptions is True:
             raise RuntimeError("some tasks failed, tracebacks are alredy printed")
         return filteredResults
+    
+    def __runEachTask(self, tasks:"SupportsIterableSized[Task[_T]]")->"list[_T|MP_Exception]":
+        """execute each task on its own and return their results"""
+        handles:"list[TaskHandle[_T]]" = []
+        # start working
+        self.unPause()
+        for task in tasks:
+            handles.append(self.addTaskWithHandle(task))
+        # wait until all tasks are done
+        self.join()
+        # assemble the results
+        return [self.getResult(handle, popIt=True) for handle in handles]
+    
+    def imapUnordered(self, tasks:"Iterable[Task[_T]]", maxPending:"int|None"=None)->"Generator[_T, None, None]":
+        """execute the `tasks` with the manager and yield their results as they finish\n
+        the `tasks` are consumed lazily: at most `maxPending` (default: 2 per worker) \
+        are submitted and not yet yielded\n
+        the exception of a failed task is raised when its result is reached"""
+        return self.__stream(tasks, maxPending, ordered=False)
+    
+    def imap(self, tasks:"Iterable[Task[_T]]", maxPending:"int|None"=None)->"Generator[_T, None, None]":
+        """same as .imapUnordered(...) but yield the results in the order of the `tasks`\n
+        (the finished results wait for their turn, they count in `maxPending`)"""
+        return self.__stream(tasks, maxPending, ordered=True)
+    
+    def __stream(self, tasks:"Iterable[Task[_T]]", maxPending:"int|None", ordered:bool,
+                 raiseErrors:bool=True)->"Generator[_T, None, None]":
+        finishedQueue:"Queue[tuple[int, _T|MP_Exception]]" = Queue()
+        indexes:"dict[int, int]" = {}
+        """taskID -> index of the task"""
+        def submit(index:int, task:"Task[_T]")->None:
+            self.__checkNotClosed()
+            taskID: int = self.__giveTaskID()
+            indexes[taskID] = index
+            with self.__resultsCondition:
+                self.__streams[taskID] = (lambda taskID, result: finishedQueue.put((taskID, result)))
+            self.__putTask(taskID, task)
+        def getFinished()->"tuple[int, _T|MP_Exception]":
+            (taskID, result) = finishedQueue.get()
+            return (indexes.pop(taskID), result)
+        self.unPause()
+        try:
+            yield from _streamResults(
+                tasks, submit, getFinished, ordered=ordered, raiseErrors=raiseErrors,
+                maxPending=(2 * len(self.__workers) if maxPending is None else maxPending))
+        finally:
+            # => the results of the tasks still running will be dropped
+            with self.__resultsCondition:
+                for taskID in indexes:
+                    self.__streams.pop(taskID, None)
+    
+    def submit(self, func:"Callable[_P, _T]", *funcArgs:_P.args, **funcKwargs:_P.kwargs)->"asyncio.Future[_T]":
+        """add the work to the stack and return a future of its result, bound to the running loop\n
+        (to be called from a coroutine: `result = await manager.submit(func, ...)`)\n
+        cancelling the future don't stop the task, its result is dropped"""
+        return self.__submitTask(Task(func, *funcArgs, **funcKwargs))
+    
+    def __submitTask(self, task:"Task[_T]")->"asyncio.Future[_T]":
+        self.__checkNotClosed()
+        loop: "asyncio.AbstractEventLoop" = asyncio.get_running_loop()
+        future: "asyncio.Future[_T]" = loop.create_future()
+        taskID: int = self.__giveTaskID()
+        with self.__resultsCondition:
+            self.__streams[taskID] = (lambda taskID, result: _resolveFutureThreadsafe(loop, future, result))
+        self.__putTask(taskID, task)
+        return future
+    
+    def asCompleted(self, tasks:"Iterable[Task[_T]]", maxPending:"int|None"=None)->"AsyncGenerator[_T, None]":
+        """the async version of .imapUnordered(...): `async for result in manager.asCompleted(tasks): ...`"""
+        self.unPause()
+        return _asCompleted(
+            tasks, self.__submitTask,
+            maxPending=(2 * len(self.__workers) if maxPending is None else maxPending))
+    
+    def __dispatchResults(self)->None:
+        """route the results to their stream or to the results (run in its own thread)"""
+        while True:
+            (taskID, result) = multiprocess.reduction.ForkingPickler.loads(self._resultsQueue.get())
+            if taskID is None:
+                self.__replaceWorker(index=result)
+                continue
+            if self._sharedArrayThreshold is not None:
+                result = self.__attachResult(result)
+            self.__finishTask(taskID, result)
+    
+    def __finishTask(self, taskID:int, result:"_T|MP_Exception")->None:
+        """the task sent to the workers is finished (or terminated): \
+        send the next pending tasks and route its result"""
+        with self.__resultsCondition:
+            self.__inFlight.discard(taskID)
+            self.__cancelledIDs.discard(taskID)
+            self.__sendPendingTasks()
+            alreadyRouted: bool = (taskID in self.__finishedEarly)
+            self.__finishedEarly.discard(taskID)
+        if self._sharedArrayThreshold is not None:
+            with self.__sharedLock:
+                self.__releaseTaskBlocks(taskID)
+        if alreadyRouted is False:
+            self.__routeResult(taskID, result)
+        else: # => only for .join()
+            with self.__resultsCondition:
+                self.__resultsCondition.notify_all()
+    
+    def __routeResult(self, taskID:int, result:"_T|MP_Exception")->None:
+        """give the result of the task to its stream or put it in the results"""
+        with self.__resultsCondition:
+            receiver = self.__streams.pop(taskID, None)
+            if (receiver is None) and (taskID in self.__waitingIDs):
+                self.__waitingIDs.discard(taskID)
+                self.__results[taskID] = result
+            # => for .getResult(...) and .join()
+            self.__resultsCondition.notify_all()
+        if receiver is not None:
+            receiver(taskID, result)
+        # else => its stream was closed
+    
+    def __replaceWorker(self, index:int)->None:
+        """replace the worker that retired (run in the dispatcher thread)"""
+        with self.__resultsCondition:
+            self.__workers[index].join()
+            if self.__closed is True:
+                return None
+            self.__startWorker(index)
+    
+    def __startWorker(self, index:int)->None:
+        """start a new worker at `index` (call it with the results lock)"""
+        newWorker: "ProcessWorker[_T]" = ProcessWorker(self, index)
+        newWorker.start()
+        self.__workers[index] = newWorker
+
+
+### Shared pool ### 
+
+_sharedPool: "ProcessManager[Any]|None" = None
+_sharedPoolKwargs: "dict[str, Any]" = {}
+_sharedPoolLock: threading.Lock = threading.Lock()
+
+def configureSharedPool(nbWorkers:"int|None"=None, initializer:"Callable[..., Any]|None"=None,
+                        initArgs:"tuple[Any, ...]"=(), maxTasksPerWorker:"int|None"=None,
+                        maxWorkerMemory:"int|None"=None)->None:
+    """set the parameters of the shared pool (see getSharedPool() and ProcessManager(...))\n
+    `nbWorkers`: None -> one worker per cpu\n
+    the current shared pool is closed, a new one will be created by the next getSharedPool()"""
+    global _sharedPool, _sharedPoolKwargs
+    with _sharedPoolLock:
+        oldPool: "ProcessManager[Any]|None" = _sharedPool
+        _sharedPool = None
+        _sharedPoolKwargs = {
+            "nbWorkers": nbWorkers, "initializer": initializer, "initArgs": initArgs, 
+            "maxTasksPerWorker": maxTasksPerWorker, "maxWorkerMemory": maxWorkerMemory}
+    if oldPool is not None:
+        oldPool.close()
+
+def getSharedPool()->"ProcessManager[Any]":
+    """the process pool shared by the module, created by the first call and reused after\n
+    its workers stay warm (the imports and the initializer are only done at their start)"""
+    global _sharedPool
+    with _sharedPoolLock:
+        if _sharedPool is None:
+            kwargs: "dict[str, Any]" = _sharedPoolKwargs.copy()
+            if kwargs.get("nbWorkers", None) is None:
+                kwargs["nbWorkers"] = (os.cpu_count() or 1)
+            _sharedPool = ProcessManager(**kwargs)
+        return _sharedPool
+
+
+### Benchmarks ### 
+
+def _tinyTask(x:int)->int:
+    return x
+
+def benchTinyTasks(nbTasks:int=20_000, nbWorkers:int=4)->"dict[str, float]":
+    """the throughput (tasks/sec) of a ProcessManager with tiny tasks \
+    (it is dominated by the cost of sending the tasks and their results)"""
+    manager: "ProcessManager[int]" = ProcessManager(nbWorkers)
+    throughputs: "dict[str, float]" = {}
+    try:
+        manager.runBatch([Task(_tinyTask, index) for index in range(10 * nbWorkers)]) # => warm up
+        for chunkSize in (1, "auto"):
+            startTime: float = time.perf_counter()
+            manager.runBatch([Task(_tinyTask, index) for index in range(nbTasks)], chunkSize=chunkSize)
+            throughputs[f"runBatch(chunkSize={chunkSize!r})"] = nbTasks / (time.perf_counter() - startTime)
+        startTime = time.perf_counter()
+        for _ in manager.imapUnordered(Task(_tinyTask, index) for index in range(nbTasks)):
+            pass
+        throughputs["imapUnordered"] = nbTasks / (time.perf_counter() - startTime)
+    finally: manager.close()
+    return throughputs
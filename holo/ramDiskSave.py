@@ -1,11 +1,22 @@
 from collections.abc import Callable, Iterable, Mapping
 import os, os.path
+import sys
 import threading
 import time
 import weakref
 import gc
+import atexit
+import socket
 from pathlib import Path
 import pickle
+import mmap
+import io
+import hashlib
+import math
+import struct
+import shutil
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 
 
@@ -13,18 +24,20 @@ from .__typing import (
     Generic, Iterator, TypeVar, Generator,
     Self, MutableMapping, Iterable, Tuple,
     LiteralString, Literal, overload, TypeAlias,
-    TYPE_CHECKING, Dict, cast, Union, )
+    TYPE_CHECKING, Dict, cast, Union, OrderedDict, Any, )
 from .protocols import (
     SupportsFileWrite, SupportsFileRead, 
     SupportsPickleRead,
     SupportsReduce, _KT, _T, )
 
 from .files import get_unique_name
+from .prettyFormats import PrettyfyClass
+from .profilers import Profiler
 from . import print_exception
 
 if TYPE_CHECKING:
     # => heavy imports, they will be done justInTime
-    import pandas, numpy
+    import pandas, numpy, xxhash
 
 
 
@@ -36,6 +49,9 @@ _T_Savable = TypeVar("_T_Savable",
     bound=Union[SupportsReduce, "numpy.ndarray", "pandas.DataFrame"])
 
 
+_T_File = TypeVar("_T_File")
+
+
 class _Unsetted():
     """class that garenty up to one instance"""
     __value:"_Unsetted|None" = None
@@ -47,9 +63,81 @@ class _Unsetted():
         else: raise RuntimeError("tryed to create a second instance")
 
 
+class _BorrowedFile(Generic[_T_File]):
+    """wrap an opened file, the `with` will not close it (its owner will)"""
+    __slots__ = ("file", )
+    def __init__(self, file:"_T_File")->None:
+        self.file:"_T_File" = file
+    def __enter__(self)->"_T_File":
+        return self.file
+    def __exit__(self, *_)->None:
+        pass
+
+
+class _WatchedDict(dict):
+    """a dict that count its modifications (used to invalidate what was computed from it)"""
+    __slots__ = ("version", )
+    def __init__(self, *args, **kwargs)->None:
+        super().__init__(*args, **kwargs)
+        self.version:int = 0
+    def __reduce__(self):
+        return (_WatchedDict, (dict(self), ))
+    def __setitem__(self, key, value)->None:
+        super().__setitem__(key, value)
+        self.version += 1
+    def __delitem__(self, key)->None:
+        super().__delitem__(key)
+        self.version += 1
+    def __ior__(self, other)->Self:
+        super().__ior__(other)
+        self.version += 1
+        return self
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+    def update(self, *args, **kwargs)->None:
+        super().update(*args, **kwargs)
+        self.version += 1
+    def clear(self)->None:
+        super().clear()
+        self.version += 1
+
+
 _Verbose = Literal[0, 1, 2, 3]
 
-_CompressionLib = Literal["lz4", "lzma", "bz2", "bzip2", "lzo", "blosc", "zlib", "blosc:lz4"]
+_StorageKind = Literal["files", "pack"]
+"""how the saved objects of a Session are stored:
+ - "files": one file per object
+ - "pack": the objects are appended in large segment files (with an in memory index)
+"""
+
+_VerifyLevel = Literal["none", "size", "checksum"]
+"""how the entries of a reopened Session are checked (see Session.reopen(...)):
+ - "none": trust the manifest
+ - "size": the size on the disk must match (no payload readed)
+ - "checksum": the checksum of the payload must match (read all the payloads)
+"""
+
+_ChecksumAlgo = Literal["crc32", "xxhash"]
+"""the checksum written in the footer of the saved objects (see SaveArgs(checksum=...))"""
+
+_FsyncPolicy = Literal["never", "file", "full"]
+"""when the files saved by SaveArgs are flushed to the disk (they are allways written aside then renamed):
+ - "never": let the OS flush them (a crash of the machine can lose the last saves, never truncate them)
+ - "file": fsync each file before its rename
+ - "full": also fsync the directory after the rename (the rename itself is durable)
+"""
+
+_Tier = Tuple[Path, Union[int, None]]
+"""a storage tier of a Session: (location, capacity in bytes | None -> unlimited)"""
+
+_CompressionLib = Literal["lz4", "lzma", "bz2", "bzip2", "lzo", "blosc", "zlib", "blosc:lz4", "zstd", "blosc2"]
 """some _CompressionLib are only usable certain _SaveLib"""
 
 _StandardMethodes = Literal[
@@ -59,6 +147,11 @@ _StandardMethodes = Literal[
     "pickle|numpy|pandas",
         # ndarray => numpy, DataFrame => pandas
         # otherwise => pickle
+    "pickle|numpy-mmap|pandas",
+        # ndarray => numpy-mmap, DataFrame => pandas
+        # otherwise => pickle
+    "allwaysPickle5",
+        # pickle with the big buffers (ndarray, bytearray, ...) out-of-band
     # req joblib
     "allwaysJoblib", 
     # req joblib, numpy, pandas
@@ -66,8 +159,8 @@ _StandardMethodes = Literal[
         # ndarray|DataFrame => joblib, otherwise => pickle
 ]
 
-_SaveLib = Literal["pickle", "numpy", "pandas", "joblib"]
-_SaveLibExt = Literal["__other__", "pickle", "numpy", "pandas", "joblib"]
+_SaveLib = Literal["pickle", "pickle5", "numpy", "numpy-mmap", "pandas", "joblib"]
+_SaveLibExt = Literal["__other__", "pickle", "pickle5", "numpy", "numpy-mmap", "pandas", "joblib"]
 
 _CustomMethodes:TypeAlias = Dict[type, _SaveLib]
 """you give a map asscociating types to a certain lib\n
@@ -86,27 +179,74 @@ _CompressionTuple = Tuple[_CompressionLib, int]
 compressionLevelsRange: "dict[_CompressionLib, tuple[int, int]]" = {
     "lz4": (1, 16), "blosc:lz4": (1, 16), "lzma": (1, 18), 
     "bz2": (1, 9), "bzip2": (1, 9), "lzo": (1, 9), 
-    "blosc": (1, 9), "zlib": (1, 9)}
-
-_CustomCompression:TypeAlias = "dict[_SaveLibExt|tuple[_SaveLib, type], _CompressionTuple]"
+    "blosc": (1, 9), "zlib": (1, 9), "zstd": (1, 22), "blosc2": (1, 9)}
+
+_CustomCompression:TypeAlias = "dict[_SaveLibExt|tuple[_SaveLib, type], _CompressionTuple|None]"
+"""the compression to use for the (lib, type) | lib | "__other__" libs (None -> no compression)\n
+a (lib, type) entry is used for the instances of the most narrowed type, \
+otherwise the lib entry is used, otherwise the "__other__" entry"""
+
+_TuneTarget = Literal["throughput", "ratio", "balanced"]
+"""what SaveArgs.autoTune(...) optimize:
+ - "throughput": the (save + load) speed
+ - "ratio": the compression ratio
+ - "balanced": the product of both
+"""
 
 ### consts
 
 SESSION_UPDATE_AFTER:int = 1*60 # update the session every 1min
 SESSION_DELETE_AFTER:int = 5*60 # NOTE: /!\ an un-updated session for 5min is deleted
 FILENAME_SESSION_INFOS:str = "session.txt"
+REGISTRY_DIRNAME:str = ".registry" # the live sessions (in SAVEMODULE_DIRECTORY)
+FILENAME_SESSION_MANIFEST:str = "manifest.pkl" # NOTE: a session with a manifest isn't deleted by the cleaner
+MANIFEST_VERSION:int = 1
 
 SAVEMODULE_DIRECTORY:Path = Path(os.environ["TEMP"]).joinpath(".SaveModule/")
 
 CONST_PANDAS_HDF_KEY = "DF"
 
+BLOSC2_CHUNK_SIZE:int = 16 * 2**20 # the size of the (uncompressed) chunks compressed by blosc2
+
+STATS_HISTORY_SIZE:int = 10_000 # the latencies kept per category of the stats
+STATS_MIN_LATENCY:float = 1e-6 # the upper bound of the first bucket of the latency histograms
+
+BATCH_WRITE_SIZE:int = 64 * 2**20 # the batched saves write by groups of 64Mo
+
+ARRAY_CHUNK_SIZE:int = 4 * 2**20 # the (uncompressed) size of the chunks of an ArraySaver
+ARRAY_CHUNK_CACHE_SIZE:int = 8 # the number of decompressed chunks kept by an ArraySaver
+ARRAY_CHUNK_COMPRESSION:"_CompressionTuple|None" = ("blosc2", 5)
+
+PACK_SEGMENT_MAX_SIZE:int = 256 * 2**20 # start a new segment after 256Mo
+PACK_COMPACT_DEAD_RATIO:float = 0.5 # compact a full segment when half of it is dead
+
 ALLOWED_CompressionLibs:"dict[_SaveLibExt, set[_CompressionLib]]" = {
-    "__other__": {"lz4", "bz2", "bzip2", "lzma"},
+    "__other__": {"lz4", "bz2", "bzip2", "lzma", "zstd", "blosc2"},
     "pandas": {"blosc:lz4", "lzo", "bzip2", "blosc", "zlib"},
 }
 
+COMPRESSION_LIBS_MODULES:"dict[_CompressionLib, str]" = {
+    "lz4": "lz4.frame", "lzma": "lzma", "bz2": "bz2", "bzip2": "bz2",
+    "zstd": "zstandard", "blosc2": "blosc2"}
+"""the modules to import for the compLibs (not used by pandas)"""
+
+PICKLE5_MAGIC:bytes = b"HoloPK5\x00"
+PICKLE5_ALIGNMENT:int = mmap.ALLOCATIONGRANULARITY # the out-of-band buffers start on a new page
+
+CHECKSUM_MAGICS:"dict[_ChecksumAlgo, bytes]" = {"crc32": b"HoloCRC\x00", "xxhash": b"HoloXXH\x00"}
+CHECKSUM_FOOTER = struct.Struct("<Q8s") # (checksum, magic) at the end of the saved objects
+CHECKSUM_READ_SIZE:int = 4 * 2**20 # the checksums are verified by reads of 4Mo
+
+NEVER_COMPRESSED_SaveLibs:"set[_SaveLib]" = {"numpy-mmap", "pickle5"}
+"""the _SaveLib that map their files in memory (the compression is ignored for them)"""
+PATH_ONLY_SaveLibs:"set[_SaveLib]" = {"pandas", "numpy-mmap", "pickle5"}
+"""the _SaveLib that need their own file (they can't be saved in a stream)"""
+
 _unsetted = _Unsetted() # create its unique instance
 
+_HOST_TAG:str = hashlib.blake2b(socket.gethostname().encode(), digest_size=4).hexdigest()
+"""identify the host in the registry of the sessions"""
+
 
 ### general funcs
 
@@ -118,19 +258,1153 @@ def cleanFile_if_exist(filePath:str)->None:
     if os.path.lexists(filePath) is True:
         os.remove(filePath)
 
+def _isMappedFrom(obj:object, filePath:"Path|str")->bool:
+    """whether `obj` is the read only numpy.memmap of the whole file at `filePath`"""
+    if "numpy" not in sys.modules:
+        return False # => can't be a memmap
+    import numpy
+    return isinstance(obj, numpy.memmap) and isinstance(obj.base, mmap.mmap) \
+        and (obj.mode == "r") and (obj.filename is not None) \
+        and (os.path.abspath(obj.filename) == os.path.abspath(filePath))
+
+def _hashArrayBuffer(obj:object, tag:str)->"str|None":
+    """hash the buffer of a numpy array (with its dtype and shape) without serializing it\n
+    return None when it can't be hashed that way (not an array, python objects, not C contiguous)"""
+    if "numpy" not in sys.modules:
+        return None # => can't be an array
+    import numpy
+    if (not isinstance(obj, numpy.ndarray)) or obj.dtype.hasobject \
+            or (obj.flags.c_contiguous is False):
+        return None
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{tag}|{obj.dtype.str}|{obj.shape}".encode())
+    hasher.update(obj.reshape(-1).view(numpy.uint8))
+    return hasher.hexdigest()
+
+def _hashFile(filePath:"Path|str", chunkSize:int=4*2**20)->str:
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(filePath, mode="rb") as file:
+        while True:
+            chunk = file.read(chunkSize)
+            if len(chunk) == 0:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _dumpPickle5(file:"SupportsFileWrite[bytes]", obj:object)->None:
+    """pickle `obj` with the protocol 5 in the `file` (at its start), \
+    its buffers are written out-of-band, each on a new page\n
+    layout: magic | nbBuffers, pickleSize | (offset, size) * nbBuffers | pickle | pad | buffer | pad | ...\n
+    the file must be written aside then replaced, so the pages mapped from the old file stay valid"""
+    buffers:"list[pickle.PickleBuffer]" = []
+    pickled:bytes = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    rawBuffers:"list[memoryview]" = [buffer.raw() for buffer in buffers]
+    # compute the layout
+    headerSize:int = len(PICKLE5_MAGIC) + 16 + 16 * len(rawBuffers)
+    offsets:"list[int]" = []
+    position:int = headerSize + len(pickled)
+    for rawBuffer in rawBuffers:
+        position += (-position) % PICKLE5_ALIGNMENT
+        offsets.append(position)
+        position += rawBuffer.nbytes
+    # write it
+    position = 0
+    for data in [PICKLE5_MAGIC, struct.pack("<QQ", len(rawBuffers), len(pickled)),
+                 *[struct.pack("<QQ", offset, rawBuffer.nbytes) for offset, rawBuffer in zip(offsets, rawBuffers)],
+                 pickled]:
+        file.write(data)
+        position += len(data)
+    for offset, rawBuffer in zip(offsets, rawBuffers):
+        file.write(bytes(offset - position)) # => padding
+        file.write(rawBuffer)
+        position = offset + rawBuffer.nbytes
+
+def _loadPickle5(filePath:Path, readOnly:bool=False)->object:
+    """load a file written by _dumpPickle5, the buffers are mapped (copy on write) from the file\n
+    `readOnly` is whether the buffers are mapped read-only instead"""
+    with open(filePath, mode="rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=(mmap.ACCESS_READ if readOnly else mmap.ACCESS_COPY))
+    # => the mapping stays open as long as the buffers are used
+    view = memoryview(mapping)
+    if view[: len(PICKLE5_MAGIC)] != PICKLE5_MAGIC:
+        raise ValueError(f"the file: {filePath} wasn't saved with the lib: pickle5")
+    position:int = len(PICKLE5_MAGIC)
+    (nbBuffers, pickleSize) = struct.unpack_from("<QQ", view, position)
+    position += 16
+    buffers:"list[memoryview]" = []
+    for _ in range(nbBuffers):
+        (offset, size) = struct.unpack_from("<QQ", view, position)
+        position += 16
+        if (offset + size) > len(view):
+            raise ValueError(f"the file: {filePath} is truncated (a buffer goes past its end)")
+        buffers.append(view[offset: offset+size])
+    return pickle.loads(view[position: position+pickleSize], buffers=buffers)
+
+def _forgetObject(storage:"_Storage", trackedObjects:"dict[str, weakref.finalize]",
+                  fileStrPath:str, storedFiles:"list[str]")->None:
+    """finalizer of the ObjectSavers (and ArraySavers): remove the saved files and stop tracking it"""
+    for storedFile in storedFiles:
+        storage.remove(storedFile)
+    trackedObjects.pop(fileStrPath, None)
+
+def _tmpPathOf(fileStrPath:str)->str:
+    """the path where the writer (process and thread) write `fileStrPath` before renaming it \
+    (in the same directory, unique for each concurrent writer)"""
+    return f"{fileStrPath}.{os.getpid()}-{threading.get_ident()}.tmp"
+
+def _doneFuture(result:"_T")->"Future[_T]":
+    """a Future that is alredy done with the given `result`"""
+    future:"Future[_T]" = Future()
+    future.set_result(result)
+    return future
+
+def estimateSize(obj:object, _depth:int=2)->int:
+    """estimate the size in memory (in bytes) of the `obj`\n
+    it is fast but not exact: arrays and DataFrames use their buffers size, \
+    the builtin containers are only explored for `_depth` levels"""
+    if isinstance(getattr(obj, "_mmap", None), mmap.mmap):
+        # => numpy.memmap, its pages are loaded on demand and reclaimable by the OS
+        return 0
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        # => numpy.ndarray and alike
+        return nbytes
+    if type(obj).__module__.startswith("pandas") and hasattr(obj, "memory_usage"):
+        # => pandas.DataFrame | pandas.Series
+        usage = getattr(obj, "memory_usage")(index=True, deep=False)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    size:int = sys.getsizeof(obj)
+    if _depth <= 0:
+        return size
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimateSize(elt, _depth-1) for elt in obj)
+    elif isinstance(obj, dict):
+        size += sum(estimateSize(key, _depth-1) + estimateSize(value, _depth-1)
+                    for (key, value) in obj.items())
+    return size
+
+def _touchPages(obj:object, _depth:int=2)->int:
+    """read one byte per page of the arrays of the `obj` (the pages of the mapped arrays are loaded)\n
+    the DataFrames are readed by columns, the builtin containers are only explored for `_depth` levels\n
+    return the sum of the readed bytes (so the reads aren't skipped)"""
+    if type(obj).__module__.startswith("pandas") and hasattr(obj, "to_numpy"):
+        # => pandas.DataFrame | pandas.Series (the columns are views of their blocks)
+        if hasattr(obj, "columns"):
+            return sum(_touchPages(obj.iloc[:, index], _depth) for index in range(len(obj.columns))) # type: ignore
+        return _touchPages(obj.to_numpy(), _depth) # type: ignore
+    dtype = getattr(obj, "dtype", None)
+    if hasattr(obj, "__array_interface__") and (getattr(dtype, "hasobject", True) is False):
+        # => numpy.ndarray and alike
+        import numpy
+        flatBytes = numpy.ravel(numpy.asarray(obj), order="K").view(numpy.uint8) # => copy when not contiguous
+        return int(flatBytes[:: mmap.PAGESIZE].sum())
+    if _depth <= 0:
+        return 0
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sum(_touchPages(elt, _depth-1) for elt in obj)
+    elif isinstance(obj, dict):
+        return sum(_touchPages(value, _depth-1) for value in obj.values())
+    return 0
+
+### Storages definition
+
+class _Storage():
+    """base class of the storages: where the objects of a Session are saved\n
+    the objects are identified by their file path (even when they don't have their own file)"""
+    
+    def __init__(self, directory:Path)->None:
+        self.directory:Path = directory
+        self.frozen:bool = False
+        """when True => the objects are kept on the disk (.remove(...) and .close() don't delete them)"""
+    
+    def save(self, savingArgs:"SaveArgs", filePath:Path, obj:object)->None:
+        raise NotImplementedError
+    
+    def load(self, savingArgs:"SaveArgs", filePath:Path, objectType:"type[_T]")->"_T":
+        raise NotImplementedError
+    
+    def remove(self, fileStrPath:str)->bool:
+        """remove the object saved at `fileStrPath`, return whether there was one"""
+        raise NotImplementedError
+    
+    def fileSize(self, fileStrPath:str)->"int|None":
+        """the size on the disk of the object saved at `fileStrPath` (None -> not saved)"""
+        raise NotImplementedError
+    
+    def _writeBlob(self, fileStrPath:str, data:"bytes|memoryview")->None:
+        """save the alredy serialized `data` at `fileStrPath` (load it with .load(...))"""
+        raise NotImplementedError
+    
+    def _writeBlobs(self, blobs:"list[tuple[str, bytes|memoryview]]")->None:
+        """save many alredy serialized blobs (in a single pass when the storage allow it)"""
+        for (fileStrPath, data) in blobs:
+            self._writeBlob(fileStrPath, data)
+    
+    def _readBlob(self, fileStrPath:str)->bytes:
+        """read the serialized data of the object saved at `fileStrPath` (load it with .loadFrom(...))\n
+        only for the objects saved with a lib that isn't in PATH_ONLY_SaveLibs"""
+        raise NotImplementedError
+    
+    def _iterBlobs(self, fileStrPaths:"list[str]")->"Iterator[tuple[str, bytes]]":
+        """read the serialized data of many objects, in the order that is the fastest for the storage"""
+        for fileStrPath in fileStrPaths:
+            yield (fileStrPath, self._readBlob(fileStrPath))
+    
+    def checksum(self, fileStrPath:str)->str:
+        """the hash of what is stored for the object saved at `fileStrPath`"""
+        raise NotImplementedError
+    
+    def _locate(self, fileStrPath:str)->"tuple[list[str], int, int|None]":
+        """where the data of the object saved at `fileStrPath` is: \
+        (the files that might hold it (by order of preference), offset, size | None -> up to the end)\n
+        used to open the object from an other process (see ObjectSaver.share())"""
+        raise NotImplementedError
+    
+    def freeze(self)->None:
+        """keep the objects on the disk from now (see .frozen), used by the persistent sessions"""
+        self.frozen = True
+    
+    def _getState(self, keep:"set[str]")->"dict[str, Any]":
+        """the state to persist in order to restore the objects saved at `keep` (see Session.reopen(...))\n
+        the other objects are considered as removed"""
+        raise NotImplementedError
+    
+    def _setState(self, state:"dict[str, Any]")->"set[str]":
+        """restore a state given by ._getState(...) (the storage must be empty)\n
+        return the names of the files it use (the other files of the objects are strays)"""
+        raise NotImplementedError
+    
+    def close(self)->None:
+        """called when the session is cleared (all its objects are alredy removed)"""
+        pass
+
+
+class _FilesStorage(_Storage):
+    """the storage of a Session that put each object in its own file"""
+    
+    def save(self, savingArgs:"SaveArgs", filePath:Path, obj:object)->None:
+        savingArgs.save(filePath, obj)
+    
+    def load(self, savingArgs:"SaveArgs", filePath:Path, objectType:"type[_T]")->"_T":
+        return savingArgs.load(filePath, objectType)
+    
+    def remove(self, fileStrPath:str)->bool:
+        if (self.frozen is True) or (os.path.lexists(fileStrPath) is False):
+            return False
+        os.remove(fileStrPath)
+        return True
+    
+    def fileSize(self, fileStrPath:str)->"int|None":
+        if os.path.lexists(fileStrPath) is False:
+            return None
+        return os.path.getsize(fileStrPath)
+    
+    def _writeBlob(self, fileStrPath:str, data:"bytes|memoryview")->None:
+        # => written aside then renamed (never truncated by a crash)
+        tmpStrPath:str = _tmpPathOf(fileStrPath)
+        with open(tmpStrPath, mode="wb") as file:
+            file.write(data)
+        os.replace(tmpStrPath, fileStrPath)
+    
+    def _readBlob(self, fileStrPath:str)->bytes:
+        with open(fileStrPath, mode="rb") as file:
+            return file.read()
+    
+    def checksum(self, fileStrPath:str)->str:
+        return _hashFile(fileStrPath)
+    
+    def _locate(self, fileStrPath:str)->"tuple[list[str], int, int|None]":
+        if os.path.lexists(fileStrPath) is False:
+            raise FileNotFoundError(f"there is no object saved at: {fileStrPath}")
+        return ([fileStrPath], 0, None)
+    
+    def _getState(self, keep:"set[str]")->"dict[str, Any]":
+        return {"files": [Path(fileStrPath).name for fileStrPath in keep if os.path.isfile(fileStrPath)]}
+    
+    def _setState(self, state:"dict[str, Any]")->"set[str]":
+        return {fileName for fileName in state["files"] if self.directory.joinpath(fileName).is_file()}
+
+
+class _PackSegment():
+    """a file of the _PackStorage, the blobs are appended at its end"""
+    __slots__ = ("segmentID", "path", "file", "size", "deadBytes", "keys", "sealed", )
+    
+    def __init__(self, segmentID:int, path:Path, reopen:bool=False)->None:
+        """`reopen`: True -> open the existing segment, False -> create it"""
+        self.segmentID:int = segmentID
+        self.path:Path = path
+        self.file:"io.BufferedRandom" = open(path, mode=("r+b" if reopen else "w+b"))
+        self.size:int = (os.path.getsize(path) if reopen else 0)
+        self.deadBytes:int = 0
+        """the size of the blobs that were removed or replaced"""
+        self.keys:"set[str]" = set()
+        """the keys of the live blobs"""
+        self.sealed:bool = False
+        """when True => nothing more will be appended to it"""
+    
+    def append(self, data:"bytes|memoryview")->int:
+        """write the `data` at the end of the segment and return its offset"""
+        offset:int = self.size
+        self.file.seek(offset)
+        self.file.write(data)
+        self.file.flush()
+        self.size += len(data)
+        return offset
+    
+    def read(self, offset:int, size:int)->bytes:
+        self.file.seek(offset)
+        return self.file.read(size)
+    
+    def delete(self)->None:
+        self.file.close()
+        cleanFile_if_exist(self.path.as_posix())
+    
+    def close(self)->None:
+        """close the file but keep it on the disk"""
+        self.file.close()
+
+
+class _PackStorage(_FilesStorage):
+    """the storage of a Session that append the objects in large segment files\n
+    the index of the blobs is kept in memory, \
+    the full segments that are mostly dead are compacted in the background\n
+    the objects using a lib of PATH_ONLY_SaveLibs still get their own file"""
+    _Segment_prefix = "__SaveModulePack_"
+    
+    def __init__(self, directory:Path, segmentMaxSize:int=PACK_SEGMENT_MAX_SIZE,
+            submitIO:"weakref.WeakMethod[Callable[..., Future]]|None"=None)->None:
+        """`submitIO` is used to run the compactions in the background \
+            (None or dead -> the compactions are done immediately)"""
+        super().__init__(directory)
+        self.segmentMaxSize:int = segmentMaxSize
+        self.__submitIO:"weakref.WeakMethod[Callable[..., Future]]|None" = submitIO
+        self.__index:"dict[str, tuple[_PackSegment, int, int]]" = {}
+        """fileStrPath -> (segment, offset, size) of the blob of each packed object"""
+        self.__segments:"dict[int, _PackSegment]" = {}
+        self.__currentSegment:"_PackSegment|None" = None
+        self.__nextSegmentID:int = 0
+        self.__compacting:"set[int]" = set()
+        """the ids of the segments that are being compacted"""
+        self.__lock = threading.RLock()
+    
+    @property
+    def nbSegments(self)->int:
+        return len(self.__segments)
+    
+    def save(self, savingArgs:"SaveArgs", filePath:Path, obj:object)->None:
+        fileStrPath:str = filePath.as_posix()
+        if savingArgs.isStreamable(type(obj)) is False:
+            # => needs its own file
+            with self.__lock:
+                self.__drop(fileStrPath)
+            return super().save(savingArgs, filePath, obj)
+        buffer = io.BytesIO()
+        savingArgs.dump(buffer, obj)
+        self._append(fileStrPath, buffer.getbuffer())
+    
+    def load(self, savingArgs:"SaveArgs", filePath:Path, objectType:"type[_T]")->"_T":
+        fileStrPath:str = filePath.as_posix()
+        with self.__lock:
+            location = self.__index.get(fileStrPath, None)
+            if location is not None:
+                (segment, offset, size) = location
+                data:bytes = segment.read(offset, size)
+        if location is None:
+            # => not packed
+            return super().load(savingArgs, filePath, objectType)
+        return savingArgs.loadFrom(io.BytesIO(data), objectType)
+    
+    def remove(self, fileStrPath:str)->bool:
+        if self.frozen is True:
+            return False
+        with self.__lock:
+            if self.__drop(fileStrPath) is True:
+                return True
+        return super().remove(fileStrPath)
+    
+    def fileSize(self, fileStrPath:str)->"int|None":
+        location = self.__index.get(fileStrPath, None)
+        if location is None:
+            return super().fileSize(fileStrPath)
+        return location[2]
+    
+    def checksum(self, fileStrPath:str)->str:
+        with self.__lock:
+            location = self.__index.get(fileStrPath, None)
+            if location is not None:
+                (segment, offset, size) = location
+                return hashlib.blake2b(segment.read(offset, size), digest_size=16).hexdigest()
+        return super().checksum(fileStrPath)
+    
+    def _locate(self, fileStrPath:str)->"tuple[list[str], int, int|None]":
+        # NOTE: a compaction of its segment will move it
+        with self.__lock:
+            location = self.__index.get(fileStrPath, None)
+            if location is not None:
+                (segment, offset, size) = location
+                return ([segment.path.as_posix()], offset, size)
+        return super()._locate(fileStrPath)
+    
+    def _getState(self, keep:"set[str]")->"dict[str, Any]":
+        with self.__lock:
+            packed:"set[str]" = {fileStrPath for fileStrPath in keep if fileStrPath in self.__index}
+            state = super()._getState(keep.difference(packed))
+            liveBytes:"dict[int, int]" = {}
+            """segmentID -> size of the kept blobs"""
+            index:"dict[str, tuple[int, int, int]]" = {}
+            for fileStrPath in packed:
+                (segment, offset, size) = self.__index[fileStrPath]
+                index[Path(fileStrPath).name] = (segment.segmentID, offset, size)
+                liveBytes[segment.segmentID] = liveBytes.get(segment.segmentID, 0) + size
+            # => the segments without kept blobs aren't restored
+            state["segments"] = [
+                (segmentID, self.__segments[segmentID].size)
+                for segmentID in sorted(liveBytes)]
+            state["liveBytes"] = liveBytes
+            state["index"] = index
+            state["nextSegmentID"] = self.__nextSegmentID
+            return state
+    
+    def _setState(self, state:"dict[str, Any]")->"set[str]":
+        fileNames:"set[str]" = super()._setState(state)
+        with self.__lock:
+            for (segmentID, size) in state["segments"]:
+                path:Path = self.directory.joinpath(f"{self._Segment_prefix}{segmentID}")
+                if (path.is_file() is False) or (os.path.getsize(path) < size):
+                    continue # => lost (the entries in it will be dropped)
+                segment = _PackSegment(segmentID, path, reopen=True)
+                # => nothing more is appended to the restored segments
+                (segment.size, segment.sealed) = (size, True)
+                segment.deadBytes = size - state["liveBytes"][segmentID]
+                self.__segments[segmentID] = segment
+                fileNames.add(path.name)
+            for (fileName, (segmentID, offset, size)) in state["index"].items():
+                segment = self.__segments.get(segmentID, None)
+                if segment is None:
+                    continue # => its segment was lost
+                fileStrPath:str = self.directory.joinpath(fileName).as_posix()
+                self.__index[fileStrPath] = (segment, offset, size)
+                segment.keys.add(fileStrPath)
+            self.__nextSegmentID = max(self.__nextSegmentID, state["nextSegmentID"])
+        return fileNames
+    
+    def close(self)->None:
+        with self.__lock:
+            for segment in self.__segments.values():
+                if self.frozen is True:
+                    segment.close()
+                else: segment.delete()
+            self.__segments.clear()
+            self.__index.clear()
+            self.__currentSegment = None
+    
+    def _writeBlob(self, fileStrPath:str, data:"bytes|memoryview")->None:
+        self._append(fileStrPath, data)
+    
+    def _writeBlobs(self, blobs:"list[tuple[str, bytes|memoryview]]")->None:
+        with self.__lock:
+            # => appended one after the other in the current segment
+            for (fileStrPath, data) in blobs:
+                self._append(fileStrPath, data)
+    
+    def _readBlob(self, fileStrPath:str)->bytes:
+        with self.__lock:
+            location = self.__index.get(fileStrPath, None)
+            if location is not None:
+                (segment, offset, size) = location
+                return segment.read(offset, size)
+        # => not packed
+        return super()._readBlob(fileStrPath)
+    
+    def _iterBlobs(self, fileStrPaths:"list[str]")->"Iterator[tuple[str, bytes]]":
+        # read the packed blobs in the order of the segments
+        def locationKey(fileStrPath:str)->"tuple[int, int]":
+            location = self.__index.get(fileStrPath, None)
+            if location is None:
+                return (-1, 0) # => own file
+            return (location[0].segmentID, location[1])
+        for fileStrPath in sorted(fileStrPaths, key=locationKey):
+            yield (fileStrPath, self._readBlob(fileStrPath))
+    
+    def _append(self, fileStrPath:str, data:"bytes|memoryview")->None:
+        """append the `data` as the new blob of `fileStrPath` (the previous one become dead)"""
+        with self.__lock:
+            segment = self.__currentSegment
+            if (segment is None) or (segment.sealed is True):
+                segment = self.__newSegment()
+            offset:int = segment.append(data)
+            self.__drop(fileStrPath)
+            self.__index[fileStrPath] = (segment, offset, len(data))
+            segment.keys.add(fileStrPath)
+            if segment.size >= self.segmentMaxSize:
+                segment.sealed = True
+    
+    def __newSegment(self)->"_PackSegment":
+        segmentID:int = self.__nextSegmentID
+        self.__nextSegmentID += 1
+        segment = _PackSegment(segmentID, self.directory.joinpath(f"{self._Segment_prefix}{segmentID}"))
+        self.__segments[segmentID] = segment
+        self.__currentSegment = segment
+        return segment
+    
+    def __drop(self, fileStrPath:str)->bool:
+        """mark the blob of `fileStrPath` as dead (must hold the lock)\n
+        delete or compact its segment when needed, return whether there was a blob"""
+        location = self.__index.pop(fileStrPath, None)
+        if location is None:
+            return False
+        (segment, _, size) = location
+        segment.keys.discard(fileStrPath)
+        segment.deadBytes += size
+        if segment.sealed is False:
+            return True # => will be compacted once full
+        if len(segment.keys) == 0:
+            # => fully dead => delete it
+            segment.delete()
+            self.__segments.pop(segment.segmentID, None)
+        elif (segment.deadBytes / segment.size) >= PACK_COMPACT_DEAD_RATIO:
+            self.__scheduleCompaction(segment)
+        return True
+    
+    def __scheduleCompaction(self, segment:"_PackSegment")->None:
+        if segment.segmentID in self.__compacting:
+            return None # => alredy scheduled
+        self.__compacting.add(segment.segmentID)
+        submitIO = (None if self.__submitIO is None else self.__submitIO())
+        if submitIO is not None:
+            try: 
+                submitIO(self.compact, segment.segmentID)
+                return None
+            except RuntimeError: pass # => the session don't accept IO anymore
+        self.compact(segment.segmentID)
+    
+    def compact(self, segmentID:int)->None:
+        """move the live blobs of the (full) segment at the end of the storage, \
+        it will be deleted once empty"""
+        try:
+            with self.__lock:
+                segment = self.__segments.get(segmentID, None)
+                if (segment is None) or (segment.sealed is False):
+                    return None # => alredy deleted or still in use
+                keys:"list[str]" = list(segment.keys)
+            for fileStrPath in keys:
+                # => release the lock between each blob to not block the others IO for too long
+                with self.__lock:
+                    location = self.__index.get(fileStrPath, None)
+                    if (location is None) or (location[0] is not segment):
+                        continue # => removed or replaced meanwhile
+                    (_, offset, size) = location
+                    self._append(fileStrPath, segment.read(offset, size))
+        finally: 
+            with self.__lock:
+                self.__compacting.discard(segmentID)
+
+
+class _DedupStorage(_Storage):
+    """wrap a storage in order to store the identical payloads only once\n
+    the payloads are identified by their hash, each unique payload is \
+    saved as a blob with a reference count, it is removed when no object use it"""
+    _Blob_prefix = "__SaveModuleBlob_"
+    
+    def __init__(self, storage:"_Storage")->None:
+        super().__init__(storage.directory)
+        self.storage:"_Storage" = storage
+        """the storage of the blobs"""
+        self.__blobOf:"dict[str, str]" = {}
+        """fileStrPath -> path of the blob that hold its payload"""
+        self.__refCounts:"dict[str, int]" = {}
+        """path of a blob -> nb of objects that use it"""
+        self.__nbTmpFiles:int = 0
+        self.__lock = threading.RLock()
+    
+    @property
+    def nbBlobs(self)->int:
+        return len(self.__refCounts)
+    
+    def uniqueSize(self)->int:
+        """the size on the disk of all the blobs (what is really stored)"""
+        return sum((self.storage.fileSize(blobPath) or 0) for blobPath in list(self.__refCounts))
+    
+    def __blobPath(self, digest:str)->str:
+        return self.directory.joinpath(f"{self._Blob_prefix}{digest}").as_posix()
+    
+    def save(self, savingArgs:"SaveArgs", filePath:Path, obj:object)->None:
+        fileStrPath:str = filePath.as_posix()
+        useLib:"_SaveLib" = savingArgs.getSaveLib(type(obj))
+        currentBlob:"str|None" = self.__blobOf.get(fileStrPath, None)
+        if (currentBlob is not None) and _isMappedFrom(obj, currentBlob):
+            return None # => it is the (read only) array mapped from its blob
+        if useLib not in PATH_ONLY_SaveLibs:
+            buffer = io.BytesIO()
+            savingArgs.dump(buffer, obj, useLib=useLib)
+            data:memoryview = buffer.getbuffer()
+            blobPath:str = self.__blobPath(hashlib.blake2b(data, digest_size=16).hexdigest())
+            with self.__lock:
+                if blobPath not in self.__refCounts:
+                    self.storage._writeBlob(blobPath, data)
+                self.__setBlob(fileStrPath, blobPath)
+            return None
+        # => needs its own file
+        digest:"str|None" = _hashArrayBuffer(obj, tag=useLib)
+        if digest is not None:
+            # => hashed without writing it
+            blobPath = self.__blobPath(digest)
+            with self.__lock:
+                if blobPath not in self.__refCounts:
+                    self.storage.save(savingArgs, Path(blobPath), obj)
+                self.__setBlob(fileStrPath, blobPath)
+            return None
+        # => save it in a tmp file then hash the file
+        with self.__lock:
+            tmpPath = self.directory.joinpath(f"{self._Blob_prefix}tmp_{self.__nbTmpFiles}")
+            self.__nbTmpFiles += 1
+        self.storage.save(savingArgs, tmpPath, obj)
+        blobPath = self.__blobPath(_hashFile(tmpPath))
+        with self.__lock:
+            if blobPath not in self.__refCounts:
+                os.replace(tmpPath, blobPath)
+            else: self.storage.remove(tmpPath.as_posix())
+            self.__setBlob(fileStrPath, blobPath)
+    
+    def __setBlob(self, fileStrPath:str, blobPath:str)->None:
+        """make `fileStrPath` use `blobPath` and release its previous blob (must hold the lock)"""
+        self.__refCounts[blobPath] = self.__refCounts.get(blobPath, 0) + 1
+        previousBlob = self.__blobOf.get(fileStrPath, None)
+        self.__blobOf[fileStrPath] = blobPath
+        if previousBlob is not None:
+            self.__release(previousBlob)
+    
+    def __release(self, blobPath:str)->None:
+        """remove a reference to `blobPath`, remove it when unused (must hold the lock)"""
+        self.__refCounts[blobPath] -= 1
+        if self.__refCounts[blobPath] == 0:
+            self.__refCounts.pop(blobPath)
+            self.storage.remove(blobPath)
+    
+    def load(self, savingArgs:"SaveArgs", filePath:Path, objectType:"type[_T]")->"_T":
+        blobPath:"str|None" = self.__blobOf.get(filePath.as_posix(), None)
+        if blobPath is None:
+            raise FileNotFoundError(f"there is no object saved at: {filePath.as_posix()}")
+        return self.storage.load(savingArgs, Path(blobPath), objectType)
+    
+    def remove(self, fileStrPath:str)->bool:
+        if self.frozen is True:
+            return False
+        with self.__lock:
+            blobPath:"str|None" = self.__blobOf.pop(fileStrPath, None)
+            if blobPath is None:
+                return False
+            self.__release(blobPath)
+            return True
+    
+    def fileSize(self, fileStrPath:str)->"int|None":
+        """the size of the blob used by the object (it might be shared)"""
+        blobPath:"str|None" = self.__blobOf.get(fileStrPath, None)
+        if blobPath is None:
+            return None
+        return self.storage.fileSize(blobPath)
+    
+    def _writeBlob(self, fileStrPath:str, data:"bytes|memoryview")->None:
+        with self.__lock:
+            blobPath = self.__blobPath(hashlib.blake2b(data, digest_size=16).hexdigest())
+            if blobPath not in self.__refCounts:
+                self.storage._writeBlob(blobPath, data)
+            self.__setBlob(fileStrPath, blobPath)
+    
+    def _writeBlobs(self, blobs:"list[tuple[str, bytes|memoryview]]")->None:
+        blobPaths:"list[str]" = [
+            self.__blobPath(hashlib.blake2b(data, digest_size=16).hexdigest()) for (_, data) in blobs]
+        with self.__lock:
+            newBlobs:"dict[str, bytes|memoryview]" = {}
+            for (blobPath, (_, data)) in zip(blobPaths, blobs):
+                if blobPath not in self.__refCounts:
+                    newBlobs[blobPath] = data
+            self.storage._writeBlobs(list(newBlobs.items()))
+            for (blobPath, (fileStrPath, _)) in zip(blobPaths, blobs):
+                self.__setBlob(fileStrPath, blobPath)
+    
+    def _readBlob(self, fileStrPath:str)->bytes:
+        blobPath:"str|None" = self.__blobOf.get(fileStrPath, None)
+        if blobPath is None:
+            raise FileNotFoundError(f"there is no object saved at: {fileStrPath}")
+        return self.storage._readBlob(blobPath)
+    
+    def _iterBlobs(self, fileStrPaths:"list[str]")->"Iterator[tuple[str, bytes]]":
+        # => read each shared blob once
+        usersOf:"dict[str, list[str]]" = {}
+        for fileStrPath in fileStrPaths:
+            blobPath:"str|None" = self.__blobOf.get(fileStrPath, None)
+            if blobPath is None:
+                raise FileNotFoundError(f"there is no object saved at: {fileStrPath}")
+            usersOf.setdefault(blobPath, []).append(fileStrPath)
+        for (blobPath, data) in self.storage._iterBlobs(list(usersOf)):
+            for fileStrPath in usersOf[blobPath]:
+                yield (fileStrPath, data)
+    
+    def checksum(self, fileStrPath:str)->str:
+        blobPath:"str|None" = self.__blobOf.get(fileStrPath, None)
+        if blobPath is None:
+            raise FileNotFoundError(f"there is no object saved at: {fileStrPath}")
+        return self.storage.checksum(blobPath)
+    
+    def _locate(self, fileStrPath:str)->"tuple[list[str], int, int|None]":
+        blobPath:"str|None" = self.__blobOf.get(fileStrPath, None)
+        if blobPath is None:
+            raise FileNotFoundError(f"there is no object saved at: {fileStrPath}")
+        return self.storage._locate(blobPath)
+    
+    def freeze(self)->None:
+        super().freeze()
+        self.storage.freeze()
+    
+    def _getState(self, keep:"set[str]")->"dict[str, Any]":
+        with self.__lock:
+            blobOf:"dict[str, str]" = {
+                fileStrPath: self.__blobOf[fileStrPath]
+                for fileStrPath in keep if fileStrPath in self.__blobOf}
+            return {"blobOf": {Path(fileStrPath).name: Path(blobPath).name
+                               for (fileStrPath, blobPath) in blobOf.items()},
+                    "storage": self.storage._getState(set(blobOf.values()))}
+    
+    def _setState(self, state:"dict[str, Any]")->"set[str]":
+        fileNames:"set[str]" = self.storage._setState(state["storage"])
+        with self.__lock:
+            for (fileName, blobName) in state["blobOf"].items():
+                blobPath:str = self.directory.joinpath(blobName).as_posix()
+                if self.storage.fileSize(blobPath) is None:
+                    continue # => its blob was lost
+                self.__blobOf[self.directory.joinpath(fileName).as_posix()] = blobPath
+                self.__refCounts[blobPath] = self.__refCounts.get(blobPath, 0) + 1
+        return fileNames
+    
+    def close(self)->None:
+        self.storage.close()
+
+
+class _TieredStorage(_Storage):
+    """the storage of a Session that spread the objects (one file each) over tiers of directories\n
+    the objects are saved in the fastest tier that has room, when a tier exceed its capacity \
+    its least recently used objects are demoted (moved) to the next tier in the background\n
+    the objects are identified by their path in the first tier"""
+    
+    def __init__(self, directories:"list[Path]", capacities:"list[int|None]",
+            submitIO:"weakref.WeakMethod[Callable[..., Future]]|None"=None)->None:
+        """`submitIO` is used to run the demotions in the background \
+            (None or dead -> the demotions are done immediately)"""
+        super().__init__(directories[0])
+        if len(directories) != len(capacities):
+            raise ValueError(f"there must be one capacity per tier")
+        self.tiers:"list[_FilesStorage]" = [_FilesStorage(directory) for directory in directories]
+        self.capacities:"list[int|None]" = capacities
+        self.__submitIO:"weakref.WeakMethod[Callable[..., Future]]|None" = submitIO
+        self.__tierOf:"dict[str, int]" = {}
+        """fileStrPath -> index of the tier that hold the object"""
+        self.__versions:"dict[str, int]" = {}
+        """fileStrPath -> nb of times it was written (detect the changes durring a demotion)"""
+        self.__tiersObjects:"list[OrderedDict[str, int]]" = [OrderedDict() for _ in directories]
+        """per tier: fileStrPath -> size, in LRU order: the first is the least recently used"""
+        self.__usedBytes:"list[int]" = [0 for _ in directories]
+        self.__demoting:"set[int]" = set()
+        """the index of the tiers that are being demoted"""
+        self.__lock = threading.RLock()
+    
+    def tiersUsage(self)->"list[tuple[int, int|None]]":
+        """(used bytes, capacity) of each tier"""
+        return list(zip(self.__usedBytes, self.capacities))
+    
+    def tierOf(self, fileStrPath:str)->"int|None":
+        """the index of the tier that hold the object saved at `fileStrPath` (None -> not saved)"""
+        return self.__tierOf.get(fileStrPath, None)
+    
+    def __tierPath(self, tierIndex:int, fileStrPath:str)->Path:
+        return self.tiers[tierIndex].directory.joinpath(Path(fileStrPath).name)
+    
+    def __selectTier(self)->int:
+        """the fastest tier that has room (must hold the lock)"""
+        for (tierIndex, capacity) in enumerate(self.capacities):
+            if (capacity is None) or (self.__usedBytes[tierIndex] < capacity):
+                return tierIndex
+        return len(self.tiers) - 1 # => all full, use the slowest
+    
+    def __commit(self, fileStrPath:str, tierIndex:int)->None:
+        """the object was written in the tier: use it and remove the previous copy (must hold the lock)"""
+        size:int = os.path.getsize(self.__tierPath(tierIndex, fileStrPath))
+        previousTier:"int|None" = self.__tierOf.get(fileStrPath, None)
+        if previousTier is not None:
+            self.__usedBytes[previousTier] -= self.__tiersObjects[previousTier].pop(fileStrPath)
+            if previousTier != tierIndex:
+                self.tiers[previousTier].remove(self.__tierPath(previousTier, fileStrPath).as_posix())
+        self.__tierOf[fileStrPath] = tierIndex
+        self.__tiersObjects[tierIndex][fileStrPath] = size
+        self.__usedBytes[tierIndex] += size
+        self.__versions[fileStrPath] = self.__versions.get(fileStrPath, 0) + 1
+        self.__checkCapacity(tierIndex)
+    
+    def __access(self, fileStrPath:str)->int:
+        """mark the object as the most recently used and return its tier (must hold the lock)"""
+        tierIndex:"int|None" = self.__tierOf.get(fileStrPath, None)
+        if tierIndex is None:
+            raise FileNotFoundError(f"there is no object saved at: {fileStrPath}")
+        self.__tiersObjects[tierIndex].move_to_end(fileStrPath)
+        return tierIndex
+    
+    def save(self, savingArgs:"SaveArgs", filePath:Path, obj:object)->None:
+        fileStrPath:str = filePath.as_posix()
+        with self.__lock:
+            tierIndex:int = self.__selectTier()
+        # => written aside then replaced under the lock (a demotion might be moving the previous one)
+        destination:Path = self.__tierPath(tierIndex, fileStrPath)
+        tmpDestination:Path = destination.with_name(destination.name + ".saving")
+        self.tiers[tierIndex].save(savingArgs, tmpDestination, obj)
+        with self.__lock:
+            os.replace(tmpDestination, destination)
+            self.__commit(fileStrPath, tierIndex)
+    
+    def load(self, savingArgs:"SaveArgs", filePath:Path, objectType:"type[_T]")->"_T":
+        fileStrPath:str = filePath.as_posix()
+        with self.__lock:
+            tierIndex:int = self.__access(fileStrPath)
+        try: return self.tiers[tierIndex].load(
+            savingArgs, self.__tierPath(tierIndex, fileStrPath), objectType)
+        except FileNotFoundError:
+            if self.__tierOf.get(fileStrPath, None) == tierIndex:
+                raise
+        # => demoted meanwhile
+        with self.__lock:
+            tierIndex = self.__access(fileStrPath)
+        return self.tiers[tierIndex].load(
+            savingArgs, self.__tierPath(tierIndex, fileStrPath), objectType)
+    
+    def remove(self, fileStrPath:str)->bool:
+        if self.frozen is True:
+            return False
+        with self.__lock:
+            tierIndex:"int|None" = self.__tierOf.pop(fileStrPath, None)
+            if tierIndex is None:
+                return False
+            self.__usedBytes[tierIndex] -= self.__tiersObjects[tierIndex].pop(fileStrPath)
+            self.__versions.pop(fileStrPath, None)
+            return self.tiers[tierIndex].remove(self.__tierPath(tierIndex, fileStrPath).as_posix())
+    
+    def fileSize(self, fileStrPath:str)->"int|None":
+        with self.__lock:
+            tierIndex:"int|None" = self.__tierOf.get(fileStrPath, None)
+            if tierIndex is None:
+                return None
+            return self.__tiersObjects[tierIndex][fileStrPath]
+    
+    def _writeBlob(self, fileStrPath:str, data:"bytes|memoryview")->None:
+        with self.__lock:
+            tierIndex:int = self.__selectTier()
+        destination:Path = self.__tierPath(tierIndex, fileStrPath)
+        tmpDestination:Path = destination.with_name(destination.name + ".saving")
+        self.tiers[tierIndex]._writeBlob(tmpDestination.as_posix(), data)
+        with self.__lock:
+            os.replace(tmpDestination, destination)
+            self.__commit(fileStrPath, tierIndex)
+    
+    def _readBlob(self, fileStrPath:str)->bytes:
+        with self.__lock:
+            tierIndex:int = self.__access(fileStrPath)
+            # => read under the lock, it can't be demoted meanwhile
+            return self.tiers[tierIndex]._readBlob(self.__tierPath(tierIndex, fileStrPath).as_posix())
+    
+    def checksum(self, fileStrPath:str)->str:
+        with self.__lock:
+            tierIndex:int = self.__access(fileStrPath)
+            return self.tiers[tierIndex].checksum(self.__tierPath(tierIndex, fileStrPath).as_posix())
+    
+    def _locate(self, fileStrPath:str)->"tuple[list[str], int, int|None]":
+        with self.__lock:
+            tierIndex:"int|None" = self.__tierOf.get(fileStrPath, None)
+            if tierIndex is None:
+                raise FileNotFoundError(f"there is no object saved at: {fileStrPath}")
+            # => it can be demoted to the slower tiers meanwhile
+            return ([self.__tierPath(index, fileStrPath).as_posix()
+                     for index in range(tierIndex, len(self.tiers))], 0, None)
+    
+    def __checkCapacity(self, tierIndex:int)->None:
+        """schedule the demotion of the tier when it exceed its capacity (must hold the lock)"""
+        capacity:"int|None" = self.capacities[tierIndex]
+        if (capacity is None) or (self.__usedBytes[tierIndex] <= capacity) \
+                or (tierIndex == len(self.tiers) - 1):
+            return None # => fit or nowhere to demote
+        if tierIndex in self.__demoting:
+            return None # => alredy scheduled
+        self.__demoting.add(tierIndex)
+        submitIO = (None if self.__submitIO is None else self.__submitIO())
+        if submitIO is not None:
+            try: 
+                submitIO(self.demote, tierIndex)
+                return None
+            except RuntimeError: pass # => the session don't accept IO anymore
+        self.demote(tierIndex)
+    
+    def demote(self, tierIndex:int)->None:
+        """move the least recently used objects of the tier to the next one, until it fit in its capacity"""
+        try:
+            while True:
+                with self.__lock:
+                    capacity:"int|None" = self.capacities[tierIndex]
+                    if (capacity is None) or (self.__usedBytes[tierIndex] <= capacity) \
+                            or (len(self.__tiersObjects[tierIndex]) == 0):
+                        return None # => fit
+                    fileStrPath:str = next(iter(self.__tiersObjects[tierIndex]))
+                    version:int = self.__versions[fileStrPath]
+                # copy it outside of the lock (the objects stay accessible)
+                destination:Path = self.__tierPath(tierIndex + 1, fileStrPath)
+                tmpDestination:Path = destination.with_name(destination.name + ".demoting")
+                try: shutil.copyfile(self.__tierPath(tierIndex, fileStrPath), tmpDestination)
+                except FileNotFoundError:
+                    if self.__versions.get(fileStrPath, None) == version:
+                        raise
+                    continue # => removed or replaced meanwhile
+                with self.__lock:
+                    if (self.__tierOf.get(fileStrPath, None) != tierIndex) \
+                            or (self.__versions.get(fileStrPath, None) != version):
+                        # => removed or replaced meanwhile
+                        os.remove(tmpDestination)
+                        continue
+                    os.replace(tmpDestination, destination)
+                    self.__commit(fileStrPath, tierIndex + 1)
+        finally:
+            with self.__lock:
+                self.__demoting.discard(tierIndex)
+    
+    def close(self)->None:
+        if self.frozen is True:
+            return None
+        # => the session's directory (first tier) is removed by the session
+        for tier in self.tiers[1: ]:
+            SessionsCleaner._removeSessionDirectory(tier.directory)
+
+
+### Session stats
+
+class SessionStats():
+    """the stats of a Session: sizes, save/load latencies, reloads and compression ratios\n
+    the latencies are mesured in a Profiler, with a category per (operation, saveLib, compLib) \
+    named "<prefix>save|<saveLib>|<compLib>" | "<prefix>load|<saveLib>|<compLib>" \
+    (compLib is "none" when not compressed), the categories are added when first used"""
+    __slots__ = ("profiler", "prefix", "nbHits", "nbReloads", "reloadsPerType", 
+                 "compressionSizes", "__session", "__lock", )
+    
+    def __init__(self, session:"Session", profiler:"Profiler[Any]|None"=None, prefix:str="")->None:
+        """`profiler` -> None: use its own Profiler, otherwise add the categories to it"""
+        self.profiler:"Profiler[Any]" = (
+            Profiler([], historyMaxSize=STATS_HISTORY_SIZE) if profiler is None else profiler)
+        self.prefix:str = prefix
+        """the prefix of its categories in the profiler"""
+        self.nbHits:int = 0
+        """the number of accesses to ObjectSaver.value that didn't need a load"""
+        self.nbReloads:int = 0
+        """the number of accesses to ObjectSaver.value that needed a load"""
+        self.reloadsPerType:"dict[type, int]" = {}
+        self.compressionSizes:"dict[tuple[_SaveLib, _CompressionLib|None], tuple[int, int]]" = {}
+        """(saveLib, compLib) -> (estimated size in memory, size on the disk) of all the saves"""
+        self.__session:"weakref.ref[Session]" = weakref.ref(session)
+        self.__lock = threading.Lock()
+    
+    def category(self, operation:"Literal['save', 'load']", 
+                 saveLib:"_SaveLib", compLib:"_CompressionLib|None")->str:
+        return f"{self.prefix}{operation}|{saveLib}|{'none' if compLib is None else compLib}"
+    
+    def __addMesure(self, category:str, latency:float)->None:
+        """must hold the lock"""
+        if self.profiler.isCategorie(category) is False:
+            self.profiler.extendCategories([category], inplace=True)
+        self.profiler.addManualMesure(category, latency)
+    
+    def _recordSave(self, saveLib:"_SaveLib", compLib:"_CompressionLib|None",
+            latency:float, rawSize:int, diskSize:int)->None:
+        with self.__lock:
+            self.__addMesure(self.category("save", saveLib, compLib), latency)
+            (totalRaw, totalDisk) = self.compressionSizes.get((saveLib, compLib), (0, 0))
+            self.compressionSizes[(saveLib, compLib)] = (totalRaw + rawSize, totalDisk + diskSize)
+    
+    def _recordLoad(self, saveLib:"_SaveLib", compLib:"_CompressionLib|None", latency:float)->None:
+        with self.__lock:
+            self.__addMesure(self.category("load", saveLib, compLib), latency)
+    
+    def _recordAccess(self, objectType:type, reloaded:bool)->None:
+        with self.__lock:
+            if reloaded is False:
+                self.nbHits += 1
+                return None
+            self.nbReloads += 1
+            self.reloadsPerType[objectType] = self.reloadsPerType.get(objectType, 0) + 1
+    
+    @property
+    def hitRate(self)->float:
+        """the part of the accesses to ObjectSaver.value that didn't need a load"""
+        return self.nbHits / max(1, self.nbHits + self.nbReloads)
+    
+    @property
+    def residentBytes(self)->int:
+        """the estimated size of the loaded objects of the session"""
+        session = self.__session()
+        return (0 if session is None else session.residentBytes)
+    
+    @property
+    def diskBytes(self)->int:
+        """the size on the disk of the saved objects of the session"""
+        session = self.__session()
+        return (0 if session is None else session.diskBytes())
+    
+    def compressionRatios(self)->"dict[tuple[_SaveLib, _CompressionLib|None], float]":
+        """(saveLib, compLib) -> the estimated size in memory / the size on the disk"""
+        with self.__lock:
+            return {key: (rawSize / max(1, diskSize))
+                    for (key, (rawSize, diskSize)) in self.compressionSizes.items()}
+    
+    def latencyHistogram(self, category:str)->"dict[float, int]":
+        """the latencies (in sec) kept by the profiler for the `category`, by buckets: \
+        upper bound of the bucket -> nb of latencies (the bounds are STATS_MIN_LATENCY * 2**k)"""
+        with self.__lock:
+            if (self.profiler.isCategorie(category) is False) \
+                    or (self.profiler.hasMesureStored(category) is False):
+                return {}
+            latencies:"list[float]" = self.profiler.allMesure(category)
+        histogram:"dict[float, int]" = {}
+        for latency in latencies:
+            exponent:int = max(0, math.ceil(math.log2(max(latency, STATS_MIN_LATENCY) / STATS_MIN_LATENCY)))
+            upperBound:float = STATS_MIN_LATENCY * 2**exponent
+            histogram[upperBound] = histogram.get(upperBound, 0) + 1
+        return dict(sorted(histogram.items()))
+    
+    def summary(self)->"dict[str, Any]":
+        """all the stats (the latencies are summarized by their average)"""
+        with self.__lock:
+            avgLatencies:"dict[str, float]" = {
+                category: latency for (category, latency) in self.profiler.avgTimes().items()
+                if category.startswith(self.prefix)}
+        return {"residentBytes": self.residentBytes, "diskBytes": self.diskBytes,
+                "nbHits": self.nbHits, "nbReloads": self.nbReloads, "hitRate": self.hitRate,
+                "reloadsPerType": dict(self.reloadsPerType),
+                "compressionRatios": self.compressionRatios(),
+                "avgLatencies": avgLatencies}
+
+
 ### Session definition
 
 class SessionsCleaner(threading.Thread):
+    """keep the live sessions of the process in the registry and remove the stale sessions\n
+    each live session has an entry in the registry (named with the host and the PID of its process), \
+    its heartbeat is the modification time of the entry\n
+    a session is stale when its process is dead (same host) or when its heartbeat \
+    is older than SESSION_DELETE_AFTER, only the entries of the registry are inspected\n
+    the objects of the sessions are cleaned by their finalizers (no periodic GC)"""
+    
     def __init__(self, start:bool=False) -> None:
         super().__init__(daemon=True)
-        self.__paused:bool = False
+        self.__unpaused = threading.Event()
+        self.__unpaused.set()
+        self.__wakeUp = threading.Event()
+        """set it to do a pass now"""
         # TODO: sys d'historique des acctions
         # => no print mais quand meme accesible
         if start is True:
             self.start()
     
+    ### registry
+    
+    @staticmethod
+    def _registryDirectory()->Path:
+        return SAVEMODULE_DIRECTORY.joinpath(REGISTRY_DIRNAME)
+    
+    def register(self, session:"Session")->Path:
+        """add the entry of the `session` in the registry and return its path"""
+        registry:Path = self._registryDirectory()
+        registry.mkdir(parents=True, exist_ok=True)
+        entryPath:Path = registry.joinpath(f"{_HOST_TAG}_{os.getpid()}_{os.urandom(6).hex()}")
+        with open(entryPath, mode="w") as entryFile:
+            # => one directory per line (the first is the session's directory)
+            entryFile.write("\n".join(
+                directory.absolute().as_posix() for directory in session.directories))
+        return entryPath
+    
+    def heartbeat(self, entryPath:Path)->None:
+        """mark the session of the entry as alive"""
+        try: os.utime(entryPath)
+        except FileNotFoundError: pass # => was removed meanwhile (stale for too long)
+    
+    def unregister(self, entryPath:Path)->None:
+        cleanFile_if_exist(entryPath.as_posix())
+    
+    @staticmethod
+    def __isProcessDead(hostTag:str, pid:int)->bool:
+        """whether the process is known to be dead (only determinable on the same host)"""
+        if (hostTag != _HOST_TAG) or (sys.platform == "win32"):
+            return False # => rely on the heartbeat (os.kill(pid, 0) would send a signal on windows)
+        try: os.kill(pid, 0)
+        except ProcessLookupError: return True
+        except PermissionError: return False # => exist but owned by an other user
+        return False
+    
+    def clean_stale_sessions(self)->int:
+        """remove the stale sessions of the registry, return the number of sessions removed"""
+        registry:Path = self._registryDirectory()
+        if registry.exists() is False:
+            return 0
+        nbRemoved:int = 0
+        now:float = time.time()
+        with os.scandir(registry) as entries:
+            for entry in entries:
+                if entry.name.startswith("claimed."):
+                    continue # => being removed by an other cleaner
+                try:
+                    (hostTag, pidStr, _) = entry.name.split("_", maxsplit=2)
+                    pid:int = int(pidStr)
+                except ValueError: continue # => not an entry
+                if (hostTag == _HOST_TAG) and (pid == os.getpid()):
+                    continue # => sessions of this process
+                try: isStale:bool = self.__isProcessDead(hostTag, pid) \
+                        or ((now - entry.stat().st_mtime) > SESSION_DELETE_AFTER)
+                except FileNotFoundError: continue # => removed meanwhile
+                if (isStale is True) and self.__removeStaleEntry(Path(entry.path)):
+                    nbRemoved += 1
+        return nbRemoved
+    
+    def __removeStaleEntry(self, entryPath:Path)->bool:
+        """remove the session of the entry (its directory is kept when it is persistent)"""
+        # => claim the entry (only one process will succeed)
+        claimedPath:Path = entryPath.with_name(f"claimed.{os.getpid()}.{entryPath.name}")
+        try: os.rename(entryPath, claimedPath)
+        except FileNotFoundError: return False # => claimed by an other process
+        try:
+            with open(claimedPath, mode="r") as entryFile:
+                sessionDirPaths:"list[Path]" = [
+                    Path(line) for line in entryFile.read().splitlines() if line != ""]
+            if (len(sessionDirPaths) == 0) \
+                    or sessionDirPaths[0].joinpath(FILENAME_SESSION_MANIFEST).exists():
+                return False # => persistent session, only deleted explicitly
+            for sessionDirPath in sessionDirPaths:
+                self._removeSessionDirectory(sessionDirPath)
+            return True
+        finally:
+            try: os.remove(claimedPath)
+            except FileNotFoundError: pass # => alredy removed
+    
+    @staticmethod
+    def _removeSessionDirectory(sessionDirPath:Path)->None:
+        if sessionDirPath.is_dir() is False:
+            return None # => alredy removed
+        # => an other process might be removing it too
+        try:
+            for sessionsFiles in sessionDirPath.iterdir():
+                try: os.remove(sessionsFiles)
+                except FileNotFoundError: pass
+            sessionDirPath.rmdir()
+        except FileNotFoundError: pass
+    
+    ### legacy cleaning (the sessions without registry)
+    
     def clean_old_sessions(self, directorys:"list[Path]")->None:
+        """remove the sessions whose file `session.txt` is too old (scan all the sessions directories)\n
+        only done when the cleaner starts, for the sessions that aren't in the registry"""
         for directory in (directorys + [SAVEMODULE_DIRECTORY]):
+            if directory.exists() is False:
+                continue # => nothing to clean
             for sessionDirPath in directory.iterdir():
                 #print(f"treating: {sessionDirPath.as_posix()} ...", end=None)
                 if sessionDirPath.is_dir() is False:
@@ -148,15 +1422,15 @@ class SessionsCleaner(threading.Thread):
                     #print(f" => FileNotFoundError")
                     continue # => no session file => not a session or not yet created
                 
+                if sessionDirPath.joinpath(FILENAME_SESSION_MANIFEST).exists():
+                    continue # => persistent session, only deleted explicitly
+                
                 # read the session's file
                 sessionLastUpdate:float = float(sessionFile_content)
                 if (time.time() - sessionLastUpdate) > SESSION_DELETE_AFTER:
                     #print(f" => cleaning it")
                     # => session is too old => delete it
-                    for sessionsFiles in sessionDirPath.iterdir():
-                        #print(f" -> removing {sessionsFiles.name}")
-                        os.remove(sessionsFiles)
-                    sessionDirPath.rmdir()
+                    self._removeSessionDirectory(sessionDirPath)
                 else: # => not old enough to be deleted
                     continue
     
@@ -165,36 +1439,37 @@ class SessionsCleaner(threading.Thread):
             self.start()
     
     def pause(self)->None:
-        self.__paused = True
+        self.__unpaused.clear()
     def unpause(self)->None:
-        self.__paused = False
+        self.__unpaused.set()
+    
+    def wakeUp(self)->None:
+        """do a pass now (heartbeat of the sessions and cleaning of the stale ones)"""
+        self.__wakeUp.set()
     
     def run(self)->None:
+        try: self.clean_old_sessions([])
+        except Exception as err:
+            print("an error happened durring the cleaning of the old sessions")
+            print_exception(err)
         while True:
             try:
-                while self.__paused is True:
-                    print("here paused")
-                    time.sleep(0.1) # => sleep a few moments
-                
-                # => update each session
-                sessionsHolderDirs:"list[Path]" = []
+                self.__unpaused.wait()
+                # => heartbeat of each session
                 session:"Session|None"
-                for sessionRef in Session.sessionsHierarchy:
+                for sessionRef in list(Session.sessionsHierarchy):
                     session = sessionRef()
                     if (session is None) or (session.wasCleaned is True):
                         continue # => session is dead
-                    # => updating the session
                     session.update_session()
-                    session.clean_forgoten_objects()
-                    sessionsHolderDirs.append(session.directory.parent)
-                self.clean_old_sessions(sessionsHolderDirs)
-                del sessionsHolderDirs
-                time.sleep(SESSION_UPDATE_AFTER) # update every
-
+                session = None # => don't keep the last session alive
+                self.clean_stale_sessions()
             except Exception as err:
                 # => don't stop on errors
                 print("an error happened durring update")
                 print_exception(err)
+            self.__wakeUp.wait(SESSION_UPDATE_AFTER) # update every
+            self.__wakeUp.clear()
 
 
 
@@ -210,23 +1485,108 @@ class Session():
     def __init__(self,
             location:"Path|None"=None, dirName:"None|str"=None, 
             name:"str|None"=None, savingArgs:"SaveArgs|None"=None,
-            verbose:"_Verbose"=0)->None:
+            verbose:"_Verbose"=0, maxResidentBytes:"int|None"=None,
+            nbIOWorkers:int=2, storage:"_StorageKind"="files", dedup:bool=False,
+            persistent:bool=False, stats:"bool|Profiler[Any]"=False,
+            tiers:"list[_Tier]|None"=None, _reopen:bool=False)->None:
+        """`maxResidentBytes`: int -> when the estimated size of the loaded objects \
+            exceed it, the least recently used ones are saved (they will be \
+            reloaded when accessed), None -> only save/load when asked to\n
+        `nbIOWorkers` is the number of threads used by the async saves/loads \
+            (they are only created when needed)\n
+        `storage` is how the saved objects are stored (see _StorageKind)\n
+        `dedup` is whether the identical payloads are only stored once \
+            (cost a hash of each payload, see _DedupStorage)\n
+        `persistent` is whether the named DictSavers of the session are kept \
+            on the disk when it is closed (see .close() and Session.reopen(...))\n
+        `stats` -> True: collect stats in .stats (see SessionStats), False: no stats, \
+            Profiler: also collect them but put the latencies in this profiler \
+            (the categories are prefixed by the name of the session)\n
+            /!\\ the stats (like a budget) estimate the size of each loaded object \
+            on every access that (re)load or set it, keep them off for the many small objects\n
+        `tiers` -> None: all the objects are saved in the session's directory, \
+            list: the tiers of the storage, from the fastest to the slowest, \
+            the session's directory is in the first one (replace `location`), \
+            only with the "files" storage, without dedup and not persistent (see _TieredStorage)\n
+        `_reopen` is internal (use the existing directory)"""
+        if tiers is not None:
+            if len(tiers) == 0:
+                raise ValueError(f"tiers must have at least one tier")
+            if (storage != "files") or (dedup is True) or (persistent is True):
+                raise ValueError(f"the tiers are only supported by the \"files\" storage "
+                                 f"(without dedup and not persistent)")
+            location = tiers[0][0]
         Session.sessionsCleaner._firstStart()
         self.__name:str = Session.__getNewName(name)
-        self.__directory:Path = \
-            self.__create_session_directory(location=location, dirName=dirName)
+        self.__directory:Path = self.__create_session_directory(
+            location=location, dirName=dirName, existOk=_reopen)
+        self.__tiersDirectories:"list[Path]" = [self.__directory]
+        """the directories of the session in each tier"""
+        for (tierLocation, _) in (tiers or [])[1: ]:
+            tierLocation.mkdir(parents=True, exist_ok=True)
+            self.__tiersDirectories.append(tierLocation.joinpath(self.__directory.name))
+            self.__tiersDirectories[-1].mkdir(exist_ok=False)
         self.verbose:"_Verbose" = verbose # TODO: use it 
+        self.storage:"_Storage"
+        if tiers is not None:
+            self.storage = _TieredStorage(
+                self.__tiersDirectories, capacities=[capacity for (_, capacity) in tiers],
+                submitIO=weakref.WeakMethod(self.submitIO))
+        elif storage == "files":
+            self.storage = _FilesStorage(self.__directory)
+        elif storage == "pack":
+            self.storage = _PackStorage(
+                self.__directory, submitIO=weakref.WeakMethod(self.submitIO))
+        else: raise ValueError(f"the storage: {storage!r} isn't supported")
+        if dedup is True:
+            self.storage = _DedupStorage(self.storage)
+        self.__storageKind:"_StorageKind" = storage
+        self.__dedup:bool = dedup
+        self.persistent:bool = persistent
+        self.__persistedDicts:"weakref.WeakValueDictionary[str, DictSaver]" = weakref.WeakValueDictionary()
+        """the named DictSavers that are persisted"""
+        if persistent is True:
+            # => save them before the exit (the dicts are still alive)
+            atexit.register(Session._closeAtExit, weakref.ref(self))
         self.__tracked_objects:"dict[str, weakref.finalize]" = {}
         self.objects_count:int = 0
         """total abount of tracked object (during lifetime)"""
         if savingArgs is None:
             savingArgs = SaveArgs(compression=None, methode="allwaysPickle")
         self.savingArgs:"SaveArgs" = savingArgs
+        if (maxResidentBytes is not None) and (maxResidentBytes < 0):
+            raise ValueError(f"maxResidentBytes must be positive, got: {maxResidentBytes}")
+        self.maxResidentBytes:"int|None" = maxResidentBytes
+        """the budget of the loaded objects (in bytes) | None -> no budget"""
+        self.__residents:"OrderedDict[str, tuple[weakref.ref[ObjectSaver], int]]" = OrderedDict()
+        """the loaded objects (when there is a budget) with their estimated size, \
+        in LRU order: the first is the least recently used"""
+        self.__residentBytes:int = 0
+        self.__residentsLock = threading.RLock()
+        self.__spilling:"set[str]" = set()
+        """the loaded objects being saved by the budget (modified with the residents lock)"""
+        self.__unspillable:"set[str]" = set()
+        """the loaded objects that failed to be saved by the budget, they aren't retried \
+        until they are registered again (modified with the residents lock)"""
+        if nbIOWorkers <= 0:
+            raise ValueError(f"nbIOWorkers must be at least 1, got: {nbIOWorkers}")
+        self.nbIOWorkers:int = nbIOWorkers
+        self.__ioExecutor:"ThreadPoolExecutor|None" = None
+        """the threads that do the async saves/loads (created on the first use)"""
+        self.__ioExecutorLock = threading.Lock()
+        self.__ioThreadsPrefix:str = f"SaveModuleIO({self.__name})"
+        self.stats:"SessionStats|None" = None
+        if stats is True:
+            self.stats = SessionStats(self)
+        elif stats is not False:
+            self.stats = SessionStats(self, profiler=stats, prefix=f"{self.__name}|")
         
         # => bind the session
         Session.bindSession(self)
         self.__cleanedSession:bool = False
         """when True => the Session is unusable (debinded and files migth be cleaned)"""
+        self.__registryEntry:"Path|None" = Session.sessionsCleaner.register(self)
+        """its entry in the registry of the live sessions (None -> unregistered)"""
         self.update_session()
 
     @classmethod
@@ -277,12 +1637,27 @@ class Session():
     def directory(self)->Path:
         return self.__directory
     
+    @property
+    def directories(self)->"list[Path]":
+        """the directories of the session (the first is its directory, then one per additional tier)"""
+        return list(self.__tiersDirectories)
+    
+    @property
+    def residentBytes(self)->int:
+        """the estimated size of the loaded objects (only tracked when there is a budget or stats)"""
+        return self.__residentBytes
+    
+    def diskBytes(self)->int:
+        """the size on the disk of the saved objects (the shared blobs are counted for each object)"""
+        return sum((self.storage.fileSize(fileStrPath) or 0)
+                   for fileStrPath in list(self.__tracked_objects))
+    
     def __create_session_directory(self,
-            location:"Path|None"=None, dirName:"None|str"=None)->Path:
+            location:"Path|None"=None, dirName:"None|str"=None, existOk:bool=False)->Path:
         if location is None:
             location = SAVEMODULE_DIRECTORY
         if location.exists() is False:
-            location.mkdir()
+            location.mkdir(parents=True)
         if dirName is None:
             dirName = get_unique_name(
                 location, onlyNumbers=False, nbCharacters=8, guidlike=True,
@@ -292,40 +1667,150 @@ class Session():
         directory = location.joinpath(dirName)
     
         # check the path and create the directory if needed
-        if directory.exists() is True:
+        if (directory.exists() is True) and (existOk is False):
             raise FileExistsError(f"the selected session at {repr(directory.as_posix())} alredy exist")
         directory.mkdir(exist_ok=True)
         return directory
     
     
-    def track_object(self, obj:"ObjectSaver")->None:
+    def track_object(self, obj:"ObjectSaver|ArraySaver")->None:
         """copy the tmp_file_path to leave no reference"""
         if self.wasCleaned is True:
             raise RuntimeError(f"the session was cleaned, don't accept new objects")
         objFileStrPath = obj.filePath.as_posix() # not a ref to obj
         object_finalizer = weakref.finalize(
-            obj, cleanFile_if_exist, objFileStrPath,
+            obj, _forgetObject, self.storage, self.__tracked_objects,
+            objFileStrPath, obj._storedFiles(),
         )
+        # the persisted objects must stay on the disk at the exit
+        object_finalizer.atexit = (self.persistent is False)
         self.__tracked_objects[objFileStrPath] = object_finalizer
         # => tracking it
+        if obj.isSaved() is False:
+            self._registerResident(obj)
 
-    def untrack_object(self, obj:"ObjectSaver")->bool:
+    def untrack_object(self, obj:"ObjectSaver|ArraySaver")->bool:
         """clean the return false if the object was not tracked, only un-track"""
         # don't disable when was cleaned, is is still safe to use
         fileStrPath:str = obj.filePath.as_posix()
+        self._unregisterResident(obj)
         finalizer:"weakref.finalize|None" = self.__tracked_objects.get(fileStrPath, None)
         if finalizer is not None: # => objetc is tracked, clean it and un-track
             if finalizer.alive is True:
                 finalizer() 
-                # => file cleaned
+                # => file cleaned and object untracked
             else:
-                cleanFile_if_exist(fileStrPath)
-                self.__tracked_objects.pop(fileStrPath)
+                self.storage.remove(fileStrPath)
+                self.__tracked_objects.pop(fileStrPath, None)
                 # => object untracked
             return True
         # => not tracked
         return False
 
+    def _registerResident(self, obj:"ObjectSaver", enforce:bool=True)->None:
+        """(re)register the `obj` as loaded and most recently used, \
+        then save the least recently used objects if the budget is exceeded (when `enforce`)\n
+        do nothing when the session has no budget and no stats"""
+        if (self.maxResidentBytes is None) and (self.stats is None):
+            return None
+        objSize:int = obj._residentSize()
+        with self.__residentsLock:
+            fileStrPath:str = obj.filePath.as_posix()
+            oldEntry = self.__residents.pop(fileStrPath, None)
+            if oldEntry is not None:
+                self.__residentBytes -= oldEntry[1]
+            self.__unspillable.discard(fileStrPath) # => its new value might be saveable
+            self.__residents[fileStrPath] = (weakref.ref(obj), objSize)
+            self.__residentBytes += objSize
+        if enforce is True:
+            self.enforceBudget(keep=obj)
+    
+    def _touchResident(self, obj:"ObjectSaver")->None:
+        """mark the `obj` as the most recently used (do nothing when it isn't registered)"""
+        if self.maxResidentBytes is None:
+            return None
+        with self.__residentsLock:
+            fileStrPath:str = obj.filePath.as_posix()
+            if fileStrPath in self.__residents:
+                self.__residents.move_to_end(fileStrPath)
+    
+    def _unregisterResident(self, obj:"ObjectSaver")->None:
+        """the `obj` isn't loaded anymore (do nothing when it isn't registered)"""
+        with self.__residentsLock:
+            entry = self.__residents.pop(obj.filePath.as_posix(), None)
+            if entry is not None:
+                self.__residentBytes -= entry[1]
+            self.__unspillable.discard(obj.filePath.as_posix())
+    
+    def enforceBudget(self, keep:"ObjectSaver|None"=None)->int:
+        """save the least recently used objects until the loaded objects fit in the budget\n
+        `keep` is an object that must not be saved (ie. the one that is being accessed)\n
+        the objects in use (inside their `with`) are never saved\n
+        each object is claimed by a single caller (it can be called from many threads), \
+        the objects that fail to be saved stay counted but aren't retried until they are set or loaded again\n
+        return the number of objects that got saved"""
+        if self.maxResidentBytes is None:
+            return 0
+        nbSaved:int = 0
+        while True:
+            # => select the least recently used object that can be saved
+            victim:"ObjectSaver|None" = None
+            with self.__residentsLock:
+                if self.__residentBytes <= self.maxResidentBytes:
+                    break # => fit in the budget
+                for (fileStrPath, (objRef, objSize)) in list(self.__residents.items()):
+                    obj = objRef()
+                    if obj is None:
+                        # => dead object, its file will be cleaned by its finalizer
+                        self.__residents.pop(fileStrPath)
+                        self.__residentBytes -= objSize
+                        continue
+                    if (obj is keep) or obj.isPinned() or obj.isInFlight() \
+                            or (fileStrPath in self.__spilling) or (fileStrPath in self.__unspillable):
+                        # => in use, alredy being saved/loaded or failed to be saved
+                        continue
+                    victim = obj
+                    self.__spilling.add(fileStrPath) # => claim it
+                    break
+            if victim is None:
+                break # => nothing more can be saved
+            # save it outside of the lock (it will un-register itself)
+            victimStrPath:str = victim.filePath.as_posix()
+            try:
+                victim.save()
+                nbSaved += 1
+            except Exception as err:
+                # => don't retry it on each access (it stays counted)
+                print(f"/!\\ failed to save {victim} in order to respect the budget")
+                print_exception(err)
+                with self.__residentsLock:
+                    if victimStrPath in self.__residents:
+                        self.__unspillable.add(victimStrPath)
+            finally:
+                with self.__residentsLock:
+                    self.__spilling.discard(victimStrPath)
+        return nbSaved
+
+    def submitIO(self, func:"Callable[..., _T]", *args, **kwargs)->"Future[_T]":
+        """execute `func(*args, **kwargs)` in the session's IO threads"""
+        if self.wasCleaned is True:
+            raise RuntimeError(f"the session was cleaned, don't accept new IO")
+        with self.__ioExecutorLock:
+            if self.__ioExecutor is None:
+                self.__ioExecutor = ThreadPoolExecutor(
+                    max_workers=self.nbIOWorkers,
+                    thread_name_prefix=self.__ioThreadsPrefix)
+            return self.__ioExecutor.submit(func, *args, **kwargs)
+    
+    def __shutdownIO(self)->None:
+        """wait for the IO that are still running and stop the IO threads"""
+        with self.__ioExecutorLock:
+            if self.__ioExecutor is not None:
+                # can't wait when called from one of the IO threads (it would join itself)
+                fromIOThread:bool = threading.current_thread().name.startswith(self.__ioThreadsPrefix)
+                self.__ioExecutor.shutdown(wait=(fromIOThread is False))
+                self.__ioExecutor = None
+
     def allocate_unique_id(self)->int:
         if self.wasCleaned is True:
             raise RuntimeError(f"the session was cleaned, don't accept new objects")
@@ -333,26 +1818,37 @@ class Session():
         return self.objects_count - 1
 
     def update_session(self)->None:
+        """the heartbeat of the session"""
         if self.wasCleaned is True:
             raise RuntimeError(f"the session was cleaned, can't be re-updated")
+        # NOTE: still written for the cleaners that don't use the registry
         with open(self.directory.joinpath(FILENAME_SESSION_INFOS), mode="w") as sessionFile:
             sessionFile.write(f"{time.time():.03f}")
             sessionFile.flush()
-
-
-
-    def clean_forgoten_objects(self)->None:
+        if self.__registryEntry is not None:
+            Session.sessionsCleaner.heartbeat(self.__registryEntry)
+
+    def __unregister(self)->None:
+        if self.__registryEntry is not None:
+            Session.sessionsCleaner.unregister(self.__registryEntry)
+            self.__registryEntry = None
+
+    def clean_forgoten_objects(self, collect:bool=False)->None:
+        """the objects are normaly cleaned by their finalizer when they die\n
+        `collect` is whether to run the garbage collector before \
+        (to clean the objects that are in dead reference cycles)"""
         # don't disable when was cleaned, is is still safe to use
-        gc.collect()
+        if collect is True:
+            gc.collect()
         items_to_pop:"list[str]" = []
         # clean the object un-tracked
-        for (file_path, object_finalizer) in self.__tracked_objects.items():
+        for (file_path, object_finalizer) in list(self.__tracked_objects.items()):
             if object_finalizer.alive is False:
-                cleanFile_if_exist(file_path)
+                self.storage.remove(file_path)
                 items_to_pop.append(file_path)
         # un-track the objects
         for file_path in items_to_pop:
-            self.__tracked_objects.pop(file_path)
+            self.__tracked_objects.pop(file_path, None)
             # => proped forgoten object
 
     def __debindSession(self)->None:
@@ -393,6 +1889,9 @@ class Session():
          - try to remove the directory (silent if showFilesError is False)\n
          - debind the session of Session and replace the mainSession (if needed)"""
         self.clean_forgoten_objects()
+        if len(self.__tracked_objects) != 0:
+            # => maybe some are in dead reference cycles
+            self.clean_forgoten_objects(collect=True)
         if len(self.__tracked_objects) != 0:
             # => tracked objects remaining
             raise RuntimeError(
@@ -403,7 +1902,11 @@ class Session():
         if self.wasCleaned is True:
             return None # => alredy cleaned and unbind
         
+        self.__shutdownIO()
+        self.__unregister()
+        self.storage.close()
         try:
+            cleanFile_if_exist(self.directory.joinpath(FILENAME_SESSION_MANIFEST).as_posix())
             os.remove(self.directory.joinpath(FILENAME_SESSION_INFOS))
             self.directory.rmdir()
         except (OSError, FileNotFoundError) as err:
@@ -415,6 +1918,128 @@ class Session():
         self.__cleanedSession = True
         
 
+    ### persistent sessions
+    
+    def _registerDictSaver(self, name:str, dictSaver:"DictSaver")->None:
+        """persist the `dictSaver` under the `name` (see .checkpoint())"""
+        if self.persistent is False:
+            raise ValueError(f"only the persistent sessions can persist a DictSaver")
+        if name in self.__persistedDicts:
+            raise ValueError(f"the name: {name!r} is alredy used by a DictSaver of the session")
+        self.__persistedDicts[name] = dictSaver
+    
+    def checkpoint(self, batched:bool=True)->None:
+        """save the persisted DictSavers (their values get unloaded) and \
+        write the manifest of their entries (only for a persistent session)\n
+        after a crash, the session can be reopened at its last checkpoint\n
+        `batched` is whether to save them with .saveBatch() (the threads can't be used at the exit)"""
+        if self.persistent is False:
+            raise RuntimeError(f"only the persistent sessions have a manifest")
+        if self.wasCleaned is True:
+            raise RuntimeError(f"the session was cleaned, can't write its manifest")
+        dictsEntries:"dict[str, list[ManifestEntry]]" = {}
+        for (dictName, dictSaver) in list(self.__persistedDicts.items()):
+            if batched is True:
+                dictSaver.saveBatch()
+            else: dictSaver.save()
+            dictsEntries[dictName] = dictSaver._manifestEntries()
+        keep:"set[str]" = {
+            self.directory.joinpath(entry.fileName).as_posix()
+            for entries in dictsEntries.values() for entry in entries}
+        manifest:"dict[str, Any]" = {
+            "version": MANIFEST_VERSION, "name": self.__name,
+            "savingArgs": self.savingArgs, "storage": self.__storageKind,
+            "dedup": self.__dedup, "storageState": self.storage._getState(keep),
+            "objectsCount": self.objects_count, "dicts": dictsEntries}
+        # => write it aside then replace, a crash don't corrupt the previous one
+        manifestPath:Path = self.directory.joinpath(FILENAME_SESSION_MANIFEST)
+        tmpPath:Path = manifestPath.with_name(manifestPath.name + ".tmp")
+        with open(tmpPath, mode="wb") as file:
+            pickle.dump(manifest, file, protocol=-1)
+        os.replace(tmpPath, manifestPath)
+    
+    def close(self, batched:bool=True)->None:
+        """stop the persistent session and keep its directory (reopen it with Session.reopen(...))\n
+        the persisted DictSavers are saved, the other objects of the session are removed\n
+        `batched` -> see .checkpoint(...)"""
+        if self.persistent is False:
+            raise RuntimeError(f"only the persistent sessions can be closed, use .clear()")
+        if self.wasCleaned is True:
+            return None # => alredy closed
+        persisted:"set[str]" = {
+            objSaver.filePath.as_posix() for dictSaver in list(self.__persistedDicts.values())
+            for objSaver in dictSaver._objectSavers()}
+        for fileStrPath in list(self.__tracked_objects):
+            if fileStrPath not in persisted:
+                self.storage.remove(fileStrPath)
+        self.checkpoint(batched=batched)
+        self.__shutdownIO()
+        self.__unregister()
+        self.storage.freeze()
+        self.storage.close()
+        self.__debindSession()
+        self.__cleanedSession = True
+    
+    @staticmethod
+    def _closeAtExit(sessionRef:"weakref.ref[Session]")->None:
+        session = sessionRef()
+        if (session is not None) and (session.wasCleaned is False):
+            # the executors don't accept new tasks at this point
+            session.close(batched=False)
+    
+    @classmethod
+    def reopen(cls, directory:Path, name:"str|None"=None, verify:"_VerifyLevel"="size",
+            maxResidentBytes:"int|None"=None, nbIOWorkers:int=2,
+            )->"tuple[Session, dict[str, DictSaver]]":
+        """reopen the persistent session at `directory` from its manifest \
+        (written by .close() or the last .checkpoint())\n
+        no payload is readed (unless `verify` is "checksum"), the values are loaded when accessed\n
+        the entries that fail the `verify` are dropped\n
+        `name` -> None: the name of the closed session\n
+        return the session and its persisted DictSavers (by name)"""
+        with open(directory.joinpath(FILENAME_SESSION_MANIFEST), mode="rb") as file:
+            manifest:"dict[str, Any]" = pickle.load(file)
+        if manifest["version"] != MANIFEST_VERSION:
+            raise ValueError(f"unsupported manifest version: {manifest['version']}")
+        session = Session(
+            location=directory.parent, dirName=directory.name,
+            name=(manifest["name"] if name is None else name),
+            savingArgs=manifest["savingArgs"], maxResidentBytes=maxResidentBytes,
+            nbIOWorkers=nbIOWorkers, storage=manifest["storage"], dedup=manifest["dedup"],
+            persistent=True, _reopen=True)
+        liveFiles:"set[str]" = session.storage._setState(manifest["storageState"])
+        session.objects_count = max(session.objects_count, manifest["objectsCount"])
+        dictSavers:"dict[str, DictSaver]" = {}
+        nbDropped:int = 0
+        for (dictName, entries) in manifest["dicts"].items():
+            validEntries:"list[ManifestEntry]" = []
+            for entry in entries:
+                if session.__isValidEntry(entry, verify):
+                    validEntries.append(entry)
+                else: # => drop it
+                    session.storage.remove(session.directory.joinpath(entry.fileName).as_posix())
+                    nbDropped += 1
+            dictSavers[dictName] = DictSaver._reopen(session, dictName, validEntries)
+        if nbDropped != 0:
+            print(f"/!\\ {nbDropped} entries of the session at {directory.as_posix()} "
+                  f"failed the verification ({verify}), they were dropped")
+        # remove the files of the objects that weren't persisted
+        for filePath in directory.iterdir():
+            if filePath.name.startswith("__SaveModule") and (filePath.name not in liveFiles):
+                os.remove(filePath)
+        return (session, dictSavers)
+    
+    def __isValidEntry(self, entry:"ManifestEntry", verify:"_VerifyLevel")->bool:
+        fileStrPath:str = self.directory.joinpath(entry.fileName).as_posix()
+        if verify == "none":
+            return True
+        if self.storage.fileSize(fileStrPath) != entry.size:
+            return False
+        if verify == "checksum":
+            return (self.storage.checksum(fileStrPath) == entry.checksum)
+        return True
+    
+
     def __del__(self)->None:
         """all objects of this session must be be dead\n
         try to clean the directory (silence common files exceptions)"""
@@ -428,28 +2053,423 @@ class Session():
 
 
 
+### compression streams
+
+class _ForwardSeekReader(io.RawIOBase):
+    """make a readable stream seekable forward\n
+    wrapped in an io.BufferedReader, the small backward seeks are done in its buffer \
+    (ie. numpy.load(...) seek back after reading the magic string)"""
+    
+    def __init__(self, stream:"io.RawIOBase")->None:
+        super().__init__()
+        self.__stream:"io.RawIOBase" = stream
+        self.__position:int = 0
+    
+    def readable(self)->bool:
+        return True
+    def seekable(self)->bool:
+        return True
+    def tell(self)->int:
+        return self.__position
+    
+    def readinto(self, buffer:"bytearray|memoryview")->int: # type: ignore
+        nbReaded:int = (self.__stream.readinto(buffer) or 0)
+        self.__position += nbReaded
+        return nbReaded
+    
+    def seek(self, offset:int, whence:int=io.SEEK_SET)->int:
+        if whence == io.SEEK_SET: target = offset
+        elif whence == io.SEEK_CUR: target = self.__position + offset
+        else: raise io.UnsupportedOperation("can't seek from the end of the stream")
+        if target < self.__position:
+            raise io.UnsupportedOperation("can only seek forward")
+        while self.__position < target:
+            skipped:bytes = self.__stream.read(min(target - self.__position, 2**20)) or b""
+            if len(skipped) == 0:
+                break # => end of the stream
+            self.__position += len(skipped)
+        return self.__position
+    
+    def close(self)->None:
+        if self.closed is False:
+            self.__stream.close()
+        super().close()
+
+
+class _Blosc2Writer(io.RawIOBase):
+    """compress what is written by chunks of BLOSC2_CHUNK_SIZE with blosc2 \
+    (zstd codec + shuffle filter, each chunk is prefixed by its compressed size)"""
+    
+    def __init__(self, file:"SupportsFileWrite[bytes]", level:int, typeSize:int, closeFile:bool)->None:
+        super().__init__()
+        self.__file:"SupportsFileWrite[bytes]" = file
+        self.__level:int = level
+        self.__typeSize:int = typeSize
+        """the size of the items (for the shuffle filter)"""
+        self.__closeFile:bool = closeFile
+        self.__buffer:bytearray = bytearray()
+    
+    def writable(self)->bool:
+        return True
+    
+    def write(self, data:"bytes|bytearray|memoryview")->int: # type: ignore
+        view = memoryview(data).cast("B")
+        self.__buffer += view
+        while len(self.__buffer) >= BLOSC2_CHUNK_SIZE:
+            self.__writeChunk(memoryview(self.__buffer)[: BLOSC2_CHUNK_SIZE])
+            del self.__buffer[: BLOSC2_CHUNK_SIZE]
+        return view.nbytes
+    
+    def __writeChunk(self, chunk:"bytes|memoryview")->None:
+        import blosc2
+        compressed:bytes = blosc2.compress2(
+            chunk, typesize=self.__typeSize, clevel=self.__level,
+            filters=[blosc2.Filter.SHUFFLE], codec=blosc2.Codec.ZSTD)
+        self.__file.write(struct.pack("<Q", len(compressed)))
+        self.__file.write(compressed)
+    
+    def close(self)->None:
+        if self.closed is False:
+            if len(self.__buffer) > 0:
+                self.__writeChunk(bytes(self.__buffer))
+                self.__buffer.clear()
+            if self.__closeFile is True:
+                self.__file.close()
+        super().close()
+
+
+def _compressBuffer(data:"bytes|memoryview", compTuple:"_CompressionTuple|None", typeSize:int=1)->bytes:
+    """compress the `data` in one block (see _decompressBuffer(...))\n
+    `typeSize` is the size of the items of the data (used by blosc2)"""
+    if compTuple is None:
+        return bytes(data)
+    (compLib, compLevel) = compTuple
+    if compLib == "lz4":
+        import lz4.frame
+        return lz4.frame.compress(data, compression_level=compLevel)
+    elif compLib == "lzma":
+        import lzma
+        if compLevel > 9:
+            compLevel = ((compLevel - 9) | lzma.PRESET_EXTREME)
+        return lzma.compress(data, preset=compLevel)
+    elif compLib in ("bz2", "bzip2"):
+        import bz2
+        return bz2.compress(data, compresslevel=compLevel)
+    elif compLib == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor(level=compLevel).compress(data)
+    elif compLib == "blosc2":
+        import blosc2
+        return blosc2.compress2(
+            data, typesize=typeSize, clevel=compLevel,
+            filters=[blosc2.Filter.SHUFFLE], codec=blosc2.Codec.ZSTD)
+    else: raise ValueError(f"unsupported compLib: {compLib} for a buffer")
+
+def _decompressBuffer(data:"bytes|memoryview", compLib:"_CompressionLib|None")->bytes:
+    """decompress the `data` compressed by _compressBuffer(...)"""
+    if compLib is None:
+        return bytes(data)
+    elif compLib == "lz4":
+        import lz4.frame
+        return lz4.frame.decompress(data)
+    elif compLib == "lzma":
+        import lzma
+        return lzma.decompress(data)
+    elif compLib in ("bz2", "bzip2"):
+        import bz2
+        return bz2.decompress(data)
+    elif compLib == "zstd":
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(data)
+    elif compLib == "blosc2":
+        import blosc2
+        return blosc2.decompress2(data)
+    else: raise ValueError(f"unsupported compLib: {compLib} for a buffer")
+
+
+class _Blosc2Reader(io.RawIOBase):
+    """read what was written by a _Blosc2Writer"""
+    
+    def __init__(self, file:"SupportsFileRead[bytes]", closeFile:bool)->None:
+        super().__init__()
+        self.__file:"SupportsFileRead[bytes]" = file
+        self.__closeFile:bool = closeFile
+        self.__chunk:bytes = b""
+        self.__chunkPosition:int = 0
+    
+    def readable(self)->bool:
+        return True
+    
+    def readinto(self, buffer:"bytearray|memoryview")->int: # type: ignore
+        if self.__chunkPosition >= len(self.__chunk):
+            # => read the next chunk
+            header:bytes = self.__file.read(8)
+            if len(header) < 8:
+                return 0 # => end of the file
+            import blosc2
+            (compressedSize, ) = struct.unpack("<Q", header)
+            self.__chunk = blosc2.decompress2(self.__file.read(compressedSize))
+            self.__chunkPosition = 0
+        nbReaded:int = min(len(buffer), len(self.__chunk) - self.__chunkPosition)
+        buffer[: nbReaded] = self.__chunk[self.__chunkPosition: self.__chunkPosition + nbReaded]
+        self.__chunkPosition += nbReaded
+        return nbReaded
+    
+    def close(self)->None:
+        if (self.closed is False) and (self.__closeFile is True):
+            self.__file.close()
+        super().close()
+
+
+class _Checksummer():
+    """compute a _ChecksumAlgo by parts"""
+    __slots__ = ("algo", "__crc", "__xxh", )
+    
+    def __init__(self, algo:"_ChecksumAlgo")->None:
+        self.algo:"_ChecksumAlgo" = algo
+        self.__crc:int = 0
+        self.__xxh:"xxhash.xxh3_64|None" = None
+        if algo == "xxhash":
+            import xxhash
+            self.__xxh = xxhash.xxh3_64()
+        elif algo != "crc32":
+            raise ValueError(f"unsupported checksum: {algo}")
+    
+    def update(self, data:"bytes|memoryview")->None:
+        if self.__xxh is not None:
+            self.__xxh.update(data)
+        else: self.__crc = zlib.crc32(data, self.__crc)
+    
+    def digest(self)->int:
+        return (self.__crc if self.__xxh is None else self.__xxh.intdigest())
+    
+    def footer(self)->bytes:
+        return CHECKSUM_FOOTER.pack(self.digest(), CHECKSUM_MAGICS[self.algo])
+
+
+class _ChecksumWriter(io.RawIOBase):
+    """forward what is written to the `file` and compute its checksum"""
+    
+    def __init__(self, file:"SupportsFileWrite[bytes]", checksummer:"_Checksummer")->None:
+        super().__init__()
+        self.__file:"SupportsFileWrite[bytes]" = file
+        self.__checksummer:"_Checksummer" = checksummer
+        self.__position:int = 0
+    
+    def writable(self)->bool:
+        return True
+    
+    def tell(self)->int:
+        return self.__position
+    
+    def write(self, data:"bytes|bytearray|memoryview")->int: # type: ignore
+        view = memoryview(data).cast("B")
+        self.__file.write(view)
+        self.__checksummer.update(view)
+        self.__position += view.nbytes
+        return view.nbytes
+
+
+class _BoundedReader(io.RawIOBase):
+    """read the `size` bytes of the `file` from its current position (the footer is hidden)"""
+    
+    def __init__(self, file:"SupportsFileRead[bytes]", size:int)->None:
+        super().__init__()
+        self.__file:"SupportsFileRead[bytes]" = file
+        self.__start:int = file.tell() # type: ignore
+        self.__size:int = size
+        self.__position:int = 0
+    
+    def readable(self)->bool:
+        return True
+    def seekable(self)->bool:
+        return True
+    def tell(self)->int:
+        return self.__position
+    
+    def readinto(self, buffer:"bytearray|memoryview")->int: # type: ignore
+        nbToRead:int = min(len(buffer), self.__size - self.__position)
+        if nbToRead <= 0:
+            return 0
+        self.__file.seek(self.__start + self.__position) # type: ignore
+        data:bytes = self.__file.read(nbToRead)
+        buffer[: len(data)] = data
+        self.__position += len(data)
+        return len(data)
+    
+    def seek(self, offset:int, whence:int=io.SEEK_SET)->int:
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            offset += self.__size
+        self.__position = max(0, min(offset, self.__size))
+        return self.__position
+
+
+def _fsyncDirectory(directory:Path)->None:
+    """make the renames inside the `directory` durable (not supported on windows)"""
+    if sys.platform == "win32":
+        return None
+    fd:int = os.open(directory, os.O_RDONLY)
+    try: os.fsync(fd)
+    finally: os.close(fd)
+
+
 ### SaveArgs
 
+class TuneMesure(PrettyfyClass):
+    """the mesures of a (saveLib, compression) combination on the samples of a type \
+    (see SaveArgs.benchmark(...))"""
+    __slots__ = ("objectType", "saveLib", "compTuple", "rawSize", 
+                 "fileSize", "saveTime", "loadTime", )
+    
+    def __init__(self, objectType:type, saveLib:"_SaveLib", compTuple:"_CompressionTuple|None",
+            rawSize:int, fileSize:int, saveTime:float, loadTime:float)->None:
+        self.objectType:type = objectType
+        self.saveLib:"_SaveLib" = saveLib
+        self.compTuple:"_CompressionTuple|None" = compTuple
+        self.rawSize:int = rawSize
+        """the estimated size in memory of the samples"""
+        self.fileSize:int = fileSize
+        """the size on the disk of the samples"""
+        self.saveTime:float = saveTime
+        """the time to save all the samples (in sec)"""
+        self.loadTime:float = loadTime
+        """the time to load all the samples (in sec)"""
+    
+    @property
+    def ratio(self)->float:
+        """the compression ratio (rawSize / fileSize)"""
+        return self.rawSize / max(1, self.fileSize)
+    @property
+    def saveSpeed(self)->float:
+        """in Mo/sec (of raw size)"""
+        return self.rawSize / 2**20 / max(1e-9, self.saveTime)
+    @property
+    def loadSpeed(self)->float:
+        """in Mo/sec (of raw size)"""
+        return self.rawSize / 2**20 / max(1e-9, self.loadTime)
+    
+    def score(self, target:"_TuneTarget")->float:
+        """the greater the better"""
+        throughput:float = self.rawSize / max(1e-9, self.saveTime + self.loadTime)
+        if target == "throughput":
+            return throughput
+        elif target == "ratio":
+            return self.ratio
+        elif target == "balanced":
+            return throughput * self.ratio
+        else: raise ValueError(f"unknown target: {target!r}")
+
+
 class SaveArgs():
     def __init__(self,
             compression:"_CompressionTuple|_CustomCompression|None"=None,
-            methode:"_StandardMethodes|_CustomMethodes"="allwaysPickle")->None:
-        self.compression:"_CompressionTuple|_CustomCompression|None" = compression
-        self.methode:"_CustomMethodes" = SaveArgs._stdMethode_to_custom(methode)
+            methode:"_StandardMethodes|_CustomMethodes"="allwaysPickle",
+            checksum:"_ChecksumAlgo|None"="crc32", trust:bool=False,
+            fsync:"_FsyncPolicy"="never")->None:
+        """`checksum` is the checksum written after the saved objects (None -> no checksum), \
+        it is verified when the objects are loaded from a stream\n
+        the mapped libs ("numpy-mmap" and "pickle5") only check that the footer is there on load \
+        (their payload isn't readed), use ObjectSaver.verify() or Session.reopen(verify="checksum") \
+        to verify them fully\n
+        `trust` is whether to skip the verification of the checksums on load\n
+        `fsync` is when the saved files are flushed to the disk (see _FsyncPolicy)"""
+        self.__resetResolver()
+        self.compression = compression
+        self.methode = SaveArgs._stdMethode_to_custom(methode)
+        self.checksum:"_ChecksumAlgo|None" = checksum
+        self.trust:bool = trust
+        self.fsync:"_FsyncPolicy" = fsync
         self._preImport_compLib()
     
+    ### resolver: the decisions per type are cached (invalidated when the maps change)
+    
+    def __resetResolver(self)->None:
+        self.__methode:"_WatchedDict" = _WatchedDict()
+        self.__compression:"_CompressionTuple|_WatchedDict|None" = None
+        self.__libsCache:"dict[type, _SaveLib]" = {}
+        self.__compressionsCache:"dict[tuple[type, _SaveLib], _CompressionTuple|None]" = {}
+        self.__generation:int = 0
+        """incremented each time a map is replaced"""
+        self.__cacheVersion:"tuple[int, int, int]" = (-1, 0, 0)
+    
+    @property
+    def methode(self)->"_CustomMethodes":
+        return self.__methode
+    @methode.setter
+    def methode(self, methode:"_CustomMethodes")->None:
+        self.__methode = _WatchedDict(methode)
+        self.__generation += 1
+    
+    @property
+    def compression(self)->"_CompressionTuple|_CustomCompression|None":
+        return self.__compression
+    @compression.setter
+    def compression(self, compression:"_CompressionTuple|_CustomCompression|None")->None:
+        self.__compression = (_WatchedDict(compression) if isinstance(compression, dict) else compression)
+        self.__generation += 1
+    
+    def __checkCache(self)->None:
+        """clear the cached decisions when the maps were replaced or modified"""
+        compression = self.__compression
+        version:"tuple[int, int, int]" = (
+            self.__generation, self.__methode.version,
+            (compression.version if isinstance(compression, _WatchedDict) else -1))
+        if version != self.__cacheVersion:
+            self.__libsCache.clear()
+            self.__compressionsCache.clear()
+            self.__cacheVersion = version
+    
+    def resolvedPlan(self, *objectTypes:type)->"dict[type, tuple[_SaveLib, _CompressionTuple|None]]":
+        """the (saveLib, compTuple) used for each of the `objectTypes`\n
+        when empty: the ones of all the types resolved so far"""
+        self.__checkCache()
+        if len(objectTypes) == 0:
+            objectTypes = tuple(self.__libsCache.keys())
+        return {objectType: (self.getSaveLib(objectType), self.getCompressionTuple(objectType))
+                for objectType in objectTypes}
+    
+    def __getstate__(self)->"dict[str, Any]":
+        # => the caches aren't pickled
+        compression = self.__compression
+        return {"compression": (dict(compression) if isinstance(compression, dict) else compression),
+                "methode": dict(self.__methode), "checksum": self.checksum,
+                "trust": self.trust, "fsync": self.fsync}
+    
+    def __setstate__(self, state:"dict[str, Any]")->None:
+        self.__resetResolver()
+        self.compression = state["compression"]
+        self.methode = state["methode"]
+        self.checksum = state.get("checksum", None)
+        self.trust = state.get("trust", False)
+        self.fsync = state.get("fsync", "never")
+    
     def getCompressionTuple(self, objectType:type, useLib:"_SaveLib|None"=None)->"_CompressionTuple|None":
-        if self.compression is None:
+        if self.__compression is None:
             return None
-        elif isinstance(self.compression, tuple):
-            return self.compression
-        # => custom
         if useLib is None: # => auto
             useLib = self.getSaveLib(objectType)
         # => useLib is defined
+        self.__checkCache()
+        key:"tuple[type, _SaveLib]" = (objectType, useLib)
+        if key in self.__compressionsCache:
+            return self.__compressionsCache[key]
+        compTuple = self.__resolveCompressionTuple(objectType, useLib)
+        self.__compressionsCache[key] = compTuple
+        return compTuple
+    
+    def __resolveCompressionTuple(self, objectType:type, useLib:"_SaveLib")->"_CompressionTuple|None":
+        """the not cached version of .getCompressionTuple(...)"""
+        if self.compression is None:
+            return None
+        elif useLib in NEVER_COMPRESSED_SaveLibs:
+            return None
+        elif isinstance(self.compression, tuple):
+            return self.compression
+        # => custom: (saveLib, type) > saveLib > "__other__"
         narrowestType:"type|None" = None
         narrowestCompTuple:"_CompressionTuple|None" = None
-        fromOther:bool = False
         for saveLib, compTuple in self.compression.items():
             if isinstance(saveLib, tuple):
                 # => custom compTuple
@@ -459,79 +2479,238 @@ class SaveArgs():
                     # => correct saveLib, correct type, narrower
                     narrowestType = keyType
                     narrowestCompTuple = compTuple
-            else: # => generic compTuple
-                if ((saveLib == useLib) and ((narrowestCompTuple is None) or (fromOther is True))) \
-                        or ((saveLib == "__other__") and (fromOther is False)): 
-                    # => correct saveLib, not setted yet => set the default
-                    fromOther = (saveLib == "__other__")
-                    narrowestCompTuple = compTuple
-        #print(f"{objectType} -> {narrowestCompTuple}")
-        return narrowestCompTuple
+        if narrowestType is not None:
+            return narrowestCompTuple
+        # => generic compTuple
+        if useLib in self.compression:
+            return self.compression[useLib]
+        return self.compression.get("__other__", None)
     
 
     def save(self, filePath:Path, obj:object)->None:
+        """save the `obj` at `filePath`, it is written aside then renamed \
+        (a crash never leave a truncated file at `filePath`)"""
         useLib:"_SaveLib" = self.getSaveLib(type(obj))
-        fileNormal:"SupportsFileWrite[bytes]"
         fileHdf:"pandas.HDFStore" # TODO: use with insted of .close()
         objectType:type = type(obj)
-        if useLib == "pickle":
-            with self.getFile(filePath, objectType, useLib, 'w') as fileNormal:
+        if (useLib == "numpy-mmap") and _isMappedFrom(obj, filePath):
+            # => it is the (read only) array mapped from this file, nothing to write
+            return None
+        tmpPath:Path = Path(_tmpPathOf(filePath.as_posix()))
+        try:
+            if useLib == "pandas":
+                import pandas
+                with self.getFile(tmpPath, objectType, useLib, 'w') as fileHdf:
+                    assert isinstance(obj, pandas.DataFrame), \
+                        TypeError(f"in order to save an object with lib: {useLib}"
+                                f"the object needs to be an instance of {pandas.DataFrame}")
+                    obj.to_hdf(fileHdf, key=CONST_PANDAS_HDF_KEY)
+                if self.fsync != "never":
+                    with open(tmpPath, mode="rb+") as rawFile:
+                        os.fsync(rawFile.fileno())
+            else: # => the lib can write in a file (with the checksum)
+                with open(tmpPath, mode="wb") as rawFile:
+                    self.__dumpChecked(rawFile, obj, useLib)
+                    if self.fsync != "never":
+                        rawFile.flush()
+                        os.fsync(rawFile.fileno())
+            # => the old file (and its mapped pages) stays valid
+            os.replace(tmpPath, filePath)
+        except BaseException:
+            cleanFile_if_exist(tmpPath.as_posix())
+            raise
+        if self.fsync == "full":
+            _fsyncDirectory(filePath.parent)
+        # => saved the object
+    
+    def dump(self, rawFile:"SupportsFileWrite[bytes]", obj:object, useLib:"_SaveLib|None"=None)->None:
+        """save the `obj` in the opened `rawFile` (it will not be closed)\n
+        only for the libs that aren't in PATH_ONLY_SaveLibs\n
+        the checksum footer is written after the object (see `checksum`)"""
+        if useLib is None: # => auto
+            useLib = self.getSaveLib(type(obj))
+        if useLib in PATH_ONLY_SaveLibs:
+            raise ValueError(f"the lib: {useLib} needs its own file, it can't be saved in a stream")
+        self.__dumpChecked(rawFile, obj, useLib)
+    
+    def __dumpChecked(self, rawFile:"SupportsFileWrite[bytes]", obj:object, useLib:"_SaveLib")->None:
+        """write the `obj` then its checksum footer (when enabled)"""
+        if self.checksum is None:
+            return self.__dumpPayload(rawFile, obj, useLib)
+        checksummer = _Checksummer(self.checksum)
+        self.__dumpPayload(_ChecksumWriter(rawFile, checksummer), obj, useLib)
+        rawFile.write(checksummer.footer())
+    
+    def __dumpPayload(self, rawFile:"SupportsFileWrite[bytes]", obj:object, useLib:"_SaveLib")->None:
+        """write the `obj` with the `useLib` (all the libs but "pandas")"""
+        objectType:type = type(obj)
+        fileNormal:"SupportsFileWrite[bytes]"
+        if useLib == "pickle5":
+            _dumpPickle5(rawFile, obj)
+        elif useLib == "numpy-mmap":
+            import numpy
+            with self.getFile(rawFile, objectType, useLib, 'w') as fileNormal:
+                numpy.save(arr=obj, file=fileNormal, allow_pickle=True)
+        elif useLib == "pickle":
+            with self.getFile(rawFile, objectType, useLib, 'w') as fileNormal:
                 pickle.dump(obj=obj, file=fileNormal, protocol=-1)
-            fileNormal.close()
         elif useLib == "numpy":
             import numpy
-            with self.getFile(filePath, objectType, useLib, 'w') as fileNormal:
+            typeSize:"int|None" = (obj.itemsize if isinstance(obj, numpy.ndarray) else None)
+            with self.getFile(rawFile, objectType, useLib, 'w', typeSize=typeSize) as fileNormal:
                 numpy.save(arr=obj, file=fileNormal, allow_pickle=True)
-            fileNormal.close()
-        elif useLib == "pandas":
-            import pandas
-            with self.getFile(filePath, objectType, useLib, 'w') as fileHdf:
-                assert isinstance(obj, pandas.DataFrame), \
-                    TypeError(f"in order to save an object with lib: {useLib}"
-                            f"the object needs to be an instance of {pandas.DataFrame}")
-                obj.to_hdf(fileHdf, key=CONST_PANDAS_HDF_KEY)
         elif useLib == "joblib":
             import joblib
-            with self.getFile(filePath, objectType, useLib, 'w') as fileNormal:
+            with self.getFile(rawFile, objectType, useLib, 'w') as fileNormal:
                 joblib.dump(obj, fileNormal, protocol=-1)
-            fileNormal.close()
-        else: raise ValueError(f"the lib: {useLib} isn't supported")
-        # => saved the object
+        else: raise ValueError(f"the lib: {useLib} isn't supported in a stream")
         
     def load(self, filePath:Path, objectType:"type[_T]")->"_T":
         useLib:"_SaveLib" = self.getSaveLib(objectType)
+        fileHdf:"pandas.HDFStore"
+        if useLib == "pickle5":
+            self._verifyFile(filePath, full=False)
+            obj = _loadPickle5(filePath)
+        elif useLib == "numpy-mmap":
+            import numpy
+            self._verifyFile(filePath, full=False)
+            try: obj = numpy.load(filePath, mmap_mode='r', allow_pickle=False)
+            except ValueError:
+                # => python objects in the dtype, it can't be mapped
+                obj = numpy.load(filePath, allow_pickle=True)
+        elif useLib == "pandas":
+            import pandas
+            with self.getFile(filePath, objectType, useLib, 'r') as fileHdf:
+                obj = pandas.read_hdf(fileHdf, CONST_PANDAS_HDF_KEY)
+        else: # => the lib can read from a stream
+            with open(filePath, mode="rb") as rawFile:
+                return self.loadFrom(rawFile, objectType, useLib=useLib)
+        # => loaded the object, checking asserting its type
+        assert isinstance(obj, objectType), \
+            TypeError(f"the readed object with lib: {useLib} is of type: {type(obj)} "
+                        f"but expected an object of type: {objectType}")
+        return obj
+    
+    def loadFrom(self, rawFile:"SupportsFileRead[bytes]", objectType:"type[_T]", useLib:"_SaveLib|None"=None)->"_T":
+        """load an object of type `objectType` from the opened `rawFile` (it will not be closed)\n
+        only for the libs that aren't in PATH_ONLY_SaveLibs"""
+        if useLib is None: # => auto
+            useLib = self.getSaveLib(objectType)
         fileNormal:"SupportsFileRead[bytes]"
         filePickle:"SupportsPickleRead"
-        fileHdf:"pandas.HDFStore"
+        # => the uncompressed readers stop at the end of the object (no need to hide the footer)
+        rawFile = self._checkedPayload(
+            rawFile, bounded=(self.getCompressionTuple(objectType, useLib=useLib) is not None))
         if useLib == "pickle":
-            with self.getFile(filePath, objectType, useLib, 'r') as filePickle:
+            with self.getFile(rawFile, objectType, useLib, 'r') as filePickle:
                 obj = pickle.load(file=filePickle)
         elif useLib == "numpy":
             import numpy
-            with self.getFile(filePath, objectType, useLib, 'r') as fileNormal:
+            with self.getFile(rawFile, objectType, useLib, 'r') as fileNormal:
                 obj = numpy.load(file=fileNormal, allow_pickle=True)
-        elif useLib == "pandas":
-            import pandas
-            with self.getFile(filePath, objectType, useLib, 'r') as fileHdf:
-                obj = pandas.read_hdf(fileHdf, CONST_PANDAS_HDF_KEY)
         elif useLib == "joblib":
             import joblib
-            with self.getFile(filePath, objectType, useLib, 'r') as fileNormal:
+            with self.getFile(rawFile, objectType, useLib, 'r') as fileNormal:
                 obj = joblib.load(fileNormal)
+        elif useLib in PATH_ONLY_SaveLibs:
+            raise ValueError(f"the lib: {useLib} needs its own file, it can't be loaded from a stream")
         else: raise ValueError(f"the lib: {useLib} isn't supported")
         # => loaded the object, checking asserting its type
         assert isinstance(obj, objectType), \
             TypeError(f"the readed object with lib: {useLib} is of type: {type(obj)} "
                         f"but expected an object of type: {objectType}")
         return obj
+    
+    def _checkedPayload(self, rawFile:"SupportsFileRead[bytes]", bounded:bool=True,
+            verify:"bool|None"=None)->"SupportsFileRead[bytes]":
+        """verify the checksum footer at the end of the `rawFile` \
+        and return a file that stops before the footer (`bounded`) or the `rawFile`\n
+        `verify` is whether to hash the payload (None -> unless `trust`)\n
+        return the `rawFile` (at its current position) when it has no footer or isn't seekable"""
+        if verify is None:
+            verify = (self.trust is False)
+        seekable = getattr(rawFile, "seekable", None)
+        if (seekable is None) or (seekable() is False):
+            return rawFile
+        start:int = rawFile.tell() # type: ignore
+        end:int = rawFile.seek(0, io.SEEK_END) # type: ignore
+        if (end - start) < CHECKSUM_FOOTER.size:
+            rawFile.seek(start) # type: ignore
+            return rawFile
+        rawFile.seek(end - CHECKSUM_FOOTER.size) # type: ignore
+        (checksum, magic) = CHECKSUM_FOOTER.unpack(rawFile.read(CHECKSUM_FOOTER.size))
+        algo:"_ChecksumAlgo|None" = None
+        for (algoName, algoMagic) in CHECKSUM_MAGICS.items():
+            if magic == algoMagic: algo = algoName
+        rawFile.seek(start) # type: ignore
+        if algo is None:
+            return rawFile # => saved without checksum
+        payloadSize:int = (end - CHECKSUM_FOOTER.size - start)
+        if verify is True:
+            checksummer = _Checksummer(algo)
+            buffer = memoryview(bytearray(min(payloadSize, CHECKSUM_READ_SIZE)))
+            nbRemaining:int = payloadSize
+            while nbRemaining > 0:
+                nbReaded:int = rawFile.readinto(buffer[: nbRemaining]) # type: ignore
+                if nbReaded == 0:
+                    break
+                checksummer.update(buffer[: nbReaded])
+                nbRemaining -= nbReaded
+            if checksummer.digest() != checksum:
+                raise ValueError(f"the saved object is corrupted: its {algo} checksum doesn't match")
+            rawFile.seek(start) # type: ignore
+        if bounded is False:
+            return rawFile
+        return io.BufferedReader(_BoundedReader(rawFile, payloadSize))
+    
+    def _verifyFile(self, filePath:Path, full:bool)->None:
+        """verify the checksum footer of the file (used by the libs that map their file)\n
+        `full` -> False: only check that the footer is there when `checksum` is set \
+        (nothing is hashed, the mapped pages are only readed when used), \
+        True: verify the checksum of the whole file (even when `trust`)"""
+        if (full is False) and ((self.trust is True) or (self.checksum is None)):
+            return None
+        with open(filePath, mode="rb") as rawFile:
+            if full is True:
+                self._checkedPayload(rawFile, bounded=False, verify=True)
+                return None
+            end:int = rawFile.seek(0, io.SEEK_END)
+            magic:bytes = b""
+            if end >= CHECKSUM_FOOTER.size:
+                rawFile.seek(end - CHECKSUM_FOOTER.size)
+                (_, magic) = CHECKSUM_FOOTER.unpack(rawFile.read(CHECKSUM_FOOTER.size))
+            if magic not in CHECKSUM_MAGICS.values():
+                raise ValueError(f"the saved object at {filePath} is corrupted: "
+                                 f"its checksum footer is missing (truncated file ?)")
+    
+    def isStreamable(self, objectType:type)->bool:
+        """whether the objects of this type can be saved in a stream (see .dump(...))"""
+        return (self.getSaveLib(objectType) not in PATH_ONLY_SaveLibs)
 
     def getSaveLib(self, objectType:"type")->"_SaveLib":
+        self.__checkCache()
+        selectedLib:"_SaveLib|None" = self.__libsCache.get(objectType, None)
+        if selectedLib is not None:
+            return selectedLib
+        selectedLib = self.__resolveSaveLib(objectType)
+        self.__libsCache[objectType] = selectedLib
+        return selectedLib
+    
+    def __resolveSaveLib(self, objectType:"type")->"_SaveLib":
+        """the not cached version of .getSaveLib(...)\n
+        the most narrowed matching type is used, the ties are broken with the MRO of `objectType`"""
+        mro:"tuple[type, ...]" = objectType.__mro__
+        def mroRank(typeToCkeck:type)->int:
+            # => the types that aren't in the MRO (ie. ABCs) are the last ones
+            return (mro.index(typeToCkeck) if typeToCkeck in mro else len(mro))
         narrowestType:"type|None" = None
         selectedLib:"_SaveLib|None" = None
         for typeToCkeck, lib in self.methode.items():
             if issubclass(objectType, typeToCkeck):
-                if (narrowestType is None) or issubclass(typeToCkeck, narrowestType):
-                    # => new type | subclass of current narrowest type
+                if (narrowestType is None) or issubclass(typeToCkeck, narrowestType) \
+                        or ((issubclass(narrowestType, typeToCkeck) is False) 
+                            and (mroRank(typeToCkeck) < mroRank(narrowestType))):
+                    # => new type | subclass of current narrowest type | unrelated but first in the MRO
                     narrowestType = typeToCkeck
                     selectedLib = lib
         if selectedLib is None:
@@ -544,20 +2723,25 @@ class SaveArgs():
             mode:"Literal['r','w']")->"pandas.HDFStore": ...
     @overload
     def getFile(self, 
-            filePath:Path, objectType:type, saveLib:"Literal['pickle']",
+            filePath:"Path|SupportsFileRead[bytes]", objectType:type, saveLib:"Literal['pickle']",
             mode:"Literal['r']")->"SupportsPickleRead": ...
     @overload
     def getFile(self, 
-            filePath:Path, objectType:type, saveLib:"_SaveLib",
+            filePath:"Path|SupportsFileRead[bytes]", objectType:type, saveLib:"_SaveLib",
             mode:"Literal['r']")->"SupportsFileRead[bytes]": ...
     @overload
     def getFile(self, 
-            filePath:Path, objectType:type, saveLib:"_SaveLib",
-            mode:"Literal['w']")->"SupportsFileWrite[bytes]": ...
+            filePath:"Path|SupportsFileWrite[bytes]", objectType:type, saveLib:"_SaveLib",
+            mode:"Literal['w']", typeSize:"int|None"=None)->"SupportsFileWrite[bytes]": ...
     def getFile(self, 
-            filePath:Path, objectType:type, saveLib:"_SaveLib", mode:"Literal['r', 'w']",
+            filePath:"Path|SupportsFileWrite[bytes]|SupportsFileRead[bytes]",
+            objectType:type, saveLib:"_SaveLib", mode:"Literal['r', 'w']",
+            typeSize:"int|None"=None,
             )->"SupportsFileWrite[bytes]|SupportsFileRead[bytes]|pandas.HDFStore|SupportsPickleRead":
-        """not overloaded version"""
+        """not overloaded version\n
+        `filePath` can also be an opened file (only when saveLib isn't in PATH_ONLY_SaveLibs), \
+            in that case it will not be closed by the returned file\n
+        `typeSize` is the size of the items of the saved object (used by some compLibs)"""
         compTuple = self.getCompressionTuple(objectType, useLib=saveLib)
         compLib:"_CompressionLib|None" = (None if compTuple is None else compTuple[0])
         compLevel:"int|None" = (None if compTuple is None else compTuple[1])
@@ -582,16 +2766,42 @@ class SaveArgs():
             elif compLib == "lzma":
                 import lzma
                 if (compLevel is not None) and (compLevel > 9):
-                    compLevel = (compLevel | lzma.PRESET_EXTREME)
-                return lzma.LZMAFile(filePath, mode=mode, preset=compLevel)
+                    # => 10 -> 1|EXTREME, ..., 18 -> 9|EXTREME
+                    compLevel = ((compLevel - 9) | lzma.PRESET_EXTREME)
+                # => the preset is only for writing (LZMAFile refuse it when reading)
+                return lzma.LZMAFile(filePath, mode=mode, preset=(compLevel if mode == 'w' else None))
             elif compLib in ("bz2", "bzip2"):
                 if compLevel is None: compLevel = 9 # is default
                 import bz2
                 return bz2.BZ2File(filePath, mode=mode, compresslevel=compLevel)
+            elif compLib in ("zstd", "blosc2"):
+                # => they only wrap opened files
+                rawFile:"SupportsFileWrite[bytes]|SupportsFileRead[bytes]"
+                ownFile:bool = isinstance(filePath, Path)
+                rawFile = (open(filePath, mode=(mode+'b')) if isinstance(filePath, Path) else filePath)
+                if compLib == "zstd":
+                    import zstandard
+                    if mode == 'w':
+                        if compLevel is None: compLevel = 3 # default
+                        # threads=-1 => multi-threaded frames with all the cores
+                        return zstandard.ZstdCompressor(level=compLevel, threads=-1) \
+                            .stream_writer(rawFile, closefd=ownFile)
+                    return io.BufferedReader(_ForwardSeekReader(
+                        zstandard.ZstdDecompressor().stream_reader(rawFile, closefd=ownFile)))
+                # => blosc2
+                if mode == 'w':
+                    if compLevel is None: compLevel = 5 # default
+                    return io.BufferedWriter(_Blosc2Writer(
+                        cast("SupportsFileWrite[bytes]", rawFile), level=compLevel,
+                        typeSize=(typeSize or 1), closeFile=ownFile))
+                return io.BufferedReader(_ForwardSeekReader(_Blosc2Reader(
+                    cast("SupportsFileRead[bytes]", rawFile), closeFile=ownFile)))
             else: raise ValueError(f"unsupported compLib: {compLib} with the saveLib: {saveLib}")
         
         # => uncompressed file
-        return open(filePath, mode=(mode+'b'))
+        if isinstance(filePath, Path):
+            return open(filePath, mode=(mode+'b'))
+        return _BorrowedFile(filePath)
     
     @classmethod
     def _assert_allowed_compLib(cls, saveLib:"_SaveLib", compLib:"_CompressionLib|None")->None:
@@ -615,6 +2825,10 @@ class SaveArgs():
             # nothing to pre import 
             return {object:"pickle"}
         
+        elif methode == "allwaysPickle5":
+            # nothing to pre import 
+            return {object:"pickle5"}
+        
         elif methode == "allwaysJoblib":
             import joblib
             return {object:"joblib"}
@@ -628,6 +2842,11 @@ class SaveArgs():
             import numpy, pandas
             return {object:"pickle", numpy.ndarray:"numpy",
                     pandas.DataFrame:"pandas"}
+        
+        elif methode == "pickle|numpy-mmap|pandas":
+            import numpy, pandas
+            return {object:"pickle", numpy.ndarray:"numpy-mmap",
+                    pandas.DataFrame:"pandas"}
             
         else: raise ValueError(f"standard methode: {repr(methode)} isn't supported")
     
@@ -638,18 +2857,177 @@ class SaveArgs():
             return [self.compression[0]]
         # => custom
         result:"list[_CompressionLib]" = []
-        for (compLib, _) in self.compression.values():
-            result.append(compLib)
+        for compTuple in self.compression.values():
+            if compTuple is not None:
+                result.append(compTuple[0])
         return result
     
     def getAllSaveLibs(self)->"list[_SaveLib]":
         return list(self.methode.values())
     
+    @classmethod
+    def _candidatesSaveLibs(cls, objectType:type)->"list[_SaveLib]":
+        """the libs that are able to save an instance of `objectType`"""
+        candidates:"list[_SaveLib]" = ["pickle", "pickle5", "joblib"]
+        if "numpy" in sys.modules:
+            import numpy
+            if issubclass(objectType, numpy.ndarray):
+                candidates += ["numpy", "numpy-mmap"]
+        if "pandas" in sys.modules:
+            import pandas
+            if issubclass(objectType, pandas.DataFrame):
+                candidates.append("pandas")
+        return candidates
+    
+    @classmethod
+    def _candidatesCompressions(cls, 
+            saveLib:"_SaveLib", levels:"dict[_CompressionLib, list[int]]|None",
+            )->"list[_CompressionTuple|None]":
+        """the compressions (and levels) to benchmark with `saveLib`"""
+        candidates:"list[_CompressionTuple|None]" = [None]
+        if saveLib in NEVER_COMPRESSED_SaveLibs:
+            return candidates
+        allowedCompLibs = ALLOWED_CompressionLibs.get(saveLib, ALLOWED_CompressionLibs["__other__"])
+        for compLib in sorted(allowedCompLibs):
+            if (compLib == "bzip2") and ("bz2" in allowedCompLibs):
+                continue # => same as bz2
+            compLevels:"list[int]"
+            if levels is not None:
+                compLevels = levels.get(compLib, [])
+            else: # => low, medium and high levels
+                (lowLevel, highLevel) = compressionLevelsRange[compLib]
+                compLevels = sorted({lowLevel, (lowLevel + highLevel) // 2, highLevel})
+            candidates.extend((compLib, level) for level in compLevels)
+        return candidates
+    
+    @classmethod
+    def benchmark(cls, sampleObjects:"Iterable[object]",
+            saveLibs:"list[_SaveLib]|None"=None,
+            levels:"dict[_CompressionLib, list[int]]|None"=None,
+            directory:"Path|None"=None, nbRepeats:int=1)->"list[TuneMesure]":
+        """mesure the save/load times and the sizes on the disk of each allowed \
+            (saveLib, compLib, level) combination on the `sampleObjects` (grouped by type)\n
+        `saveLibs` restrict the libs to try (None -> all the libs that can save the type)\n
+        `levels` are the levels to try per compLib, the compLibs not in it aren't tried \
+            (None -> a low, medium and high level for all the compLibs)\n
+        `directory` is where the tmp files are written (None -> SAVEMODULE_DIRECTORY)\n
+        `nbRepeats` the best time of `nbRepeats` runs is kept\n
+        the combinations whose lib isn't installed are skipped, \
+        the other failing combinations are skipped after printing their error"""
+        import tempfile
+        # group the samples per type
+        samplesPerType:"dict[type, list[object]]" = {}
+        for obj in sampleObjects:
+            samplesPerType.setdefault(type(obj), []).append(obj)
+        if directory is None:
+            directory = SAVEMODULE_DIRECTORY
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        mesures:"list[TuneMesure]" = []
+        with tempfile.TemporaryDirectory(prefix="tune_", dir=directory) as tmpDirectory:
+            for (objectType, samples) in samplesPerType.items():
+                rawSize:int = sum(estimateSize(obj) for obj in samples)
+                filesPaths:"list[Path]" = [
+                    Path(tmpDirectory).joinpath(f"sample_{index}") for index in range(len(samples))]
+                for saveLib in cls._candidatesSaveLibs(objectType):
+                    if (saveLibs is not None) and (saveLib not in saveLibs):
+                        continue
+                    for compTuple in cls._candidatesCompressions(saveLib, levels):
+                        try: mesure = cls.__benchmarkCombination(
+                            objectType, samples, rawSize, filesPaths, saveLib, compTuple, nbRepeats)
+                        except ImportError:
+                            continue # => the lib isn't installed
+                        except Exception as err:
+                            print(f"/!\\ the combination ({saveLib}, {compTuple}) failed "
+                                  f"on the samples of type {objectType}, it is skipped")
+                            print_exception(err)
+                            continue
+                        finally:
+                            for filePath in filesPaths:
+                                cleanFile_if_exist(filePath.as_posix())
+                        mesures.append(mesure)
+        return mesures
+    
+    @classmethod
+    def __benchmarkCombination(cls, 
+            objectType:type, samples:"list[object]", rawSize:int, filesPaths:"list[Path]", 
+            saveLib:"_SaveLib", compTuple:"_CompressionTuple|None", nbRepeats:int)->"TuneMesure":
+        savingArgs = SaveArgs(compression=compTuple, methode={object: saveLib})
+        bestSaveTime:float = float("inf")
+        bestLoadTime:float = float("inf")
+        for _ in range(nbRepeats):
+            startTime = time.perf_counter()
+            for (obj, filePath) in zip(samples, filesPaths):
+                savingArgs.save(filePath, obj)
+            bestSaveTime = min(bestSaveTime, time.perf_counter() - startTime)
+            startTime = time.perf_counter()
+            for filePath in filesPaths:
+                # => the mapped libs ("numpy-mmap", "pickle5") only read the pages when they are used
+                _touchPages(savingArgs.load(filePath, objectType))
+            bestLoadTime = min(bestLoadTime, time.perf_counter() - startTime)
+        fileSize:int = sum(os.path.getsize(filePath) for filePath in filesPaths)
+        return TuneMesure(
+            objectType=objectType, saveLib=saveLib, compTuple=compTuple, rawSize=rawSize,
+            fileSize=fileSize, saveTime=bestSaveTime, loadTime=bestLoadTime)
+    
+    def autoTune(self, sampleObjects:"Iterable[object]", target:"_TuneTarget"="balanced",
+            saveLibs:"list[_SaveLib]|None"=None,
+            levels:"dict[_CompressionLib, list[int]]|None"=None,
+            directory:"Path|None"=None, nbRepeats:int=1,
+            profilePath:"Path|None"=None, apply:bool=True)->"_CustomCompression":
+        """benchmark the combinations on representative objects (see .benchmark(...)) \
+            and select the best (saveLib, compression) for each type according to the `target`\n
+        `profilePath` when given, save the tuned profile at this path (see .fromProfile(...))\n
+        `apply` whether to use the tuned libs and compressions from now\n
+        return the best compression of each type (the tuned types without \
+            a compression are set to None to overwrite the generic entries)"""
+        bestMesures:"dict[type, TuneMesure]" = {}
+        for mesure in SaveArgs.benchmark(
+                sampleObjects, saveLibs=saveLibs, levels=levels,
+                directory=directory, nbRepeats=nbRepeats):
+            currentBest:"TuneMesure|None" = bestMesures.get(mesure.objectType, None)
+            if (currentBest is None) or (mesure.score(target) > currentBest.score(target)):
+                bestMesures[mesure.objectType] = mesure
+        
+        tunedCompression:"_CustomCompression" = {}
+        tunedMethode:"_CustomMethodes" = dict(self.methode)
+        for (objectType, mesure) in bestMesures.items():
+            tunedMethode[objectType] = mesure.saveLib
+            tunedCompression[(mesure.saveLib, objectType)] = mesure.compTuple
+        # keep the generic compressions for the other types
+        newCompression:"_CustomCompression" = {}
+        if isinstance(self.compression, tuple):
+            newCompression["__other__"] = self.compression
+        elif isinstance(self.compression, dict):
+            newCompression.update(self.compression)
+        newCompression.update(tunedCompression)
+        
+        if profilePath is not None:
+            with open(profilePath, mode="wb") as profileFile:
+                pickle.dump(obj={
+                        "target": target, "methode": tunedMethode,
+                        "compression": newCompression, "mesures": list(bestMesures.values())},
+                    file=profileFile, protocol=-1)
+        if apply is True:
+            self.methode = tunedMethode
+            self.compression = newCompression
+            self._preImport_compLib()
+        return tunedCompression
+    
+    @classmethod
+    def fromProfile(cls, profilePath:Path)->"SaveArgs":
+        """create the SaveArgs of a profile saved by .autoTune(...)"""
+        with open(profilePath, mode="rb") as profileFile:
+            profile:"dict[str, Any]" = pickle.load(profileFile)
+        return SaveArgs(compression=profile["compression"], methode=profile["methode"])
+    
     def _preImport_compLib(self)->None:
         for compLib in self.getAllCompLibs():
-            if compLib in ("bz2", "bzip2", "lz4", "lzma"):
-                __import__(compLib)
+            if compLib in COMPRESSION_LIBS_MODULES:
+                __import__(COMPRESSION_LIBS_MODULES[compLib])
             # => other libs don't need pre import
+        if self.checksum == "xxhash":
+            import xxhash
 
 
 
@@ -670,7 +3048,13 @@ class ObjectSaver(Generic[_T_Savable]):
         self.__value:"_T_Savable|_Unsetted" = value
         self.__type:"type[_T_Savable]" = type(self.__value)
         self.__saveState:bool = False
-        
+        self.__pinned:int = 0
+        """the number of `with` currently using the object (it can't be saved by the session's budget)"""
+        self.__pendingIO:"Future[None]|None" = None
+        """the last async save/load (None when there was none or it was waited)"""
+        self.__ioLock = threading.Lock()
+        self.__saveLock = threading.Lock()
+        """serialize the saves (ie. the budget of the session and an explicit .save())"""
         
         self.__session:Session
         self.__filePath:Path
@@ -685,19 +3069,30 @@ class ObjectSaver(Generic[_T_Savable]):
     
     @property
     def value(self)->"_T_Savable":
+        self.waitIO()
+        stats:"SessionStats|None" = self.__session.stats
+        if stats is not None:
+            stats._recordAccess(self.__type, reloaded=self.__saveState)
         if self.__saveState is True:
             self.load()
-        if not isinstance(self.__value, self.__type):
+        else: self.__session._touchResident(self)
+        value:"_T_Savable|_Unsetted" = self.__value
+        while isinstance(value, _Unsetted):
+            # => saved meanwhile by the budget of an other thread, reload it
+            self.load()
+            value = self.__value
+        if not isinstance(value, self.__type):
             raise TypeError(
                 "something whent wrong: got self.__value "
-                f"of type {type(self.__value)} insted of {self.__type}"
+                f"of type {type(value)} insted of {self.__type}"
             )
-        return self.__value
+        return value
     
     
     def setValue(self, newValue:"_T_Savable")->None:
         """set the new value, if it was saved, it is now considered as loaded\n
         don't interact with the disk"""
+        self.waitIO()
         if not isinstance(newValue, self.__type):
             raise TypeError(
                 "something whent wrong: got `newValue` "
@@ -706,6 +3101,7 @@ class ObjectSaver(Generic[_T_Savable]):
         self.__saveState = False
         self.__value = newValue
         self.__type = type(newValue)
+        self.__session._registerResident(self)
     
     @property
     def valueType(self)->"type[_T_Savable]":
@@ -718,6 +3114,36 @@ class ObjectSaver(Generic[_T_Savable]):
     def isSaved(self)->bool:
         return self.__saveState
     
+    def isInFlight(self)->bool:
+        """whether an async save/load of the object is still running"""
+        pendingIO = self.__pendingIO
+        return (pendingIO is not None) and (pendingIO.done() is False)
+    
+    def waitIO(self)->None:
+        """block until the async save/load of the object (if any) is finished\n
+        re-raise the error of the async save/load when it failed"""
+        pendingIO = self.__pendingIO
+        if pendingIO is None:
+            return None # => nothing to wait
+        try: pendingIO.result()
+        finally:
+            if self.__pendingIO is pendingIO:
+                self.__pendingIO = None
+    
+    def isPinned(self)->bool:
+        """whether the object is in use (inside its `with`)"""
+        return (self.__pinned > 0)
+    
+    def _residentSize(self)->int:
+        """the estimated size in memory of the value (0 when saved)"""
+        if self.__saveState is True:
+            return 0
+        return estimateSize(self.__value)
+    
+    def _storedFiles(self)->"list[str]":
+        """the files (of the storage) used to save the value"""
+        return [self.__filePath.as_posix()]
+    
     def __genFilePath(self)->Path:
         """determine the filename and assemble with the directory\\
         the generated filename should remain the same during the run"""
@@ -727,35 +3153,123 @@ class ObjectSaver(Generic[_T_Savable]):
 
     def load(self, force:bool=False)->None:
         """load the data from the disk if it was saved"""
+        self.waitIO()
+        self.__loadNow(force)
+    
+    def loadAsync(self, force:bool=False)->"Future[None]":
+        """same as .load() but done by the session's IO threads\n
+        accessing the object before the load is finished will wait for it"""
+        with self.__ioLock:
+            self.waitIO()
+            if (self.__saveState is False) and (force is False):
+                return _doneFuture(None) # alredy loaded, nothing to do
+            self.__pendingIO = self.__session.submitIO(self.__loadNow, force)
+            return self.__pendingIO
+    
+    def __loadNow(self, force:bool)->None:
+        """internal function that do the load"""
         if (self.__saveState is False) and (force is False):
             return # alredy loaded, nothing to do
         # => (force is True) or (self.__saveState is True)
-        self.__value = self.__savingArgs.load(
-            self.__filePath, self.__type)
+        startTime:float = time.perf_counter()
+        self.__value = self.__session.storage.load(
+            self.__savingArgs, self.__filePath, self.__type)
+        self.__recordLoad(time.perf_counter() - startTime)
         self.__saveState = False
+        self.__session._registerResident(self)
     
     def save(self, force:bool=False)->None:
         """save the data to the disk if it wasn't saved"""
+        self.waitIO()
+        self.__saveNow(force)
+    
+    def saveAsync(self, force:bool=False)->"Future[None]":
+        """same as .save() but done by the session's IO threads\n
+        accessing the object before the save is finished will wait for it"""
+        with self.__ioLock:
+            self.waitIO()
+            if (self.__saveState is True) and (force is False):
+                return _doneFuture(None) # alredy saved, nothing to do
+            self.__pendingIO = self.__session.submitIO(self.__saveNow, force)
+            return self.__pendingIO
+    
+    def __saveNow(self, force:bool)->None:
+        """internal function that do the save (one at a time)"""
+        with self.__saveLock:
+            self.__saveNowLocked(force)
+    
+    def __saveNowLocked(self, force:bool)->None:
         if (self.__saveState is True) and (force is False):
-            return # alredy loaded, nothing to do
+            return # alredy saved, nothing to do
         # => (force is True) or (self.__saveState is False)
-        self.__savingArgs.save(self.__filePath, self.__value)
+        stats:"SessionStats|None" = self.__session.stats
+        rawSize:int = (0 if stats is None else self._residentSize())
+        startTime:float = time.perf_counter()
+        self.__session.storage.save(
+            self.__savingArgs, self.__filePath, self.__value)
+        if stats is not None:
+            stats._recordSave(
+                self.getSaveLib(), self.__compLib(), time.perf_counter() - startTime, rawSize,
+                diskSize=(self.__session.storage.fileSize(self.__filePath.as_posix()) or 0))
         self.__value = _unsetted
         self.__saveState = True
+        self.__session._unregisterResident(self)
+    
+    def _isStreamable(self)->bool:
+        """whether the value can be saved in a stream (see SaveArgs.dump(...))"""
+        return self.__savingArgs.isStreamable(self.__type)
+    
+    def _serialize(self)->"memoryview|None":
+        """the serialized value, to be written by a batch (see DictSaver.saveBatch(...)) \
+        then marked as saved with ._markSaved()\n
+        None when it is alredy saved or when its lib needs its own file (it is saved now in that case)"""
+        self.waitIO()
+        if self.__saveState is True:
+            return None # alredy saved, nothing to do
+        if self._isStreamable() is False:
+            self.__saveNow(force=False)
+            return None
+        stats:"SessionStats|None" = self.__session.stats
+        rawSize:int = (0 if stats is None else self._residentSize())
+        startTime:float = time.perf_counter()
+        buffer = io.BytesIO()
+        self.__savingArgs.dump(buffer, self.__value)
+        data:memoryview = buffer.getbuffer()
+        if stats is not None:
+            stats._recordSave(
+                self.getSaveLib(), self.__compLib(), time.perf_counter() - startTime,
+                rawSize, diskSize=data.nbytes)
+        return data
+    
+    def _markSaved(self)->None:
+        """release the value, its serialized data was written by a batch"""
+        self.__value = _unsetted
+        self.__saveState = True
+        self.__session._unregisterResident(self)
+    
+    def _deserialize(self, data:"bytes|memoryview")->None:
+        """set the value from the `data` readed by a batch (see DictSaver.loadBatch(...))\n
+        the budget of the session isn't enforced (the batch does it once at its end)"""
+        startTime:float = time.perf_counter()
+        self.__value = self.__savingArgs.loadFrom(io.BytesIO(data), self.__type)
+        self.__recordLoad(time.perf_counter() - startTime)
+        self.__saveState = False
+        self.__session._registerResident(self, enforce=False)
     
     def unLoad_noSave(self)->None:
         """release the object without saving it (but will get marked as saved)\\
         trust the user that it will be abble to retreive it with load"""
+        self.waitIO()
         self.__value = _unsetted
         self.__saveState = True
+        self.__session._unregisterResident(self)
     
     def clean(self, _force:bool=False)->bool:
         """clean the file on the disk (if it exist and object is loaded)\n
         return true if it deleted a file, false otherwise"""
+        self.waitIO()
         if (self.__saveState is False) or (_force is True):
-            if self.__filePath.exists() is True:
-                os.remove(self.__filePath)
-                return True
+            return self.__session.storage.remove(self.__filePath.as_posix())
         return False
     
     def __str__(self)->str:
@@ -784,35 +3298,361 @@ class ObjectSaver(Generic[_T_Savable]):
     
     def __enter__(self)->Self:
         self.load()
+        self.__pinned += 1
         return self
     def __exit__(self, *_)->None:
+        self.__pinned -= 1
         self.save()
     
     
     def __del__(self)->None:
         """force to clean the file and untrack the object of the session"""
+        self.__pendingIO = None # => it is done (it holds a ref to self otherwise)
+        self.__value = _unsetted # => release a mapped value before removing its file
         self.clean(_force=True)
         self.__session.untrack_object(self)
 
     def fileSize(self)->"int|None":
         """when saved return the size of the file, when not saved return None"""
+        self.waitIO()
         if self.__saveState is True:
             # => is saved
-            return os.path.getsize(self.filePath)
+            return self.__session.storage.fileSize(self.__filePath.as_posix())
         # => not saved
         return None
     
     def getSaveLib(self)->"_SaveLib":
         return self.__savingArgs.getSaveLib(self.__type)
     
+    def getCompressionTuple(self)->"_CompressionTuple|None":
+        return self.__savingArgs.getCompressionTuple(self.__type, useLib=self.getSaveLib())
+    
+    def verify(self)->None:
+        """verify the checksum of the saved data (read all of it, even when the saving args `trust`)\n
+        raise a ValueError when it is corrupted, do nothing when it isn't saved or has no checksum"""
+        self.waitIO()
+        if self.__saveState is False:
+            return None
+        (filePaths, offset, size) = self.__session.storage._locate(self.__filePath.as_posix())
+        if (offset == 0) and (size is None):
+            self.__savingArgs._verifyFile(Path(filePaths[0]), full=True)
+            return None
+        # => a blob inside a larger file
+        with open(filePaths[0], mode="rb") as file:
+            file.seek(offset)
+            data:bytes = file.read(size)
+        self.__savingArgs._checkedPayload(io.BytesIO(data), bounded=False, verify=True)
+    
+    def share(self)->"SharedObjectHandle[_T_Savable]":
+        """save the value (if needed) and return a light handle to its saved data\n
+        the handle can be sent to other processes (ie. the workers of a ProcessManager) \
+        that open it themselves (see SharedObjectHandle.open()), the value is never pickled\n
+        the handle stays valid while the object isn't modified, re-saved or removed"""
+        self.save()
+        (filePaths, offset, size) = self.__session.storage._locate(self.__filePath.as_posix())
+        return SharedObjectHandle(
+            filePaths=filePaths, offset=offset, size=size, objectType=self.__type,
+            saveLib=self.getSaveLib(), savingArgs=self.__savingArgs)
+    
+    def __compLib(self)->"_CompressionLib|None":
+        """the compLib really used (the compression of NEVER_COMPRESSED_SaveLibs is ignored)"""
+        compTuple = self.getCompressionTuple()
+        return (None if compTuple is None else compTuple[0])
+    
+    def __recordLoad(self, latency:float)->None:
+        stats:"SessionStats|None" = self.__session.stats
+        if stats is not None:
+            stats._recordLoad(self.getSaveLib(), self.__compLib(), latency)
+    
+    @classmethod
+    def _reopen(cls, session:"Session", fileName:str, objectType:"type[_T_Savable]")->"ObjectSaver[_T_Savable]":
+        """recreate the (saved) ObjectSaver of an object of a reopened session (see Session.reopen(...))"""
+        objSaver = cls.__new__(cls)
+        objSaver.__value = _unsetted
+        objSaver.__type = objectType
+        objSaver.__saveState = True
+        objSaver.__pinned = 0
+        objSaver.__pendingIO = None
+        objSaver.__ioLock = threading.Lock()
+        objSaver.__saveLock = threading.Lock()
+        objSaver.__session = session
+        objSaver.__filePath = session.directory.joinpath(fileName)
+        objSaver.__savingArgs = session.savingArgs
+        session.track_object(objSaver)
+        return objSaver
+    
+
+class SharedObjectHandle(Generic[_T_Savable], PrettyfyClass):
+    """a light (picklable) handle to the saved data of an ObjectSaver (see ObjectSaver.share())\n
+    it is opened without its session, from any process of the same machine"""
+    __slots__ = ("filePaths", "offset", "size", "objectType", "saveLib", "savingArgs", )
+    
+    def __init__(self, filePaths:"list[str]", offset:int, size:"int|None", 
+            objectType:"type[_T_Savable]", saveLib:"_SaveLib", savingArgs:"SaveArgs")->None:
+        self.filePaths:"list[str]" = filePaths
+        """the files that might hold the data (by order of preference)"""
+        self.offset:int = offset
+        self.size:"int|None" = size
+        """the size of the data (None -> up to the end of the file)"""
+        self.objectType:"type[_T_Savable]" = objectType
+        self.saveLib:"_SaveLib" = saveLib
+        self.savingArgs:"SaveArgs" = savingArgs
+    
+    def open(self)->"_T_Savable":
+        """load the value from the saved data\n
+        with the libs "numpy-mmap" and "pickle5" the data is mapped read-only \
+        (all the processes share the same pages), otherwise it is a private copy"""
+        lastError:"FileNotFoundError|None" = None
+        for filePath in self.filePaths:
+            try: return self.__openFile(filePath)
+            except FileNotFoundError as err:
+                lastError = err # => moved meanwhile, try the next one
+        raise FileNotFoundError(f"the shared object isn't in any of: {self.filePaths}") from lastError
+    
+    def __openFile(self, filePath:str)->"_T_Savable":
+        if (self.offset != 0) or (self.size is not None):
+            # => a blob inside a larger file
+            with open(filePath, mode="rb") as file:
+                file.seek(self.offset)
+                data:bytes = file.read(self.size)
+            return self.savingArgs.loadFrom(io.BytesIO(data), self.objectType, useLib=self.saveLib)
+        if self.saveLib == "pickle5":
+            self.savingArgs._verifyFile(Path(filePath), full=False)
+            obj = _loadPickle5(Path(filePath), readOnly=True)
+            assert isinstance(obj, self.objectType), \
+                TypeError(f"the readed object is of type: {type(obj)} "
+                          f"but expected an object of type: {self.objectType}")
+            return obj
+        # => "numpy-mmap" is alredy mapped read-only
+        return self.savingArgs.load(Path(filePath), self.objectType)
+    
+
+### ArraySaver definition
+
+class ArraySaver():
+    """an array saved in chunks of rows (along its first axis), each chunk is compressed on its own\n
+    the array is saved when the ArraySaver is created, then:\n
+     - saver[start:stop] (or saver[index], saver[start:stop, ...]) only reads \
+        and decompress the chunks it touches\n
+     - the last readed chunks are kept in a small cache (see `cacheSize`)\n
+    this give a random access to arrays that don't fit in the memory\n
+    the chunks are saved by the storage of the session (not listed in its manifest)"""
+    _Filename_prefix = "__SaveModuleArray_"
+    __slots__ = (
+        "__session", "__filePath", "__shape", "__dtype", "__chunkRows", 
+        "__nbChunks", "__compTuple", "__savingArgs", "__cacheSize", "__cache", "__cacheLock", "__weakref__", )
+    
+    def __init__(self, 
+            value:"numpy.ndarray", session:"Session|None"=None,
+            chunkSize:int=ARRAY_CHUNK_SIZE, 
+            compression:"_CompressionTuple|None"=ARRAY_CHUNK_COMPRESSION,
+            cacheSize:int=ARRAY_CHUNK_CACHE_SIZE)->None:
+        """`chunkSize` is the (uncompressed) size in bytes targeted for the chunks (at least one row)\n
+        `compression` is how each chunk is compressed (None -> not compressed)\n
+        `cacheSize` is the number of decompressed chunks kept in memory"""
+        import numpy
+        if value.ndim == 0:
+            raise ValueError(f"an ArraySaver needs an array with at least one dimension")
+        if value.dtype.hasobject:
+            raise ValueError(f"an ArraySaver can't save arrays of objects (dtype: {value.dtype})")
+        if compression is not None:
+            SaveArgs._assert_allowed_compLib("numpy", compression[0])
+        self.__session:"Session" = (Session.get_topSession() if session is None else session)
+        self.__filePath:Path = self.__session.directory.joinpath(
+            f"{self._Filename_prefix}{self.__session.allocate_unique_id()}")
+        self.__shape:"tuple[int, ...]" = tuple(value.shape)
+        self.__dtype:"numpy.dtype" = value.dtype
+        rowSize:int = max(1, value.dtype.itemsize * math.prod(self.__shape[1: ]))
+        self.__chunkRows:int = max(1, chunkSize // rowSize)
+        self.__nbChunks:int = -(-self.__shape[0] // self.__chunkRows)
+        self.__compTuple:"_CompressionTuple|None" = compression
+        self.__savingArgs:"SaveArgs" = self.__session.savingArgs
+        """its checksum (and trust) is used for the chunks"""
+        self.__cacheSize:int = cacheSize
+        self.__cache:"OrderedDict[int, numpy.ndarray]" = OrderedDict()
+        self.__cacheLock = threading.Lock()
+        # save the chunks (tracked first => they are cleaned if it fails)
+        self.__session.track_object(self)
+        checksum:"_ChecksumAlgo|None" = self.__savingArgs.checksum
+        for chunkIndex in range(self.__nbChunks):
+            chunk = numpy.ascontiguousarray(
+                value[chunkIndex * self.__chunkRows: (chunkIndex + 1) * self.__chunkRows])
+            data:bytes = _compressBuffer(chunk.data.cast("B"), compression, typeSize=value.dtype.itemsize)
+            if checksum is not None:
+                checksummer = _Checksummer(checksum)
+                checksummer.update(data)
+                data += checksummer.footer()
+            self.__session.storage._writeBlob(self.__chunkFile(chunkIndex), data)
+    
+    @property
+    def shape(self)->"tuple[int, ...]":
+        return self.__shape
+    
+    @property
+    def dtype(self)->"numpy.dtype":
+        return self.__dtype
+    
+    @property
+    def chunkRows(self)->int:
+        """the number of rows per chunk (the last one might be smaller)"""
+        return self.__chunkRows
+    
+    @property
+    def nbChunks(self)->int:
+        return self.__nbChunks
+    
+    @property
+    def filePath(self)->Path:
+        """the base path of the chunks files"""
+        return self.__filePath
+    
+    @property
+    def value(self)->"numpy.ndarray":
+        """the full array (read all the chunks)"""
+        return self[:]
+    
+    def __len__(self)->int:
+        return self.__shape[0]
+    
+    def isSaved(self)->bool:
+        return True # => the array is only in the chunks
+    
+    def __chunkFile(self, chunkIndex:int)->str:
+        return f"{self.__filePath.as_posix()}_{chunkIndex}"
+    
+    def _storedFiles(self)->"list[str]":
+        """the files (of the storage) used to save the chunks"""
+        return [self.__chunkFile(chunkIndex) for chunkIndex in range(self.__nbChunks)]
+    
+    def __getChunk(self, chunkIndex:int)->"numpy.ndarray":
+        """the decompressed chunk (from the cache when possible)"""
+        with self.__cacheLock:
+            chunk:"numpy.ndarray|None" = self.__cache.get(chunkIndex, None)
+            if chunk is not None:
+                self.__cache.move_to_end(chunkIndex)
+                return chunk
+        # => read it outside of the lock (other chunks can be readed meanwhile)
+        import numpy
+        blob:bytes = self.__session.storage._readBlob(self.__chunkFile(chunkIndex))
+        data:bytes = _decompressBuffer(
+            self.__savingArgs._checkedPayload(io.BytesIO(blob)).read(),
+            (None if self.__compTuple is None else self.__compTuple[0]))
+        chunk = numpy.frombuffer(data, dtype=self.__dtype).reshape((-1, ) + self.__shape[1: ])
+        # => read-only (the chunk is shared by the cache)
+        with self.__cacheLock:
+            if self.__cacheSize > 0:
+                self.__cache[chunkIndex] = chunk
+                while len(self.__cache) > self.__cacheSize:
+                    self.__cache.popitem(last=False)
+        return chunk
+    
+    def __readRows(self, rows:range)->"numpy.ndarray":
+        """read the `rows`, only the touched chunks are readed"""
+        import numpy
+        result = numpy.empty((len(rows), ) + self.__shape[1: ], dtype=self.__dtype)
+        position:int = 0
+        while position < len(rows):
+            row:int = rows[position]
+            chunkIndex:int = row // self.__chunkRows
+            chunkStart:int = chunkIndex * self.__chunkRows
+            # => the number of following rows inside the chunk
+            nbRows:int
+            if rows.step > 0:
+                nbRows = -(-(chunkStart + self.__chunkRows - row) // rows.step)
+            else: nbRows = -(-(row - chunkStart + 1) // -rows.step)
+            nbRows = min(nbRows, len(rows) - position)
+            chunk = self.__getChunk(chunkIndex)
+            result[position: position + nbRows] = \
+                chunk[row - chunkStart: : rows.step][: nbRows]
+            position += nbRows
+        return result
+    
+    def __getitem__(self, key:"int|slice|tuple[int|slice, Any]")->"numpy.ndarray":
+        """only the first axis is readed partialy, the other indexes are applied on the result"""
+        otherKeys:"tuple[Any, ...]" = ()
+        if isinstance(key, tuple):
+            if len(key) == 0:
+                return self[:]
+            (key, otherKeys) = (key[0], key[1: ])
+        if isinstance(key, slice):
+            result = self.__readRows(range(*key.indices(self.__shape[0])))
+            return (result[(slice(None), ) + otherKeys] if len(otherKeys) != 0 else result)
+        # => single row
+        index:int = int(key) # also support the numpy integers
+        if index < 0:
+            index += self.__shape[0]
+        if not (0 <= index < self.__shape[0]):
+            raise IndexError(f"index {key} is out of bounds for the axis 0 with size {self.__shape[0]}")
+        result = self.__readRows(range(index, index + 1))[0]
+        return (result[otherKeys] if len(otherKeys) != 0 else result)
+    
+    def clearCache(self)->None:
+        """release the decompressed chunks kept in the cache"""
+        with self.__cacheLock:
+            self.__cache.clear()
+    
+    def fileSize(self)->int:
+        """the total size of the (compressed) chunks"""
+        storage:"_Storage" = self.__session.storage
+        return sum((storage.fileSize(chunkFile) or 0) for chunkFile in self._storedFiles())
+    
+    def __str__(self)->str:
+        return f"{self.__class__}(shape={self.__shape}, dtype={self.__dtype}, nbChunks={self.__nbChunks})"
+    
 
 ### DictSaver definition
 
+class ManifestEntry(PrettyfyClass):
+    """an entry of a persisted DictSaver in the manifest of its session (see Session.checkpoint())"""
+    __slots__ = ("key", "fileName", "objectType", "saveLib", "compTuple", "size", "checksum", )
+    
+    def __init__(self, key:object, fileName:str, objectType:type, saveLib:"_SaveLib",
+            compTuple:"_CompressionTuple|None", size:int, checksum:str)->None:
+        self.key:object = key
+        self.fileName:str = fileName
+        """the name of the file of its ObjectSaver (in the session's directory)"""
+        self.objectType:type = objectType
+        self.saveLib:"_SaveLib" = saveLib
+        self.compTuple:"_CompressionTuple|None" = compTuple
+        self.size:int = size
+        """the size on the disk"""
+        self.checksum:str = checksum
+        """the hash of what is stored (see _Storage.checksum(...))"""
+
+class BatchReport(PrettyfyClass):
+    """the aggregated timings of a DictSaver.saveBatch(...) | .loadBatch(...)"""
+    __slots__ = ("nbObjects", "nbBatched", "nbBytes", "ioTime", "codecTime", "totalTime", )
+    
+    def __init__(self, nbObjects:int)->None:
+        self.nbObjects:int = nbObjects
+        """the number of objects that were saved | loaded"""
+        self.nbBatched:int = 0
+        """the number of objects that were written | readed in the sequential pass \
+        (the others are saved | loaded in their own file by the threads)"""
+        self.nbBytes:int = 0
+        """the serialized size of the batched objects"""
+        self.ioTime:float = 0.0
+        """the time of the sequential pass (in sec)"""
+        self.codecTime:float = 0.0
+        """the sum of the time the threads spent to (de)serialize the objects (in sec)"""
+        self.totalTime:float = 0.0
+        """the time of the whole batch (in sec)"""
+    
+    @property
+    def throughput(self)->float:
+        """in Mo/sec (of serialized size)"""
+        return self.nbBytes / 2**20 / max(1e-9, self.totalTime)
+
 
 class DictSaver(MutableMapping, Generic[_KT, _T_Savable]):
-    def __init__(self, __map:"MutableMapping[_KT, _T_Savable]", session:"Session|None"=None)->None:
+    def __init__(self, __map:"MutableMapping[_KT, _T_Savable]", 
+            session:"Session|None"=None, name:"str|None"=None)->None:
+        """`name` -> str: persist the dict with its session (it must be persistent)"""
         self.__map:"MutableMapping[_KT, ObjectSaver[_T_Savable]]" = {}
         self.__session:Session = (Session.get_topSession() if session is None else session)
+        self.name:"str|None" = name
+        if name is not None:
+            self.__session._registerDictSaver(name, self)
         
         for (key, value) in __map.items():
             self.__setitem__(key, value)
@@ -897,7 +3737,140 @@ class DictSaver(MutableMapping, Generic[_KT, _T_Savable]):
             _keys = self.__map.keys()
         for key in _keys:
             self.__map[key].load()
+    
+    def saveBatch(self, *__keys:"_KT", nbWorkers:"int|None"=None)->"BatchReport":
+        """same as .save(...) but the values are serialized in parallel by `nbWorkers` threads \
+        (None -> default of ThreadPoolExecutor), and the calling thread write them \
+        in a sequential pass (by groups of BATCH_WRITE_SIZE bytes)\n
+        the values whose lib needs its own file are saved by the threads\n
+        return the timings of the batch"""
+        startTime:float = time.perf_counter()
+        _keys:"Iterable[_KT]" = (self.__map.keys() if len(__keys) == 0 else __keys)
+        objSavers:"list[ObjectSaver[_T_Savable]]" = [self.__map[key] for key in _keys]
+        report = BatchReport(nbObjects=len(objSavers))
+        storage:"_Storage" = self.__session.storage
+        pending:"list[tuple[ObjectSaver[_T_Savable], memoryview]]" = []
+        pendingBytes:int = 0
+        
+        def serialize(objSaver:"ObjectSaver[_T_Savable]")->"tuple[memoryview|None, float]":
+            serializeStart:float = time.perf_counter()
+            data = objSaver._serialize()
+            return (data, time.perf_counter() - serializeStart)
+        
+        def writePending()->None:
+            writeStart:float = time.perf_counter()
+            storage._writeBlobs([(objSaver.filePath.as_posix(), data) for (objSaver, data) in pending])
+            for (objSaver, _) in pending:
+                objSaver._markSaved()
+            pending.clear()
+            report.ioTime += time.perf_counter() - writeStart
+        
+        with ThreadPoolExecutor(max_workers=nbWorkers, thread_name_prefix="SaveModuleBatch") as executor:
+            futures:"dict[Future[tuple[memoryview|None, float]], ObjectSaver[_T_Savable]]" = {
+                executor.submit(serialize, objSaver): objSaver for objSaver in objSavers}
+            for future in as_completed(futures):
+                (data, serializeTime) = future.result()
+                report.codecTime += serializeTime
+                if data is None:
+                    continue # => alredy saved
+                pending.append((futures[future], data))
+                report.nbBatched += 1
+                report.nbBytes += data.nbytes
+                pendingBytes += data.nbytes
+                if pendingBytes >= BATCH_WRITE_SIZE:
+                    writePending()
+                    pendingBytes = 0
+            writePending()
+        report.totalTime = time.perf_counter() - startTime
+        return report
+    
+    def loadBatch(self, *__keys:"_KT", nbWorkers:"int|None"=None)->"BatchReport":
+        """same as .load(...) but the calling thread read the saved values in a sequential pass \
+        (in the order of the storage) and they are deserialized in parallel by `nbWorkers` threads \
+        (None -> default of ThreadPoolExecutor)\n
+        the values whose lib needs its own file are loaded by the threads\n
+        the budget of the session is enforced once the batch is finished (by the calling thread)\n
+        return the timings of the batch"""
+        startTime:float = time.perf_counter()
+        _keys:"Iterable[_KT]" = (self.__map.keys() if len(__keys) == 0 else __keys)
+        objSavers:"list[ObjectSaver[_T_Savable]]" = [self.__map[key] for key in _keys]
+        report = BatchReport(nbObjects=len(objSavers))
+        batched:"dict[str, ObjectSaver[_T_Savable]]" = {}
+        
+        def deserialize(objSaver:"ObjectSaver[_T_Savable]", data:"bytes|None")->float:
+            deserializeStart:float = time.perf_counter()
+            if data is None: 
+                objSaver.load()
+            else: objSaver._deserialize(data)
+            return time.perf_counter() - deserializeStart
+        
+        with ThreadPoolExecutor(max_workers=nbWorkers, thread_name_prefix="SaveModuleBatch") as executor:
+            futures:"list[Future[float]]" = []
+            for objSaver in objSavers:
+                objSaver.waitIO()
+                if objSaver.isSaved() is False:
+                    continue # alredy loaded, nothing to do
+                if objSaver._isStreamable() is False:
+                    futures.append(executor.submit(deserialize, objSaver, None))
+                else: batched[objSaver.filePath.as_posix()] = objSaver
+            readStart:float = time.perf_counter()
+            for (fileStrPath, data) in self.__session.storage._iterBlobs(list(batched)):
+                report.nbBatched += 1
+                report.nbBytes += len(data)
+                futures.append(executor.submit(deserialize, batched[fileStrPath], data))
+            report.ioTime = time.perf_counter() - readStart
+            for future in as_completed(futures):
+                report.codecTime += future.result()
+        self.__session.enforceBudget()
+        report.totalTime = time.perf_counter() - startTime
+        return report
+    
+    def prefetch(self, *__keys:"_KT")->"list[Future[None]]":
+        """call .loadAsync() on the ObjectSaver at the given keys\n
+        when empty prefetch all\n
+        return the futures of the loads (in the same order as the keys)"""
+        _keys:"Iterable[_KT]" = __keys
+        if len(__keys) == 0:
+            # => all keys
+            _keys = self.__map.keys()
+        return [self.__map[key].loadAsync() for key in _keys]
+    
+    def share(self, *__keys:"_KT")->"dict[_KT, SharedObjectHandle[_T_Savable]]":
+        """call .share() on the ObjectSaver at the given keys\n
+        when empty share all\n
+        return the handles of the objects (they can be sent to other processes)"""
+        _keys:"Iterable[_KT]" = __keys
+        if len(__keys) == 0:
+            # => all keys
+            _keys = self.__map.keys()
+        return {key: self.__map[key].share() for key in _keys}
 
+    def _objectSavers(self)->"list[ObjectSaver[_T_Savable]]":
+        return list(self.__map.values())
+    
+    def _manifestEntries(self)->"list[ManifestEntry]":
+        """the entries of the (saved) values for the manifest of the session"""
+        storage:"_Storage" = self.__session.storage
+        entries:"list[ManifestEntry]" = []
+        for (key, objSaver) in self.__map.items():
+            fileStrPath:str = objSaver.filePath.as_posix()
+            size:"int|None" = objSaver.fileSize()
+            if size is None:
+                continue # => not saved
+            entries.append(ManifestEntry(
+                key=key, fileName=objSaver.filePath.name, objectType=objSaver.valueType,
+                saveLib=objSaver.getSaveLib(), compTuple=objSaver.getCompressionTuple(),
+                size=size, checksum=storage.checksum(fileStrPath)))
+        return entries
+    
+    @classmethod
+    def _reopen(cls, session:"Session", name:str, entries:"list[ManifestEntry]")->"DictSaver":
+        """recreate a persisted DictSaver from its entries, without loading them"""
+        dictSaver:"DictSaver" = cls({}, session=session, name=name)
+        for entry in entries:
+            dictSaver.__map[entry.key] = ObjectSaver._reopen(session, entry.fileName, entry.objectType)
+        return dictSaver
+    
     def getAllFileSize(self)->"dict[_KT, int]":
         """return the size of all the objects that are saved"""
         result:"dict[_KT, int]" = {}
@@ -0,0 +1,25 @@
+import contextlib
+import io
+
+import numpy
+
+from holo.ramDiskSave import Session, DictSaver, SaveArgs
+
+
+def test_loadBatch_respects_the_budget_without_racing()->None:
+    """the parallel deserializations of DictSaver.loadBatch(...) must not spill the same objects"""
+    for _ in range(5):
+        session = Session(maxResidentBytes=1_600_000,
+                          savingArgs=SaveArgs(methode="pickle|numpy|pandas"))
+        with session:
+            dictSaver = DictSaver({index: numpy.full(100_000, index, dtype=numpy.float64)
+                                   for index in range(60)}, session=session)
+            dictSaver.save()
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                dictSaver.loadBatch(nbWorkers=16)
+            assert "failed to save" not in output.getvalue()
+            assert session.residentBytes <= session.maxResidentBytes # type: ignore
+            for index in range(60):
+                assert (dictSaver[index] == index).all()
+            del dictSaver